@@ -0,0 +1,45 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compares reading the configuration before setup by parsing the files every
+time with reading it through the process-level cache.
+"""
+
+import logging
+import timeit
+from spinn_front_end_common.interface.config_handler import ConfigHandler
+from spinn_front_end_common.utilities import globals_variables
+from spinnaker_graph_front_end.spinnaker import CONFIG_FILE_NAME, SpiNNaker
+
+N_ACCESSES = 100
+
+
+def parse_every_time():
+    return ConfigHandler(
+        CONFIG_FILE_NAME, [SpiNNaker.extended_config_path()], []).config
+
+
+def cached():
+    return globals_variables.get_simulator().config
+
+
+if __name__ == '__main__':
+    # Reading config before setup warns on every access
+    logging.getLogger("spinnaker_graph_front_end").setLevel(logging.ERROR)
+    for name, function in (("parsed", parse_every_time), ("cached", cached)):
+        seconds = timeit.timeit(function, number=N_ACCESSES)
+        print("{}: {:.3f} ms per access".format(
+            name, seconds * 1000 / N_ACCESSES))
@@ -0,0 +1,98 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compares the routing tables of a Conway's Game of Life grid, placed by the
+locality placer, when its keys are allocated by the malloc-based allocator
+and by the grid allocator: the number of routing entries in all the tables,
+and in the biggest table, after the tables are compressed as much as they
+can be. Compression cannot leave fewer entries in a table than there are
+different routes in it, so that is shown too.
+
+Run as ``python -m gfe_benchmarks.grid_key_allocation [size] [shuffled]``;
+with ``shuffled``, the cells are added to the graph in a random order rather
+than column by column.
+"""
+
+import random
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import MachineGraph
+from pacman.operations.router_algorithms import NerRoute
+from pacman.operations.router_compressors import PairCompressor
+from pacman.operations.routing_info_allocator_algorithms import (
+    MallocBasedRoutingInfoAllocator)
+from pacman.operations.routing_table_generators import (
+    BasicRoutingTableGenerator)
+from spinn_front_end_common.interface.interface_functions import (
+    EdgeToNKeysMapper)
+from spinnaker_graph_front_end.extra_algorithms import (
+    GridRoutingInfoAllocator, LocalityPlacer)
+from gfe_benchmarks.locality_placement import conways_graph
+
+GRID_SIZE = 100
+
+
+def shuffled(graph, seed=0):
+    vertices = list(graph.vertices)
+    random.Random(seed).shuffle(vertices)
+    shuffled_graph = MachineGraph(graph.label)
+    for vertex in vertices:
+        shuffled_graph.add_vertex(vertex)
+    for partition in graph.outgoing_edge_partitions:
+        for edge in partition.edges:
+            shuffled_graph.add_edge(edge, partition.identifier)
+    return shuffled_graph
+
+
+def measure(allocator, graph, machine, placements, routes):
+    n_keys_map = EdgeToNKeysMapper()(graph)
+    start = time.perf_counter()
+    if isinstance(allocator, GridRoutingInfoAllocator):
+        routing_infos = allocator(graph, n_keys_map, machine)
+    else:
+        routing_infos = allocator(graph, n_keys_map)
+    seconds = time.perf_counter() - start
+    tables = BasicRoutingTableGenerator()(routing_infos, routes, machine)
+    n_routes = sum(
+        len({entry.spinnaker_route
+             for entry in table.multicast_routing_entries})
+        for table in tables.routing_tables)
+    compressed = PairCompressor()(tables)
+    sizes = [table.number_of_entries for table in compressed.routing_tables]
+    return seconds, sum(sizes), max(sizes, default=0), n_routes
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else GRID_SIZE
+    graph = conways_graph(size)
+    if "shuffled" in sys.argv[2:]:
+        graph = shuffled(graph)
+    # Big enough for a 100x100 grid at 16 cells a chip
+    machine = virtual_machine(width=48, height=48)
+    placements = LocalityPlacer()(graph, machine, 100)
+    routes = NerRoute()(graph, machine, placements)
+    print("{0}x{0} grid, {1} vertices".format(size, graph.n_vertices))
+    for name, allocator in (
+            ("MallocBasedRoutingInfoAllocator",
+             MallocBasedRoutingInfoAllocator()),
+            ("GridRoutingInfoAllocator", GridRoutingInfoAllocator())):
+        seconds, n_entries, most_entries, n_routes = measure(
+            allocator, graph, machine, placements, routes)
+        print("{:>31}: {:.2f}s to allocate; {} routing entries after "
+              "compression, at most {} in a table; no fewer than {} "
+              "possible".format(
+                  name, seconds, n_entries, most_entries, n_routes))
@@ -0,0 +1,52 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measures how many events per second the host can send into a live input and
+receive back from a live packet gatherer, with a local SCP emulator
+reflecting the events in place of a board, so that only the host side is
+measured.
+"""
+
+import time
+import numpy
+from spinnaker_graph_front_end.testing import SCPEmulator
+from spinnaker_graph_front_end.utilities import (
+    EventInjector, RingBufferReceiver)
+
+N_EVENTS = 1000000
+TAG = 1
+
+
+if __name__ == '__main__':
+    keys = numpy.arange(N_EVENTS, dtype="<u4")
+    with SCPEmulator() as board, \
+            RingBufferReceiver(capacity=N_EVENTS) as receiver, \
+            EventInjector(0, 0, 1, "127.0.0.1", board.port) as injector:
+        board.set_ip_tag(TAG, "127.0.0.1", receiver.local_port)
+        board.reflect(0, 0, 1, TAG)
+        start = time.perf_counter()
+        n_messages = injector.inject_array(keys)
+        # Wait until everything is back, or nothing more arrives (as UDP
+        # may drop datagrams when the receiver falls behind)
+        received = -1
+        while received < receiver.ring.n_available < N_EVENTS:
+            received = receiver.ring.n_available
+            time.sleep(0.1)
+        seconds = time.perf_counter() - start
+        received = receiver.ring.n_available
+    print("{} messages; {} of {} events back; {:.2f} million events per "
+          "second".format(n_messages, received, N_EVENTS,
+                          received / seconds / 1e6))
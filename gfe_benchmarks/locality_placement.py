@@ -0,0 +1,105 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compares the routing that a Conway's Game of Life grid needs when placed by
+the radial placer and by the locality placer: the number of routing entries
+in all the routing tables, and the most routes that share a single link.
+"""
+
+from collections import Counter
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.resources import ResourceContainer
+from pacman.operations.placer_algorithms import RadialPlacer
+from pacman.operations.router_algorithms import NerRoute
+from pacman.operations.routing_info_allocator_algorithms import (
+    MallocBasedRoutingInfoAllocator)
+from pacman.operations.routing_table_generators import (
+    BasicRoutingTableGenerator)
+from spinn_front_end_common.interface.interface_functions import (
+    EdgeToNKeysMapper)
+from spinnaker_graph_front_end.extra_algorithms import LocalityPlacer
+from spinnaker_graph_front_end.utilities import AbstractHasGridPosition
+
+GRID_SIZE = 48
+PARTITION_ID = "STATE"
+
+
+class GridCell(SimpleMachineVertex, AbstractHasGridPosition):
+    """ A cell of the grid, which tells its neighbours its state.
+    """
+
+    def __init__(self, x, y):
+        super().__init__(ResourceContainer(), "cell{}-{}".format(x, y))
+        self._position = (x, y)
+
+    @property
+    def grid_position(self):
+        return self._position
+
+
+def conways_graph(size):
+    graph = MachineGraph("Conway's grid")
+    cells = [[GridCell(x, y) for y in range(size)] for x in range(size)]
+    for column in cells:
+        for cell in column:
+            graph.add_vertex(cell)
+    for x in range(size):
+        for y in range(size):
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    if dx or dy:
+                        graph.add_edge(MachineEdge(
+                            cells[x][y],
+                            cells[(x + dx) % size][(y + dy) % size]),
+                            PARTITION_ID)
+    return graph
+
+
+def measure(placer, graph, machine):
+    start = time.perf_counter()
+    placements = placer(graph, machine, 100)
+    seconds = time.perf_counter() - start
+    routes = NerRoute()(graph, machine, placements)
+    routing_infos = MallocBasedRoutingInfoAllocator()(
+        graph, EdgeToNKeysMapper()(graph))
+    tables = BasicRoutingTableGenerator()(routing_infos, routes, machine)
+    n_entries = sum(
+        table.number_of_entries for table in tables.routing_tables)
+    link_load = Counter()
+    for x, y in routes.get_routers():
+        for entry in routes.get_entries_for_router(x, y).values():
+            for link in entry.link_ids:
+                link_load[x, y, link] += 1
+    n_chips = len({(p.x, p.y) for p in placements.placements})
+    return seconds, n_chips, n_entries, max(link_load.values(), default=0)
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else GRID_SIZE
+    graph = conways_graph(size)
+    machine = virtual_machine(width=24, height=24)
+    print("{0}x{0} grid, {1} vertices".format(size, graph.n_vertices))
+    for name, placer in (("RadialPlacer", RadialPlacer()),
+                         ("LocalityPlacer", LocalityPlacer())):
+        seconds, n_chips, n_entries, max_load = measure(
+            placer, graph, machine)
+        print("{:>15}: {:.2f}s to place on {} chips; {} routing entries; "
+              "at most {} routes on a link".format(
+                  name, seconds, n_chips, n_entries, max_load))
@@ -0,0 +1,100 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compares the time taken to map a big ring of vertices, each sending to the
+next few around the ring, with the algorithms of the default mapping profile
+and with those of the fast one, step by step.
+"""
+
+import math
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.resources import ResourceContainer
+from pacman.operations.placer_algorithms import RadialPlacer
+from pacman.operations.router_algorithms import NerRoute
+from pacman.operations.routing_info_allocator_algorithms import (
+    MallocBasedRoutingInfoAllocator, ZonedRoutingInfoAllocator)
+from pacman.operations.routing_table_generators import (
+    BasicRoutingTableGenerator)
+from spinn_front_end_common.interface.interface_functions import (
+    EdgeToNKeysMapper)
+from spinnaker_graph_front_end.extra_algorithms import SequentialPlacer
+
+N_VERTICES = 100000
+FAN_OUT = 4
+PARTITION_ID = "RING"
+
+
+def ring_graph(n_vertices, fan_out):
+    graph = MachineGraph("ring")
+    vertices = [SimpleMachineVertex(ResourceContainer())
+                for _ in range(n_vertices)]
+    for vertex in vertices:
+        graph.add_vertex(vertex)
+    for i, vertex in enumerate(vertices):
+        for step in range(1, fan_out + 1):
+            graph.add_edge(MachineEdge(
+                vertex, vertices[(i + step) % n_vertices]), PARTITION_ID)
+    return graph
+
+
+def machine_for(n_vertices):
+    # Room for 16 vertices a chip, in whole boards
+    side = int(math.ceil(math.sqrt(n_vertices / 16) / 12)) * 12
+    return virtual_machine(width=side, height=side)
+
+
+def map_graph(graph, machine, placer, allocator):
+    steps = list()
+    start = time.perf_counter()
+
+    def step(name):
+        nonlocal start
+        now = time.perf_counter()
+        steps.append((name, now - start))
+        start = now
+
+    placements = placer(graph, machine, 100)
+    step("place")
+    routes = NerRoute()(graph, machine, placements)
+    step("route")
+    routing_infos = allocator(graph, EdgeToNKeysMapper()(graph))
+    step("allocate keys")
+    BasicRoutingTableGenerator()(routing_infos, routes, machine)
+    step("generate tables")
+    return steps
+
+
+if __name__ == '__main__':
+    n_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else N_VERTICES
+    graph = ring_graph(n_vertices, FAN_OUT)
+    machine = machine_for(n_vertices)
+    print("{} vertices, {} edges, on {}x{} chips".format(
+        graph.n_vertices, graph.n_outgoing_edge_partitions * FAN_OUT,
+        machine.max_chip_x + 1, machine.max_chip_y + 1))
+    for name, placer, allocator in (
+            ("default", RadialPlacer(), MallocBasedRoutingInfoAllocator()),
+            ("fast", SequentialPlacer(),
+             lambda graph, n_keys_map: ZonedRoutingInfoAllocator()(
+                 graph, n_keys_map, True))):
+        steps = map_graph(graph, machine, placer, allocator)
+        print("{:>8}: {:.2f}s ({})".format(
+            name, sum(seconds for _, seconds in steps),
+            ", ".join("{} {:.2f}s".format(step, seconds)
+                      for step, seconds in steps)))
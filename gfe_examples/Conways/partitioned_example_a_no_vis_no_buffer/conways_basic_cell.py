@@ -16,19 +16,15 @@
 from enum import IntEnum
 from spinn_utilities.overrides import overrides
 from pacman.executor.injection_decorator import inject_items
-from pacman.model.graphs.machine import MachineVertex
-from pacman.model.resources import ResourceContainer, VariableSDRAM
-from pacman.utilities.utility_calls import is_single
-from spinn_front_end_common.utilities.constants import (
-    SYSTEM_BYTES_REQUIREMENT, BYTES_PER_WORD)
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement, n_word_struct)
 from spinn_front_end_common.abstract_models.impl import (
     MachineDataSpecableVertex)
-from spinnaker_graph_front_end.utilities import SimulatorVertex
-from spinnaker_graph_front_end.utilities.data_utils import (
-    generate_system_data_region)
+from spinnaker_graph_front_end.utilities import (
+    AbstractHasGraphInvariants, GraphInvariants, Region, RegionLayout,
+    RegionLayoutVertex, system_region)
 
 
 # Regions for populations
@@ -40,12 +36,18 @@ class DataRegions(IntEnum):
     RESULTS = 4
 
 
-class ConwayBasicCell(SimulatorVertex, MachineDataSpecableVertex):
+class ConwayBasicCell(
+        RegionLayoutVertex, MachineDataSpecableVertex,
+        AbstractHasGraphInvariants):
     """ Cell which represents a cell within the 2d fabric
     """
 
     PARTITION_ID = "STATE"
 
+    # Eight neighbours to hear from, and one partition to tell them on
+    GRAPH_INVARIANTS = GraphInvariants(
+        n_incoming_edges=8, n_outgoing_partitions=1, self_loops=False)
+
     TRANSMISSION_DATA_SIZE = 2 * BYTES_PER_WORD  # has key and key
     STATE_DATA_SIZE = 1 * BYTES_PER_WORD  # 1 or 2 based off dead or alive
     # alive states, dead states
@@ -54,6 +56,15 @@ class ConwayBasicCell(SimulatorVertex, MachineDataSpecableVertex):
     RECORDING_HEADER_SIZE = BYTES_PER_WORD
     RECORDING_ELEMENT_SIZE = STATE_DATA_SIZE  # A recording of the state
 
+    REGIONS = RegionLayout([
+        system_region(DataRegions.SYSTEM),
+        Region(DataRegions.TRANSMISSIONS, "inputs", TRANSMISSION_DATA_SIZE),
+        Region(DataRegions.STATE, "state", STATE_DATA_SIZE),
+        Region(DataRegions.NEIGHBOUR_INITIAL_STATES, "neighour_states",
+               NEIGHBOUR_INITIAL_STATES_SIZE),
+        Region(DataRegions.RESULTS, "results", RECORDING_HEADER_SIZE,
+               per_timestep_bytes=RECORDING_ELEMENT_SIZE)])
+
     def __init__(self, label, state):
         """
         :param str label:
@@ -79,65 +90,30 @@ class ConwayBasicCell(SimulatorVertex, MachineDataSpecableVertex):
         """
         # pylint: disable=arguments-differ
 
-        # Generate the system data region for simulation .c requirements
-        generate_system_data_region(spec, DataRegions.SYSTEM,
-                                    self, machine_time_step, time_scale_factor)
-
         # reserve memory regions
-        spec.reserve_memory_region(
-            region=DataRegions.TRANSMISSIONS,
-            size=self.TRANSMISSION_DATA_SIZE, label="inputs")
-        spec.reserve_memory_region(
-            region=DataRegions.STATE,
-            size=self.STATE_DATA_SIZE, label="state")
-        spec.reserve_memory_region(
-            region=DataRegions.NEIGHBOUR_INITIAL_STATES,
-            size=self.NEIGHBOUR_INITIAL_STATES_SIZE, label="neighour_states")
-        spec.reserve_memory_region(
-            region=DataRegions.RESULTS,
-            size=(self.RECORDING_HEADER_SIZE +
-                  (data_n_time_steps * self.RECORDING_ELEMENT_SIZE)),
-            label="results")
-
-        # check got right number of keys and edges going into me
-        partitions = machine_graph.\
-            get_multicast_edge_partitions_starting_at_vertex(self)
-        if not is_single(partitions):
-            raise ConfigurationException(
-                "Can only handle one type of partition.")
+        self.reserve_regions(spec, data_n_time_steps)
 
-        # check for duplicates
-        edges = list(machine_graph.get_edges_ending_at_vertex(self))
-        if len(edges) != 8:
-            raise ConfigurationException(
-                "I've not got the right number of connections. I have {} "
-                "instead of 8".format(
-                    len(machine_graph.get_edges_ending_at_vertex(self))))
+        # Generate the system data region for simulation .c requirements
+        self.write_system_region(spec, DataRegions.SYSTEM)
 
-        for edge in edges:
-            if edge.pre_vertex == self:
-                raise ConfigurationException(
-                    "I'm connected to myself, this is deemed an error "
-                    "please fix.")
+        # GraphValidator has checked these against GRAPH_INVARIANTS
+        edges = list(machine_graph.get_edges_ending_at_vertex(self))
 
         # write key needed to transmit with
         key = routing_info.get_first_key_from_pre_vertex(
             self, self.PARTITION_ID)
 
-        spec.switch_write_focus(DataRegions.TRANSMISSIONS)
-        spec.write_value(int(key is not None))
-        spec.write_value(0 if key is None else key)
+        self.write_region(spec, DataRegions.TRANSMISSIONS, [
+            int(key is not None), 0 if key is None else key])
 
         # write state value
-        spec.switch_write_focus(DataRegions.STATE)
-        spec.write_value(int(bool(self._state)))
+        self.write_region(spec, DataRegions.STATE, [int(self._state)])
 
         # write neighbours data state
-        spec.switch_write_focus(DataRegions.NEIGHBOUR_INITIAL_STATES)
         alive = sum(edge.pre_vertex.state for edge in edges)
         dead = sum(not edge.pre_vertex.state for edge in edges)
-        spec.write_value(alive)
-        spec.write_value(dead)
+        self.write_region(
+            spec, DataRegions.NEIGHBOUR_INITIAL_STATES, [alive, dead])
 
         # End-of-Spec:
         spec.end_specification()
@@ -171,15 +147,14 @@ class ConwayBasicCell(SimulatorVertex, MachineDataSpecableVertex):
                 n_word_struct(n_steps).unpack(raw_data)]
 
     @property
-    @overrides(MachineVertex.resources_required)
-    def resources_required(self):
-        fixed_sdram = (SYSTEM_BYTES_REQUIREMENT + self.TRANSMISSION_DATA_SIZE +
-                       self.STATE_DATA_SIZE +
-                       self.NEIGHBOUR_INITIAL_STATES_SIZE +
-                       self.RECORDING_HEADER_SIZE)
-        per_timestep_sdram = self.RECORDING_ELEMENT_SIZE
-        return ResourceContainer(
-            sdram=VariableSDRAM(fixed_sdram, per_timestep_sdram))
+    @overrides(RegionLayoutVertex.region_layout)
+    def region_layout(self):
+        return self.REGIONS
+
+    @property
+    @overrides(AbstractHasGraphInvariants.graph_invariants)
+    def graph_invariants(self):
+        return self.GRAPH_INVARIANTS
 
     @property
     def state(self):
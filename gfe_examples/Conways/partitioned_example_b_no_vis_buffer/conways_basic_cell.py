@@ -16,12 +16,8 @@
 from enum import IntEnum
 from spinn_utilities.overrides import overrides
 from pacman.executor.injection_decorator import inject_items
-from pacman.model.graphs.machine import MachineVertex
-from pacman.model.resources import ResourceContainer, VariableSDRAM
-from pacman.utilities.utility_calls import is_single
-from spinn_front_end_common.utilities.constants import (
-    SYSTEM_BYTES_REQUIREMENT, BYTES_PER_WORD)
-from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement, n_word_struct)
 from spinn_front_end_common.abstract_models.impl import (
@@ -29,9 +25,10 @@ from spinn_front_end_common.abstract_models.impl import (
 from spinn_front_end_common.interface.buffer_management.buffer_models import (
     AbstractReceiveBuffersToHost)
 from spinn_front_end_common.interface.buffer_management.recording_utilities\
-    import (
-        get_recording_data_constant_size, get_recording_header_size)
-from spinnaker_graph_front_end.utilities import SimulatorVertex
+    import get_recording_data_constant_size
+from spinnaker_graph_front_end.utilities import (
+    AbstractHasGraphInvariants, GraphInvariants, recording_region, Region,
+    RegionLayout, RegionLayoutVertex, system_region)
 
 
 # Regions for populations
@@ -49,19 +46,31 @@ class Channels(IntEnum):
 
 
 class ConwayBasicCell(
-        SimulatorVertex, MachineDataSpecableVertex,
-        AbstractReceiveBuffersToHost):
+        RegionLayoutVertex, MachineDataSpecableVertex,
+        AbstractReceiveBuffersToHost, AbstractHasGraphInvariants):
     """ Cell which represents a cell within the 2d fabric
     """
 
     PARTITION_ID = "STATE"
 
+    # Eight neighbours to hear from, and one partition to tell them on
+    GRAPH_INVARIANTS = GraphInvariants(
+        n_incoming_edges=8, n_outgoing_partitions=1, self_loops=False)
+
     TRANSMISSION_DATA_SIZE = 2 * BYTES_PER_WORD  # has key and key
     STATE_DATA_SIZE = 1 * BYTES_PER_WORD  # 0 or 1 based off dead or alive
     # alive states, dead states
     NEIGHBOUR_INITIAL_STATES_SIZE = 2 * BYTES_PER_WORD
     RECORDING_ELEMENT_SIZE = STATE_DATA_SIZE  # A recording of the state
 
+    REGIONS = RegionLayout([
+        system_region(DataRegions.SYSTEM),
+        Region(DataRegions.TRANSMISSIONS, "inputs", TRANSMISSION_DATA_SIZE),
+        Region(DataRegions.STATE, "state", STATE_DATA_SIZE),
+        Region(DataRegions.NEIGHBOUR_INITIAL_STATES, "neighour_states",
+               NEIGHBOUR_INITIAL_STATES_SIZE),
+        recording_region(DataRegions.RESULTS, len(Channels))])
+
     def __init__(self, label, state):
         """
         :param str label:
@@ -86,64 +95,36 @@ class ConwayBasicCell(
         :param ~.RoutingInfo routing_info:
         """
         # pylint: disable=arguments-differ
-        # Generate the system data region for simulation .c requirements
-        self.generate_system_region(spec)
 
         # reserve memory regions
-        spec.reserve_memory_region(
-            region=DataRegions.TRANSMISSIONS,
-            size=self.TRANSMISSION_DATA_SIZE, label="inputs")
-        spec.reserve_memory_region(
-            region=DataRegions.STATE,
-            size=self.STATE_DATA_SIZE, label="state")
-        spec.reserve_memory_region(
-            region=DataRegions.NEIGHBOUR_INITIAL_STATES,
-            size=self.NEIGHBOUR_INITIAL_STATES_SIZE, label="neighour_states")
+        self.reserve_regions(spec)
+
+        # Generate the system data region for simulation .c requirements
+        self.write_system_region(spec, DataRegions.SYSTEM)
 
         # get recorded buffered regions sorted
-        self.generate_recording_region(
+        self.write_recording_region(
             spec, DataRegions.RESULTS,
             [self.RECORDING_ELEMENT_SIZE * data_n_time_steps])
 
-        # check got right number of keys and edges going into me
-        partitions = machine_graph.\
-            get_multicast_edge_partitions_starting_at_vertex(self)
-        if not is_single(partitions):
-            raise ConfigurationException(
-                "Can only handle one type of partition.")
-
-        # check for duplicates
+        # GraphValidator has checked these against GRAPH_INVARIANTS
         edges = list(machine_graph.get_edges_ending_at_vertex(self))
-        if len(edges) != 8:
-            raise ConfigurationException(
-                "I've not got the right number of connections. I have {} "
-                "instead of 8".format(
-                    len(machine_graph.get_edges_ending_at_vertex(self))))
-
-        for edge in edges:
-            if edge.pre_vertex == self:
-                raise ConfigurationException(
-                    "I'm connected to myself, this is deemed an error"
-                    " please fix.")
 
         # write key needed to transmit with
         key = routing_info.get_first_key_from_pre_vertex(
             self, self.PARTITION_ID)
 
-        spec.switch_write_focus(DataRegions.TRANSMISSIONS)
-        spec.write_value(int(key is not None))
-        spec.write_value(0 if key is None else key)
+        self.write_region(spec, DataRegions.TRANSMISSIONS, [
+            int(key is not None), 0 if key is None else key])
 
         # write state value
-        spec.switch_write_focus(DataRegions.STATE)
-        spec.write_value(int(self._state))
+        self.write_region(spec, DataRegions.STATE, [int(self._state)])
 
         # write neighbours data state
-        spec.switch_write_focus(DataRegions.NEIGHBOUR_INITIAL_STATES)
         alive = sum(edge.pre_vertex.state for edge in edges)
-        dead = sum(not edge.pre_vertex.state for edge in edges)
-        spec.write_value(alive)
-        spec.write_value(dead)
+        dead = len(edges) - alive
+        self.write_region(
+            spec, DataRegions.NEIGHBOUR_INITIAL_STATES, [alive, dead])
 
         # End-of-Spec:
         spec.end_specification()
@@ -166,18 +147,22 @@ class ConwayBasicCell(
             n_word_struct(len(raw_data) // BYTES_PER_WORD).unpack(raw_data)]
 
     @property
-    @overrides(MachineVertex.resources_required)
+    @overrides(RegionLayoutVertex.region_layout)
+    def region_layout(self):
+        return self.REGIONS
+
+    @property
+    @overrides(RegionLayoutVertex.resources_required)
     def resources_required(self):
-        fixed_sdram = (
-            SYSTEM_BYTES_REQUIREMENT +
-            self.TRANSMISSION_DATA_SIZE +
-            self.STATE_DATA_SIZE +
-            self.NEIGHBOUR_INITIAL_STATES_SIZE +
-            get_recording_header_size(len(Channels)) +
-            get_recording_data_constant_size(len(Channels)))
-        per_timestep_sdram = self.RECORDING_ELEMENT_SIZE
-        return ResourceContainer(
-            sdram=VariableSDRAM(fixed_sdram, per_timestep_sdram))
+        # The recorded states are buffered outside the regions
+        return ResourceContainer(sdram=self.REGIONS.sdram_required(
+            get_recording_data_constant_size(len(Channels)),
+            self.RECORDING_ELEMENT_SIZE))
+
+    @property
+    @overrides(AbstractHasGraphInvariants.graph_invariants)
+    def graph_invariants(self):
+        return self.GRAPH_INVARIANTS
 
     @property
     def state(self):
@@ -16,19 +16,15 @@
 from enum import IntEnum
 import logging
 from spinn_utilities.overrides import overrides
-from pacman.model.graphs.machine import MachineVertex
-from pacman.model.resources import ResourceContainer, ConstantSDRAM
-from spinn_front_end_common.utilities.constants import SYSTEM_BYTES_REQUIREMENT
+from pacman.model.resources import ResourceContainer
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement)
 from spinn_front_end_common.abstract_models.impl import (
     MachineDataSpecableVertex)
 from spinn_front_end_common.interface.buffer_management.buffer_models import (
     AbstractReceiveBuffersToHost)
-from spinn_front_end_common.interface.buffer_management.recording_utilities \
-    import (
-        get_recording_header_size)
-from spinnaker_graph_front_end.utilities import SimulatorVertex
+from spinnaker_graph_front_end.utilities import (
+    recording_region, RegionLayout, RegionLayoutVertex, system_region)
 
 logger = logging.getLogger(__name__)
 
@@ -43,33 +39,42 @@ class Channels(IntEnum):
 
 
 class HelloWorldVertex(
-        SimulatorVertex, MachineDataSpecableVertex,
+        RegionLayoutVertex, MachineDataSpecableVertex,
         AbstractReceiveBuffersToHost):
 
+    REGIONS = RegionLayout([
+        system_region(DataRegions.SYSTEM),
+        recording_region(DataRegions.STRING_DATA, len(Channels))])
+
     def __init__(self, n_hellos, label=None, constraints=None):
         super().__init__(label, "hello_world.aplx", constraints=constraints)
 
         self._string_data_size = n_hellos * 13
 
     @property
-    @overrides(MachineVertex.resources_required)
+    @overrides(RegionLayoutVertex.region_layout)
+    def region_layout(self):
+        return self.REGIONS
+
+    @property
+    @overrides(RegionLayoutVertex.resources_required)
     def resources_required(self):
-        resources = ResourceContainer(sdram=ConstantSDRAM(
-            SYSTEM_BYTES_REQUIREMENT +
-            get_recording_header_size(len(Channels)) +
+        # The hellos are recorded outside the regions
+        return ResourceContainer(sdram=self.REGIONS.sdram_required(
             self._string_data_size))
 
-        return resources
-
     @overrides(MachineDataSpecableVertex.generate_machine_data_specification)
     def generate_machine_data_specification(
             self, spec, placement, machine_graph, routing_info, iptags,
             reverse_iptags, machine_time_step, time_scale_factor):
+        # reserve memory regions
+        self.reserve_regions(spec)
+
         # Generate the system data region for simulation .c requirements
-        self.generate_system_region(spec)
+        self.write_system_region(spec, DataRegions.SYSTEM)
 
         # Make the data regions for hello world; it's just a recording region
-        self.generate_recording_region(
+        self.write_recording_region(
             spec, DataRegions.STRING_DATA, [self._string_data_size])
 
         # End-of-Spec:
@@ -16,21 +16,17 @@
 from enum import IntEnum
 import logging
 from spinn_utilities.overrides import overrides
-from pacman.model.graphs.machine import MachineVertex
-from pacman.model.resources import ResourceContainer, VariableSDRAM
-from spinn_front_end_common.utilities.constants import (
-    SYSTEM_BYTES_REQUIREMENT, BYTES_PER_WORD)
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement)
 from spinn_front_end_common.abstract_models import (
     AbstractGeneratesDataSpecification)
 from spinn_front_end_common.interface.buffer_management.buffer_models import (
     AbstractReceiveBuffersToHost)
-from spinn_front_end_common.interface.buffer_management import (
-    recording_utilities)
-from spinnaker_graph_front_end.utilities import SimulatorVertex
-from spinnaker_graph_front_end.utilities.data_utils import (
-    generate_steps_system_data_region)
+from spinnaker_graph_front_end.utilities import (
+    recording_region, Region, RegionLayout, RegionLayoutVertex,
+    system_region)
 import numpy
 from pacman.executor.injection_decorator import inject_items
 
@@ -52,7 +48,7 @@ class Channels(IntEnum):
 
 
 class HelloWorldVertex(
-        SimulatorVertex, AbstractGeneratesDataSpecification,
+        RegionLayoutVertex, AbstractGeneratesDataSpecification,
         AbstractReceiveBuffersToHost):
     PARAMS_BASE_SIZE = BYTES_PER_WORD * 2
 
@@ -74,15 +70,23 @@ class HelloWorldVertex(
             for _ in range(BYTES_PER_WORD - text_extra):
                 self._text += ' '
 
+        self._regions = RegionLayout([
+            system_region(DataRegions.SYSTEM),
+            Region(DataRegions.PARAMS, "params",
+                   self.PARAMS_BASE_SIZE + len(self._text)),
+            recording_region(DataRegions.STRING_DATA, len(Channels))])
+
+    @property
+    @overrides(RegionLayoutVertex.region_layout)
+    def region_layout(self):
+        return self._regions
+
     @property
-    @overrides(MachineVertex.resources_required)
+    @overrides(RegionLayoutVertex.resources_required)
     def resources_required(self):
-        fixed = (
-            SYSTEM_BYTES_REQUIREMENT +
-            recording_utilities.get_recording_header_size(len(Channels)) +
-            self.PARAMS_BASE_SIZE + len(self._text))
-        variable = len(self._text)
-        return ResourceContainer(sdram=VariableSDRAM(fixed, variable))
+        # The text is recorded outside the regions, once a step
+        return ResourceContainer(sdram=self._regions.sdram_required(
+            extra_per_timestep_sdram=len(self._text)))
 
     @inject_items({
         "data_n_steps": "DataNSteps"
@@ -92,25 +96,22 @@ class HelloWorldVertex(
     def generate_data_specification(self, spec, placement, data_n_steps):
         # pylint: disable=arguments-differ
 
+        # Create the data regions for hello world
+        self.reserve_regions(spec)
+
         # Generate the system data region for simulation .c requirements
         # Note that the time step and time scale factor are unused here
-        generate_steps_system_data_region(
-            spec, DataRegions.SYSTEM, self)
-
-        # Create the data regions for hello world
-        spec.reserve_memory_region(
-            region=DataRegions.PARAMS,
-            size=self.PARAMS_BASE_SIZE + len(self._text))
+        self.write_system_region(spec, DataRegions.SYSTEM, timed=False)
 
         # write data for the recording
-        self.generate_recording_region(
+        self.write_recording_region(
             spec, DataRegions.STRING_DATA, [data_n_steps * len(self._text)])
 
         # write the data
-        spec.switch_write_focus(DataRegions.PARAMS)
-        spec.write_value(len(self._text))
-        spec.write_array(numpy.array(
-            bytearray(self._text, self._ENCODING)).view("uint32"))
+        self.write_region(spec, DataRegions.PARAMS, numpy.concatenate((
+            [len(self._text)],
+            numpy.frombuffer(
+                self._text.encode(self._ENCODING), dtype="uint32"))))
 
         # End-of-Spec:
         spec.end_specification()
@@ -16,11 +16,9 @@
 from enum import IntEnum
 import logging
 from spinn_utilities.overrides import overrides
-from pacman.model.graphs.machine import MachineVertex
 from pacman.model.resources import CPUCyclesPerTickResource, DTCMResource
-from pacman.model.resources import ResourceContainer, VariableSDRAM
-from spinn_front_end_common.utilities.constants import (
-    SYSTEM_BYTES_REQUIREMENT, BYTES_PER_WORD)
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement)
 from spinn_front_end_common.abstract_models.impl import (
@@ -29,7 +27,9 @@ from spinn_front_end_common.interface.buffer_management.buffer_models import (
     AbstractReceiveBuffersToHost)
 from spinn_front_end_common.interface.buffer_management import (
     recording_utilities)
-from spinnaker_graph_front_end.utilities import SimulatorVertex
+from spinnaker_graph_front_end.utilities import (
+    recording_region, Region, RegionLayout, RegionLayoutVertex,
+    system_region)
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +49,7 @@ class RecordingChannels(IntEnum):
 
 
 class TemplateVertex(
-        SimulatorVertex, MachineDataSpecableVertex,
+        RegionLayoutVertex, MachineDataSpecableVertex,
         AbstractReceiveBuffersToHost):
 
     # The number of bytes for the has_key flag and the key
@@ -58,6 +58,13 @@ class TemplateVertex(
     # The number of bytes recorded per timestep - currently 0 in C code
     N_RECORDED_PER_TIMESTEP = 0
 
+    # TODO: Update with the sizes of the regions of the application
+    REGIONS = RegionLayout([
+        system_region(DataRegions.SYSTEM),
+        Region(DataRegions.TRANSMISSION, "transmission",
+               TRANSMISSION_REGION_N_BYTES),
+        recording_region(DataRegions.RECORDED_DATA, len(RecordingChannels))])
+
     def __init__(self, label, constraints=None):
         super().__init__(
             label=label, binary_name="c_template_vertex.aplx",
@@ -67,19 +74,21 @@ class TemplateVertex(
         self._recording_size = BYTES_PER_WORD
 
     @property
-    @overrides(MachineVertex.resources_required)
+    @overrides(RegionLayoutVertex.region_layout)
+    def region_layout(self):
+        return self.REGIONS
+
+    @property
+    @overrides(RegionLayoutVertex.resources_required)
     def resources_required(self):
-        constant_sdram = (
-            SYSTEM_BYTES_REQUIREMENT + self.TRANSMISSION_REGION_N_BYTES +
-            recording_utilities.get_recording_header_size(
-                len(RecordingChannels)) +
-            recording_utilities.get_recording_data_constant_size(
-                len(RecordingChannels)))
-        variable_sdram = self.N_RECORDED_PER_TIMESTEP
+        # The recorded data is buffered outside the regions
         return ResourceContainer(
             cpu_cycles=CPUCyclesPerTickResource(45),
             dtcm=DTCMResource(100),
-            sdram=VariableSDRAM(constant_sdram, variable_sdram))
+            sdram=self.REGIONS.sdram_required(
+                recording_utilities.get_recording_data_constant_size(
+                    len(RecordingChannels)),
+                self.N_RECORDED_PER_TIMESTEP))
 
     @overrides(MachineDataSpecableVertex.generate_machine_data_specification)
     def generate_machine_data_specification(
@@ -95,33 +104,29 @@ class TemplateVertex(
             the tag allocator
         """
 
+        # Reserve the regions declared in REGIONS
+        self.reserve_regions(spec)
+
         # Generate the system data region for simulation .c requirements
-        self.generate_system_region(spec, DataRegions.SYSTEM)
+        self.write_system_region(spec, DataRegions.SYSTEM)
 
         # Generate the application data regions
-        self._reserve_app_memory_regions(spec)
         self._write_app_memory_regions(spec, routing_info, iptags)
 
         # Generate the recording region
-        self.generate_recording_region(
+        self.write_recording_region(
             spec, DataRegions.RECORDED_DATA, [self._recording_size])
 
         # End-of-Spec:
         spec.end_specification()
 
-    def _reserve_app_memory_regions(self, spec):
-        spec.reserve_memory_region(
-            region=DataRegions.TRANSMISSION,
-            size=self.TRANSMISSION_REGION_N_BYTES, label="transmission")
-
     def _write_app_memory_regions(self, spec, routing_info, iptags):
         # Get the key, assuming all outgoing edges use the same key
         key = routing_info.get_first_key_from_pre_vertex(self, PARTITION_ID)
 
         # Write the transmission region
-        spec.switch_write_focus(DataRegions.TRANSMISSION)
-        spec.write_value(int(key is not None))
-        spec.write_value(0 if key is None else key)
+        self.write_region(spec, DataRegions.TRANSMISSION, [
+            int(key is not None), 0 if key is None else key])
 
     def read(self):
         """ Get the recorded data
@@ -19,6 +19,7 @@
 #include <data_specification.h>
 #include <simulation.h>
 #include <debug.h>
+#include <sdram_channel.h>
 
 /* validates that the model being compiled does indeed contain a application
  * magic number*/
@@ -37,31 +38,16 @@ typedef enum regions {
     SYSTEM = 0, SDRAM_OUT = 1, SDRAM_IN = 2
 } regions;
 
-//! sdram struct
-typedef struct sdram_region_t {
-    //! base address
-    address_t base_address;
-    //! size
-    uint32_t size;
-} sdram_region_t;
-
-//! sdram struct
-typedef struct sdram_regions_t {
-    //! base address
-    uint32_t n_regions;
-
-    //! Entries in the table
-    sdram_region_t regions [];
-} sdram_regions_t;
-
 //! The number of regions that are to be used for recording
 #define NUMBER_OF_REGIONS_TO_RECORD 4
 
 // Globals
 
-sdram_regions_t *out_data;
+//! The channels to hand counts on through
+sdram_channel_table_t *out_data;
 
-sdram_regions_t *in_data;
+//! The channels to take counts from
+sdram_channel_table_t *in_data;
 
 //! The current timer tick value.
 // the timer tick callback returning the same value.
@@ -76,9 +62,6 @@ static uint32_t simulation_ticks = 0;
 //! Determines if this model should run for infinite time
 static uint32_t infinite_run;
 
-//! read counter
-static uint32_t reads = 0;
-
 //! \brief Initialises the model by reading in the regions and checking
 //!        recording data.
 //! \return True if it successfully initialised, false otherwise
@@ -103,20 +86,11 @@ static bool initialise(void) {
     }
 
     // Handle SDRAM stuff
-    out_data = (sdram_regions_t*) data_specification_get_region(
-        SDRAM_OUT, ds_regions);
-    in_data = (sdram_regions_t*) data_specification_get_region(
-        SDRAM_IN, ds_regions);
-
-    // init the sdram to zeros
-    for (uint32_t region_id = 0; region_id < out_data->n_regions;
-            region_id++) {
-        for (uint32_t words_index = 0;
-                words_index < (uint32_t) out_data->regions[region_id].size / 4;
-                words_index++) {
-            out_data->regions[region_id].base_address[words_index] = 0;
-        }
-    }
+    out_data = data_specification_get_region(SDRAM_OUT, ds_regions);
+    in_data = data_specification_get_region(SDRAM_IN, ds_regions);
+
+    // empty the channels before anything is handed on through them
+    sdram_channel_table_reset(out_data);
 
     log_debug("Initialise: finished");
     return true;
@@ -151,43 +125,50 @@ void timer_callback(UNUSED uint timer_count, UNUSED uint unused) {
         return;
     }
 
-    // if even, read ins and check count matches, else add 1 to all out regions
+    // if even, hand on the next count through each out channel, else check
+    // the count that has arrived through each in channel
     if (time % 2 == 0) {
-        for (uint32_t region_id = 0; region_id < out_data->n_regions;
-                region_id++) {
-            for (uint32_t words_index = 0;
-                    words_index < (uint32_t)
-                        out_data->regions[region_id].size / 4;
-                    words_index++) {
-                out_data->regions[region_id].base_address[words_index] += 1;
+        for (uint32_t i = 0; i < out_data->n_channels; i++) {
+            sdram_channel_t *channel = &out_data->channels[i];
+            uint32_t *slot = sdram_channel_write_slot(channel);
+            if (slot == NULL) {
+                log_info("out channel %d is full", i);
+                continue;
             }
+            uint32_t count = channel->n_handoffs + 1;
+            for (uint32_t w = 0; w < channel->slot_size / sizeof(uint32_t);
+                    w++) {
+                slot[w] = count;
+            }
+            sdram_channel_commit_write(channel);
         }
-        log_info("incremented all regions");
+        log_info("handed on all counts");
     }
     else {
-        reads += 1;
         bool fails = false;
-        for (uint32_t region_id = 0; region_id < in_data->n_regions;
-                region_id++) {
-            for (uint32_t words_index = 0;
-                    words_index < (uint32_t)
-                        in_data->regions[region_id].size / 4;
-                    words_index++) {
-                if (in_data->regions[region_id].base_address[
-                        words_index] != reads) {
+        for (uint32_t i = 0; i < in_data->n_channels; i++) {
+            sdram_channel_t *channel = &in_data->channels[i];
+            uint32_t *slot = sdram_channel_read_slot(channel);
+            if (slot == NULL) {
+                log_info("in channel %d is empty", i);
+                continue;
+            }
+            uint32_t count = channel->n_handoffs + 1;
+            for (uint32_t w = 0; w < channel->slot_size / sizeof(uint32_t);
+                    w++) {
+                if (slot[w] != count) {
                     log_info(
-                        "in region %d has %d instead of %d. BOOM!",
-                        region_id,
-                        in_data->regions[region_id].base_address[words_index],
-                        reads);
+                        "in channel %d has %d instead of %d. BOOM!",
+                        i, slot[w], count);
                     fails = true;
                 }
             }
+            sdram_channel_commit_read(channel);
         }
         if (fails) {
             rt_error(RTE_SWERR);
         }
-        log_info("all regions were correct number");
+        log_info("all channels had the correct count");
     }
 }
 
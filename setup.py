@@ -27,7 +27,8 @@ assert __version__
 # Build a list of all project modules, as well as supplementary files
 main_package = "spinnaker_graph_front_end"
 extensions = {
-    ".aplx", ".boot", ".cfg", ".json", ".sql", ".template", ".xml", ".xsd"}
+    ".aplx", ".boot", ".cfg", ".h", ".json", ".sql", ".template", ".xml",
+    ".xsd"}
 main_package_dir = os.path.join(os.path.dirname(__file__), main_package)
 start = len(main_package_dir)
 packages = []
@@ -79,7 +80,7 @@ setup(
                       'SpiNNaker_PACMAN >= 1!5.1.1, < 1!6.0.0',
                       'SpiNNaker_DataSpecification >= 1!5.1.1, < 1!6.0.0',
                       'SpiNNFrontEndCommon >= 1!5.1.1, < 1!6.0.0',
-                      'lxml'],
+                      'lxml', 'appdirs'],
     maintainer="SpiNNakerTeam",
     maintainer_email="spinnakerusers@googlegroups.com"
 )
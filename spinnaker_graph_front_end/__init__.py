@@ -45,30 +45,74 @@ The general usage pattern for this API something like is::
 
     # Analyse/render the results; totally application-specific!
 
+From :py:mod:`asyncio` code, ``await gfe.run_async(duration)`` runs without
+blocking the event loop; cancelling the awaiting task stops the run.
+
+To drive several independent simulations from one program, use a
+:py:class:`Session` for each; it has the functions of this module as methods.
+The calls of all sessions in a process run one at a time; for simulations
+that map or run in parallel, use one process for each.
+
 It is possible to use GFE-style vertices in a neural graph (e.g., to simulate
 the external world). Talk to the SpiNNaker team for more details.
 """
 
+import importlib
 import os
 import logging
 import sys
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.socket_address import SocketAddress
-from pacman.model.graphs.application import ApplicationEdge, ApplicationVertex
-from pacman.model.graphs.machine import MachineEdge as _ME, MachineVertex
-from spinn_front_end_common.utilities.utility_objs import ExecutableFinder
-from spinn_front_end_common.utilities import globals_variables
-from spinn_front_end_common.utility_models import (
-    LivePacketGather as
-    _LPG, ReverseIpTagMultiCastSource as
-    _RIPTMCS)
 from spinnaker_graph_front_end._version import (
     __version__, __version_name__, __version_month__, __version_year__)
-from spinnaker_graph_front_end.spinnaker import SpiNNaker
-from spinnaker_graph_front_end import spinnaker as gfe_file
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
+#: The attributes that are only imported when they are first used, and the
+#: modules that they are imported from. Importing the front end is then
+#: cheap for tools that never build or run a graph.
+_LAZY_ATTRIBUTES = {
+    "LivePacketGather": "spinnaker_graph_front_end._utility_models",
+    "MachineEdge": "spinnaker_graph_front_end._utility_models",
+    "ReverseIpTagMultiCastSource":
+        "spinnaker_graph_front_end._utility_models",
+    "Session": "spinnaker_graph_front_end.session",
+    "run_async": "spinnaker_graph_front_end.async_run",
+    "run_until_complete_async": "spinnaker_graph_front_end.async_run",
+    "SpiNNaker": "spinnaker_graph_front_end.spinnaker",
+}
+
+
+def _spinnaker():
+    """ Import the simulator module. This also installs the failed state of\
+        the graph front end, which anything may use to read the config.
+
+    :rtype: ~types.ModuleType
+    """
+    return importlib.import_module("spinnaker_graph_front_end.spinnaker")
+
+
+def __getattr__(name):
+    """ Resolve the heavy attributes of this module on first use.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    _spinnaker()
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+# Module-level __getattr__ needs Python 3.7; be eager on older versions
+if sys.version_info < (3, 7):
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
+
 
 __all__ = ['LivePacketGather', 'ReverseIpTagMultiCastSource', 'MachineEdge',
            'setup', 'run', 'stop', 'read_xml_file', 'add_vertex_instance',
@@ -78,8 +122,10 @@ __all__ = ['LivePacketGather', 'ReverseIpTagMultiCastSource', 'MachineEdge',
            'has_ran', 'machine_time_step',
            'get_number_of_available_cores_on_machine', 'no_machine_time_steps',
            'time_scale_factor', 'machine_graph', 'application_graph',
-           'routing_infos', 'placements', 'transceiver',
-           'buffer_manager', 'machine', 'is_allocated_machine']
+           'routing_infos', 'key_index', 'placements', 'transceiver',
+           'buffer_manager', 'machine', 'is_allocated_machine', 'Session',
+           'run_async', 'run_until_complete_async', 'current_progress',
+           'set_progress_callback']
 
 
 def setup(hostname=None, graph_label=None, model_binary_module=None,
@@ -137,18 +183,19 @@ def setup(hostname=None, graph_label=None, model_binary_module=None,
     :raise ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
         if mutually exclusive options are given.
     """
-    # pylint: disable=redefined-outer-name
+    # pylint: disable=redefined-outer-name, import-outside-toplevel
+    from spinnaker_graph_front_end.utilities import IndexedExecutableFinder
     logger.info(
         "SpiNNaker graph front end (c) {}, University of Manchester",
         __version_year__)
-    parent_dir = os.path.split(os.path.split(gfe_file.__file__)[0])[0]
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     logger.info(
         "Release version {}({}) - {} {}. Installed in folder {}",
         __version__, __version_name__, __version_month__, __version_year__,
         parent_dir)
 
     # add the directories where the binaries are located
-    executable_finder = ExecutableFinder()
+    executable_finder = IndexedExecutableFinder()
     if model_binary_module is not None:
         executable_finder.add_path(
             os.path.dirname(model_binary_module.__file__))
@@ -159,7 +206,7 @@ def setup(hostname=None, graph_label=None, model_binary_module=None,
         executable_finder.add_path(file_dir)
 
     # set up the spinnaker object; after this, _sim() returns this object
-    SpiNNaker(
+    _spinnaker().SpiNNaker(
         host_name=hostname, graph_label=graph_label,
         executable_finder=executable_finder,
         database_socket_addresses=database_socket_addresses,
@@ -177,6 +224,9 @@ def _sim():
 
     :rtype: ~spinn_front_end_common.utilities.SimulatorInterface
     """
+    _spinnaker()
+    # pylint: disable=import-outside-toplevel
+    from spinn_front_end_common.utilities import globals_variables
     return globals_variables.get_simulator()
 
 
@@ -200,6 +250,32 @@ def run_until_complete(n_steps=None):
     _sim().run_until_complete(n_steps)
 
 
+def current_progress(n_cores=4):
+    """ Get an estimate of how far the run that is going on has got. This\
+        is meant to be called from a thread other than the one running.
+
+    :param int n_cores:
+        how many cores to read the states of, to spot cores that have
+        stalled or are lagging behind
+    :return: the progress, or ``None`` if no run is going on
+    :rtype: ~spinnaker_graph_front_end.run_progress.RunProgress or None
+    """
+    return _sim().current_progress(n_cores)
+
+
+def set_progress_callback(callback, interval=1.0):
+    """ Have a function called periodically with the progress of each run.
+
+    :param callback:
+        called with a :py:class:`~.RunProgress` from a background thread, or
+        ``None`` to stop calling
+    :type callback:
+        callable(~spinnaker_graph_front_end.run_progress.RunProgress) or None
+    :param float interval: the number of seconds between calls
+    """
+    _sim().progress_monitor.set_callback(callback, interval)
+
+
 def stop():
     """ Do any necessary cleaning up before exiting. Unregisters the controller
     """
@@ -245,6 +321,8 @@ def add_vertex(cell_class, cell_params, label=None, constraints=()):
     :return: the application vertex instance object
     :rtype: ~pacman.model.graphs.application.ApplicationVertex
     """
+    # pylint: disable=import-outside-toplevel
+    from pacman.model.graphs.application import ApplicationVertex
     if not issubclass(cell_class, ApplicationVertex):
         raise TypeError(f"{cell_class} is not an application vertex class")
     if label is not None:
@@ -284,6 +362,8 @@ def add_machine_vertex(
     :return: the machine vertex instance object
     :rtype: ~pacman.model.graphs.machine.MachineVertex
     """
+    # pylint: disable=import-outside-toplevel
+    from pacman.model.graphs.machine import MachineVertex
     if not issubclass(cell_class, MachineVertex):
         raise TypeError(f"{cell_class} is not a machine vertex class")
     if label is not None:
@@ -326,6 +406,8 @@ def add_edge(edge_type, edge_parameters, semantic_label, label=None):
     :return: the created application edge
     :rtype: ~pacman.model.graphs.application.ApplicationEdge
     """
+    # pylint: disable=import-outside-toplevel
+    from pacman.model.graphs.application import ApplicationEdge
     if not issubclass(edge_type, ApplicationEdge):
         raise TypeError(f"{edge_type} is not an application edge class")
     # correct label if needed
@@ -367,6 +449,8 @@ def add_machine_edge(edge_type, edge_parameters, semantic_label, label=None):
     :return: the created machine edge
     :rtype: ~pacman.model.graphs.machine.MachineEdge
     """
+    # pylint: disable=import-outside-toplevel
+    from pacman.model.graphs.machine import MachineEdge as _ME
     if not issubclass(edge_type, _ME):
         raise TypeError(f"{edge_type} is not a machine edge class")
     # correct label if needed
@@ -486,6 +570,18 @@ def routing_infos():
     return _sim().routing_infos
 
 
+def key_index():
+    """ Get an index for decoding multicast keys back to the vertices that\
+        send them and the atoms they stand for, many keys at a time. It is\
+        built once per mapping.
+
+    :rtype: ~spinnaker_graph_front_end.utilities.KeyIndex
+    :raise ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
+        if the graph has not been mapped
+    """
+    return _sim().key_index()
+
+
 def placements():
     """ Get the planned locations of machine vertices on the machine.
 
@@ -550,28 +646,3 @@ def use_virtual_machine():
     :rtype: bool
     """
     return _sim().use_virtual_board
-
-
-# Thin wrappers for documentation purposes only
-class MachineEdge(_ME):
-    """
-    For full documentation see
-    :py:class:`~pacman.model.graphs.machine.MachineEdge`.
-    """
-    __slots__ = ()
-
-
-class LivePacketGather(_LPG):
-    """
-    For full documentation see
-    :py:class:`~spinn_front_end_common.utility_models.LivePacketGather`.
-    """
-    __slots__ = ()
-
-
-class ReverseIpTagMultiCastSource(_RIPTMCS):
-    """
-    For full documentation see
-    :py:class:`~spinn_front_end_common.utility_models.ReverseIpTagMultiCastSource`.
-    """
-    __slots__ = ()
@@ -0,0 +1,64 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from pacman.model.graphs.machine import MachineEdge as _ME
+from spinn_front_end_common.utility_models import (
+    LivePacketGather as
+    _LPG, ReverseIpTagMultiCastSource as
+    _RIPTMCS)
+from spinnaker_graph_front_end.utilities.event_injector import EventInjector
+
+
+# Thin wrappers for documentation purposes only
+class MachineEdge(_ME):
+    """
+    For full documentation see
+    :py:class:`~pacman.model.graphs.machine.MachineEdge`.
+    """
+    __slots__ = ()
+
+
+class LivePacketGather(_LPG):
+    """
+    For full documentation see
+    :py:class:`~spinn_front_end_common.utility_models.LivePacketGather`.
+    """
+    __slots__ = ()
+
+
+class ReverseIpTagMultiCastSource(_RIPTMCS):
+    """
+    For full documentation see
+    :py:class:`~spinn_front_end_common.utility_models.ReverseIpTagMultiCastSource`.
+    """
+    __slots__ = ()
+
+    def inject_array(self, keys, payloads=None, rate=None):
+        """ Send events to this live input while the simulation runs,\
+            packing as many into each message as will fit.
+
+        :param ~numpy.ndarray keys: The 32-bit keys of the events
+        :param payloads:
+            The 32-bit payloads of the events, if they have them
+        :type payloads: ~numpy.ndarray or None
+        :param rate:
+            The most events to send per second, or ``None`` to send as fast
+            as possible
+        :type rate: float or None
+        :return: The number of messages sent
+        :rtype: int
+        """
+        with EventInjector.for_vertex(self) as injector:
+            return injector.inject_array(keys, payloads, rate)
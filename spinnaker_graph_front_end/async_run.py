@@ -0,0 +1,268 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Running simulations from :py:mod:`asyncio` code without blocking the\
+    event loop.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import time
+
+#: How often, in seconds, a cancelled run is asked again to stop
+_STOP_POLL_INTERVAL = 0.1
+
+
+class RunEvent(object):
+    """ Something that happened during an asynchronous run.
+    """
+
+    __slots__ = ["_kind", "_elapsed", "_error", "_progress"]
+
+    #: The run has been handed to the simulator
+    STARTED = "started"
+    #: The run is still going; sent periodically
+    RUNNING = "running"
+    #: The run completed normally
+    FINISHED = "finished"
+    #: The run was stopped because the waiting task was cancelled
+    CANCELLED = "cancelled"
+    #: The run raised an exception
+    FAILED = "failed"
+
+    #: The kinds of event after which there are no more events
+    FINAL = frozenset((FINISHED, CANCELLED, FAILED))
+
+    def __init__(self, kind, elapsed, error=None, progress=None):
+        """
+        :param str kind: What happened; one of the constants of this class
+        :param float elapsed: Seconds since the run was started
+        :param error: The exception raised by a failed run
+        :type error: Exception or None
+        :param progress: How far a run that is still going has got
+        :type progress: ~spinnaker_graph_front_end.run_progress.RunProgress
+            or None
+        """
+        self._kind = kind
+        self._elapsed = elapsed
+        self._error = error
+        self._progress = progress
+
+    @property
+    def kind(self):
+        """ What happened.
+
+        :rtype: str
+        """
+        return self._kind
+
+    @property
+    def elapsed(self):
+        """ The wall-clock time since the run was started, in seconds.
+
+        :rtype: float
+        """
+        return self._elapsed
+
+    @property
+    def error(self):
+        """ The exception raised by the run, if it failed.
+
+        :rtype: Exception or None
+        """
+        return self._error
+
+    @property
+    def progress(self):
+        """ How far the run has got, for a :py:attr:`RUNNING` event; as\
+            estimated by\
+            :py:func:`~spinnaker_graph_front_end.current_progress`.
+
+        :rtype: ~spinnaker_graph_front_end.run_progress.RunProgress or None
+        """
+        return self._progress
+
+    @property
+    def is_final(self):
+        """ Whether this is the last event of the run.
+
+        :rtype: bool
+        """
+        return self._kind in self.FINAL
+
+    def __repr__(self):
+        return "RunEvent({!r}, {:.3f})".format(self._kind, self._elapsed)
+
+
+class AsyncRun(object):
+    """ A simulation run going on in a worker thread. Await it to wait for\
+        the run to end; iterate over :py:meth:`events` to follow it.
+
+    If the task awaiting the run is cancelled, the simulator is asked to
+    stop (as with :py:func:`~spinnaker_graph_front_end.stop_run`) and the
+    cancellation is only passed on once the worker thread has finished,
+    so the simulator is never left in the middle of a run.
+
+    .. note::
+        Stopping ends runs that go on until asked to stop promptly; a run of
+        a fixed duration still finishes the part of the run that it is in.
+    """
+
+    __slots__ = [
+        "_cancelled", "_future", "_last_event", "_loop", "_queues",
+        "_simulator", "_start", "_ticker"]
+
+    def __init__(self, simulator, target, progress_interval):
+        """
+        :param SpiNNaker simulator: The simulator doing the run
+        :param callable target: What to call in the worker thread
+        :param float progress_interval:
+            Seconds between :py:attr:`RunEvent.RUNNING` events
+        """
+        self._loop = asyncio.get_event_loop()
+        self._simulator = simulator
+        self._cancelled = False
+        self._queues = list()
+        self._start = time.monotonic()
+        self._last_event = None
+
+        # A thread of its own, so that a long run does not hold on to one
+        # of the threads of the default executor of the loop
+        executor = ThreadPoolExecutor(1)
+        self._future = self._loop.run_in_executor(executor, target)
+        executor.shutdown(wait=False)
+        self.__publish(RunEvent.STARTED)
+        self._ticker = self._loop.create_task(self.__tick(progress_interval))
+        self._future.add_done_callback(self.__done)
+
+    def __publish(self, kind, error=None, progress=None):
+        event = RunEvent(
+            kind, time.monotonic() - self._start, error, progress)
+        self._last_event = event
+        for queue in self._queues:
+            queue.put_nowait(event)
+
+    async def __tick(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            # Reading the states of cores blocks, so not on the loop
+            progress = await self._loop.run_in_executor(
+                None, self._simulator.current_progress)
+            if not self._future.done():
+                self.__publish(RunEvent.RUNNING, progress=progress)
+
+    def __done(self, future):
+        self._ticker.cancel()
+        if self._cancelled:
+            self.__publish(RunEvent.CANCELLED)
+        elif future.exception() is not None:
+            self.__publish(RunEvent.FAILED, future.exception())
+        else:
+            self.__publish(RunEvent.FINISHED)
+
+    @property
+    def done(self):
+        """ Whether the run has ended.
+
+        :rtype: bool
+        """
+        return self._future.done()
+
+    def stop_run(self):
+        """ Ask the simulator to stop a run that goes on until asked to\
+            stop, without cancelling anything.
+        """
+        self._simulator.stop_run()
+
+    async def events(self):
+        """ Follow the run from now until it ends.
+
+        :rtype: ~collections.abc.AsyncIterator(RunEvent)
+        """
+        if self._future.done():
+            yield self._last_event
+            return
+        queue = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                event = await queue.get()
+                yield event
+                if event.is_final:
+                    return
+        finally:
+            self._queues.remove(queue)
+
+    async def __wait(self):
+        try:
+            return await asyncio.shield(self._future)
+        except asyncio.CancelledError:
+            self._cancelled = True
+            # The run may not have reached the point where it can be stopped
+            # yet, so keep asking until it has ended
+            while not self._future.done():
+                self._simulator.stop_run()
+                await asyncio.wait(
+                    [self._future], timeout=_STOP_POLL_INTERVAL)
+            raise
+
+    def __await__(self):
+        return self.__wait().__await__()
+
+
+def _current_simulator():
+    # pylint: disable=import-outside-toplevel
+    from spinnaker_graph_front_end import _sim
+    return _sim()
+
+
+def run_async(duration=None, progress_interval=1.0):
+    """ Start a simulation run in a worker thread; the asynchronous\
+        version of :py:func:`~spinnaker_graph_front_end.run`.
+
+    Must be called while an event loop is running; the result can be awaited
+    directly (``await gfe.run_async(duration)``).
+
+    :param int duration:
+        the duration of the run, as for
+        :py:func:`~spinnaker_graph_front_end.run`; if ``None``, the run goes
+        on until it is stopped or the awaiting task is cancelled
+    :param float progress_interval:
+        seconds between the progress events of the run
+    :rtype: AsyncRun
+    """
+    simulator = _current_simulator()
+    return AsyncRun(
+        simulator, functools.partial(simulator.run, duration),
+        progress_interval)
+
+
+def run_until_complete_async(n_steps=None, progress_interval=1.0):
+    """ Start a run until the simulation is complete, in a worker thread;\
+        the asynchronous version of\
+        :py:func:`~spinnaker_graph_front_end.run_until_complete`.
+
+    :param int n_steps:
+        If not ``None``, the number of steps the simulation should be
+        requested to run for
+    :param float progress_interval:
+        seconds between the progress events of the run
+    :rtype: AsyncRun
+    """
+    simulator = _current_simulator()
+    return AsyncRun(
+        simulator, functools.partial(simulator.run_until_complete, n_steps),
+        progress_interval)
@@ -0,0 +1,35 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from .auto_router_compression import AutoRouterCompression
+from .cached_machine_generator import CachedMachineGenerator
+from .component_mapper import ComponentMapper
+from .graph_validator import GraphValidator
+from .grid_routing_info_allocator import GridRoutingInfoAllocator
+from .key_index_database_writer import KeyIndexDatabaseWriter
+from .locality_placer import LocalityPlacer
+from .raw_region_loader import RawRegionLoader
+from .sequential_placer import SequentialPlacer
+
+#: The file describing the algorithms of this package to the executor
+ALGORITHMS_METADATA_FILE = os.path.join(
+    os.path.dirname(__file__), "algorithms_metadata.xml")
+
+__all__ = ["ALGORITHMS_METADATA_FILE", "AutoRouterCompression",
+           "CachedMachineGenerator", "ComponentMapper",
+           "GraphValidator", "GridRoutingInfoAllocator",
+           "KeyIndexDatabaseWriter", "LocalityPlacer", "RawRegionLoader",
+           "SequentialPlacer"]
@@ -0,0 +1,217 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import os
+from spinn_utilities.log import FormatAdapter
+from pacman.exceptions import MinimisationFailedError
+from pacman.model.routing_tables import MulticastRoutingTables
+from pacman.operations.router_compressors import PairCompressor
+from spinn_front_end_common.interface.interface_functions import (
+    RoutingTableLoader)
+from spinn_front_end_common.interface.interface_functions.\
+    host_no_bitfield_router_compression import pair_compression
+from spinn_front_end_common.utilities.exceptions import SpinnFrontEndException
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The name of the file that the pressure report is written to
+PRESSURE_REPORT_NAME = "routing_table_pressure.rpt"
+
+#: No compression: every table fits as it is
+NO_COMPRESSION = "none"
+#: Compression on the host, of the tables that do not fit
+HOST_COMPRESSION = "host"
+#: Compression on the machine, in parallel on every chip
+ON_CHIP_COMPRESSION = "on-chip"
+
+
+def routing_table_pressure(routing_tables, machine):
+    """ Compare the size of each routing table with the space for it in its\
+        router.
+
+    :param ~pacman.model.routing_tables.MulticastRoutingTables \
+            routing_tables:
+        The uncompressed routing tables
+    :param ~spinn_machine.Machine machine:
+    :return: The coordinates of the chip of each table, the number of
+        entries in it and the number of entries that the router has room for,
+        fullest first
+    :rtype: list(tuple(int, int, int, int))
+    """
+    pressure = [
+        (table.x, table.y, table.number_of_entries,
+         machine.get_chip_at(
+             table.x, table.y).router.n_available_multicast_entries)
+        for table in routing_tables.routing_tables
+        if not machine.get_chip_at(table.x, table.y).virtual]
+    pressure.sort(key=lambda row: row[2] / max(row[3], 1), reverse=True)
+    return pressure
+
+
+def choose_compression(pressure, host_limit):
+    """ Decide how to get routing tables to fit in their routers.
+
+    :param list(tuple(int, int, int, int)) pressure:
+        As from :py:func:`routing_table_pressure`
+    :param int host_limit:
+        The most entries, over all the tables that do not fit, to compress
+        on the host; more than that is compressed on the machine
+    :return: The kind of compression, and why
+    :rtype: tuple(str, str)
+    """
+    over = [row for row in pressure if row[2] > row[3]]
+    if not over:
+        if not pressure:
+            return NO_COMPRESSION, "there are no routing tables"
+        x, y, n_entries, capacity = pressure[0]
+        return NO_COMPRESSION, (
+            "every table fits; the fullest, on chip {}, {}, has {} of {} "
+            "entries".format(x, y, n_entries, capacity))
+    to_compress = sum(row[2] for row in over)
+    if to_compress <= host_limit:
+        return HOST_COMPRESSION, (
+            "{} tables do not fit, with {} entries between them, which is "
+            "no more than the host limit of {}".format(
+                len(over), to_compress, host_limit))
+    return ON_CHIP_COMPRESSION, (
+        "{} tables do not fit, with {} entries between them, which is more "
+        "than the host limit of {}".format(
+            len(over), to_compress, host_limit))
+
+
+def compress_over_capacity(routing_tables, pressure):
+    """ Compress on the host each table that does not fit in its router, to\
+        the capacity of that router, leaving the others as they are.
+
+    :param ~pacman.model.routing_tables.MulticastRoutingTables \
+            routing_tables:
+        The uncompressed routing tables
+    :param list(tuple(int, int, int, int)) pressure:
+        As from :py:func:`routing_table_pressure`
+    :return: The tables, compressed where they needed to be
+    :rtype: ~pacman.model.routing_tables.MulticastRoutingTables
+    :raises MinimisationFailedError: If a table cannot be compressed
+    """
+    capacities = {
+        (x, y): capacity for x, y, n_entries, capacity in pressure
+        if n_entries > capacity}
+
+    # Routers almost all have the same capacity, so this is usually one
+    # call to the compressor
+    by_capacity = dict()
+    for table in routing_tables.routing_tables:
+        capacity = capacities.get((table.x, table.y))
+        if capacity is not None:
+            by_capacity.setdefault(
+                capacity, MulticastRoutingTables()).add_routing_table(table)
+    compressed = dict()
+    for capacity, tables in by_capacity.items():
+        for table in PairCompressor()(tables, capacity).routing_tables:
+            compressed[table.x, table.y] = table
+
+    result = MulticastRoutingTables()
+    for table in routing_tables.routing_tables:
+        result.add_routing_table(compressed.get((table.x, table.y), table))
+    return result
+
+
+class AutoRouterCompression(object):
+    """ Loads the routing tables, first compressing them only as much as\
+        their sizes call for: not at all if they fit, on the host if only a\
+        few entries are too many, and on the machine otherwise.
+    """
+
+    __slots__ = []
+
+    def __call__(
+            self, routing_tables, transceiver, executable_finder, machine,
+            app_id, provenance_file_path, host_limit, report_folder=None,
+            write_report=False, compress_as_much_as_possible=False,
+            write_compressor_iobuf=False):
+        """
+        :param ~pacman.model.routing_tables.MulticastRoutingTables \
+                routing_tables:
+            The uncompressed routing tables
+        :param ~spinnman.transceiver.Transceiver transceiver:
+        :param executable_finder:
+        :type executable_finder:
+            ~spinn_utilities.executable_finder.ExecutableFinder
+        :param ~spinn_machine.Machine machine:
+        :param int app_id:
+        :param str provenance_file_path:
+        :param int host_limit:
+            The most entries, over all the tables that do not fit, to
+            compress on the host
+        :param str report_folder: Where to write the pressure report
+        :param bool write_report: Whether to write the pressure report
+        :param bool compress_as_much_as_possible:
+            Whether on-chip compression goes on after the tables fit
+        :param bool write_compressor_iobuf:
+            Whether to write out the IOBUF of on-chip compressors
+        :raises SpinnFrontEndException: If the tables cannot be made to fit
+        """
+        # pylint: disable=too-many-arguments
+        pressure = routing_table_pressure(routing_tables, machine)
+        compression, reason = choose_compression(pressure, host_limit)
+        logger.info("Routing table compression: {}, as {}",
+                    compression, reason)
+        if write_report and report_folder is not None:
+            self._write_report(
+                os.path.join(report_folder, PRESSURE_REPORT_NAME),
+                pressure, compression, reason)
+
+        if compression == ON_CHIP_COMPRESSION:
+            pair_compression(
+                routing_tables, transceiver, executable_finder, machine,
+                app_id, provenance_file_path, write_compressor_iobuf,
+                compress_as_much_as_possible)
+            return
+        if compression == HOST_COMPRESSION:
+            try:
+                routing_tables = compress_over_capacity(
+                    routing_tables, pressure)
+            except MinimisationFailedError as e:
+                raise SpinnFrontEndException(
+                    "The routing tables cannot be compressed to fit: "
+                    "{}".format(e)) from e
+            # Fail now rather than when the routers refuse the tables
+            still_over = [
+                (x, y) for x, y, n_entries, capacity in routing_table_pressure(
+                    routing_tables, machine)
+                if n_entries > capacity]
+            if still_over:
+                raise SpinnFrontEndException(
+                    "The routing tables of chips {} do not fit even after "
+                    "compression".format(still_over))
+        RoutingTableLoader()(routing_tables, app_id, transceiver, machine)
+
+    @staticmethod
+    def _write_report(path, pressure, compression, reason):
+        """
+        :param str path:
+        :param list(tuple(int, int, int, int)) pressure:
+        :param str compression:
+        :param str reason:
+        """
+        with open(path, "w") as f:
+            f.write("Compression: {}\n".format(compression))
+            f.write("Because: {}\n\n".format(reason))
+            f.write("{:>4} {:>4} {:>8} {:>8} {:>8}\n".format(
+                "x", "y", "entries", "space", "pressure"))
+            for x, y, n_entries, capacity in pressure:
+                f.write("{:>4} {:>4} {:>8} {:>8} {:>7.1f}%\n".format(
+                    x, y, n_entries, capacity,
+                    100.0 * n_entries / max(capacity, 1)))
@@ -0,0 +1,170 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
+from spinnman.connections.udp_packet_connections import (
+    BMPConnection, BootConnection, SCAMPConnection)
+from spinnman.transceiver import Transceiver
+from spinnman.utilities.appid_tracker import AppIdTracker
+from spinnman.utilities.utility_functions import (
+    work_out_bmp_from_machine_details)
+from spinn_front_end_common.interface.interface_functions import (
+    MachineGenerator)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinnaker_graph_front_end.machine_cache import (
+    MachineCache, read_boot_signature)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+
+class MachineCacheTransceiver(Transceiver):
+    """ A transceiver that takes the description of its machine from a\
+        machine cache when the machine has not been rebooted since it was\
+        put there, and otherwise discovers the machine and puts it there.
+
+    Checking the cache costs a read of the boot signature of the machine;
+    if that or the size of the machine does not match, the machine is
+    discovered as usual.
+    """
+
+    __slots__ = ["__cache", "__cache_key"]
+
+    def __init__(self, version, cache, cache_key, **kwargs):
+        """
+        :param int version: The version of the boards in the machine
+        :param MachineCache cache: Where machine descriptions are kept
+        :param tuple cache_key:
+            What the machine is discovered with; anything that changes what
+            discovery finds must be in it
+        :param kwargs: The other parameters of
+            :py:class:`~spinnman.transceiver.Transceiver`
+        """
+        self.__cache = cache
+        self.__cache_key = cache_key
+        super().__init__(version, **kwargs)
+
+    @overrides(Transceiver._update_machine)
+    def _update_machine(self):
+        signature = read_boot_signature(self)
+        dimensions = self.get_machine_dimensions()
+        machine = self.__cache.load(
+            self.__cache_key, signature, dimensions.width, dimensions.height)
+        if machine is None:
+            super()._update_machine()
+            self.__cache.store(
+                self.__cache_key, signature, self.get_machine_details())
+            return
+
+        # Leave the transceiver as discovery would have done
+        self.scamp_connection_selector.set_machine(machine)
+        machine.add_spinnaker_links()
+        machine.add_fpga_links()
+        self._machine = machine
+        self._app_id_tracker = AppIdTracker()
+        logger.info(
+            "Using the kept description of the machine, which has {}",
+            machine.cores_and_link_output_string())
+
+
+def _connections(hostname, version, bmp_connection_data, auto_detect_bmp,
+                 scamp_connections, boot_port_no):
+    """ Make the connections to a machine, as\
+        :py:func:`~spinnman.transceiver.create_transceiver_from_hostname`\
+        does.
+
+    :rtype: list(~spinnman.connections.abstract_classes.Connection)
+    """
+    logger.info("Creating transceiver for {}", hostname)
+    connections = list()
+    if version >= 4 and auto_detect_bmp and not bmp_connection_data:
+        bmp_connection_data = [
+            work_out_bmp_from_machine_details(hostname, None)]
+    for conn_data in bmp_connection_data or ():
+        connections.append(BMPConnection(conn_data))
+    if scamp_connections is None:
+        connections.append(SCAMPConnection(remote_host=hostname))
+    connections.append(BootConnection(
+        remote_host=hostname, remote_port=boot_port_no))
+    return connections
+
+
+class CachedMachineGenerator(MachineGenerator):
+    """ Makes a transceiver and a machine object, as the machine generator\
+        does, but with a :py:class:`MachineCacheTransceiver` so that the\
+        machine object comes from a cache on disk when the machine has not\
+        been rebooted since it was put there.
+    """
+
+    __slots__ = []
+
+    def __call__(
+            self, hostname, bmp_details, downed_chips, downed_cores,
+            downed_links, board_version, auto_detect_bmp,
+            scamp_connection_data, boot_port_num, reset_machine_on_start_up,
+            report_waiting_logs, max_sdram_size=None, repair_machine=False,
+            ignore_bad_ethernets=True, default_report_directory=None,
+            machine_cache_directory=None):
+        """
+        :param str machine_cache_directory:
+            Where the machine descriptions are kept, or ``None`` for the
+            default place
+
+        The other parameters are as for
+        :py:class:`~spinn_front_end_common.interface.interface_functions.MachineGenerator`.
+
+        :return: Transceiver, and description of machine it is connected to
+        :rtype: tuple(~spinnman.transceiver.Transceiver,
+            ~spinn_machine.Machine)
+        """
+        # pylint: disable=too-many-arguments
+        if reset_machine_on_start_up:
+            # The machine will be booted again, so nothing kept is valid
+            return super().__call__(
+                hostname, bmp_details, downed_chips, downed_cores,
+                downed_links, board_version, auto_detect_bmp,
+                scamp_connection_data, boot_port_num,
+                reset_machine_on_start_up, report_waiting_logs,
+                max_sdram_size, repair_machine, ignore_bad_ethernets,
+                default_report_directory)
+        if board_version is None:
+            raise ConfigurationException(
+                "Please set a machine version number in the "
+                "corresponding configuration (cfg) file")
+
+        if scamp_connection_data is not None:
+            scamp_connection_data = [
+                self._parse_scamp_connection(piece)
+                for piece in scamp_connection_data.split(":")]
+        key = (hostname, board_version, downed_chips, downed_cores,
+               downed_links, max_sdram_size, repair_machine,
+               ignore_bad_ethernets)
+        txrx = MachineCacheTransceiver(
+            board_version, MachineCache(machine_cache_directory), key,
+            connections=_connections(
+                hostname, board_version,
+                self._parse_bmp_details(bmp_details), auto_detect_bmp,
+                scamp_connection_data, boot_port_num),
+            ignore_chips=downed_chips, ignore_cores=downed_cores,
+            ignore_links=downed_links,
+            scamp_connections=scamp_connection_data,
+            max_sdram_size=max_sdram_size, repair_machine=repair_machine,
+            ignore_bad_ethernets=ignore_bad_ethernets,
+            default_report_directory=default_report_directory,
+            report_waiting_logs=report_waiting_logs)
+        txrx.ensure_board_is_ready()
+        txrx.discover_scamp_connections()
+        return txrx.get_machine_details(), txrx
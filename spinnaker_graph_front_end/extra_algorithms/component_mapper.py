@@ -0,0 +1,301 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+import multiprocessing
+import os
+from spinn_utilities.progress_bar import ProgressBar
+from pacman.exceptions import (
+    PacmanInvalidParameterException, PacmanPlaceException, PacmanValueError)
+from pacman.model.constraints.placer_constraints import (
+    AbstractPlacerConstraint, SameChipAsConstraint)
+from pacman.model.graphs import AbstractVirtual
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ResourceContainer
+from pacman.model.routing_table_by_partition import (
+    MulticastRoutingTableByPartition)
+from pacman.operations.router_algorithms import NerRoute
+from pacman.utilities.algorithm_utilities.placer_algorithm_utilities import (
+    get_same_chip_vertex_groups, sort_vertices_by_known_constraints)
+from pacman.utilities.utility_objs import ResourceTracker
+from .locality_placer import LocalityPlacer
+
+#: The machine to route on, in each process of the pool
+_worker_machine = None
+
+
+def connected_components(machine_graph):
+    """ Split the vertices of a graph into those that are joined, directly\
+        or not, by edges or by :py:class:`SameChipAsConstraint`.
+
+    :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+    :return: The vertices of each component, in the order of the graph
+    :rtype: list(list(~pacman.model.graphs.machine.MachineVertex))
+    """
+    parent = {vertex: vertex for vertex in machine_graph.vertices}
+
+    def find(vertex):
+        while parent[vertex] is not vertex:
+            parent[vertex] = parent[parent[vertex]]
+            vertex = parent[vertex]
+        return vertex
+
+    def join(vertex_a, vertex_b):
+        root_a = find(vertex_a)
+        root_b = find(vertex_b)
+        if root_a is not root_b:
+            parent[root_b] = root_a
+
+    for edge in machine_graph.edges:
+        join(edge.pre_vertex, edge.post_vertex)
+    for vertex in machine_graph.vertices:
+        for constraint in vertex.constraints:
+            if isinstance(constraint, SameChipAsConstraint):
+                join(vertex, constraint.vertex)
+
+    components = OrderedDict()
+    for vertex in machine_graph.vertices:
+        components.setdefault(find(vertex), list()).append(vertex)
+    return list(components.values())
+
+
+def route_component(machine, locations, partitions):
+    """ Route the multicast partitions of one component, described without\
+        its vertices so that it can be sent to another process.
+
+    :param ~spinn_machine.Machine machine:
+    :param list(tuple(int, int, int)) locations:
+        The chip and core of each vertex of the component
+    :param list(tuple(int, str, list(int))) partitions:
+        The index of the vertex that sends, the identifier and the indices
+        of the vertices that receive of each multicast partition
+    :return: The routing entries, each with the chip it is on and the index
+        of its partition
+    :rtype: list(tuple(int, int, int,
+        ~pacman.model.routing_table_by_partition.MulticastRoutingTableByPartitionEntry))
+    """
+    graph = MachineGraph("component")
+    vertices = [SimpleMachineVertex(ResourceContainer()) for _ in locations]
+    placements = Placements()
+    for vertex, (x, y, p) in zip(vertices, locations):
+        graph.add_vertex(vertex)
+        placements.add_placement(Placement(vertex, x, y, p))
+    index_of = dict()
+    for index, (pre, identifier, posts) in enumerate(partitions):
+        for post in posts:
+            graph.add_edge(
+                MachineEdge(vertices[pre], vertices[post]), identifier)
+        index_of[graph.get_outgoing_edge_partition_starting_at_vertex(
+            vertices[pre], identifier)] = index
+
+    routing_tables = NerRoute()(graph, machine, placements)
+    return [
+        (x, y, index_of[partition], entry)
+        for x, y in routing_tables.get_routers()
+        for partition, entry in routing_tables.get_entries_for_router(
+            x, y).items()]
+
+
+def _set_worker_machine(machine):
+    """
+    :param ~spinn_machine.Machine machine:
+    """
+    global _worker_machine  # pylint: disable=global-statement
+    _worker_machine = machine
+
+
+def _route_in_worker(component):
+    """
+    :param tuple(list, list) component:
+        The arguments of :py:func:`route_component` after the machine
+    """
+    return route_component(_worker_machine, *component)
+
+
+class ComponentMapper(LocalityPlacer):
+    """ Places and routes a graph made of parts that are not connected to\
+        each other, routing the parts at the same time in a pool of\
+        processes.
+
+    Each part (connected component) of the graph that has no placer
+    constraints is placed by locality, as by :py:class:`LocalityPlacer`, on
+    the cores that follow on from those of the part before it along a
+    Hilbert curve, so that each part takes up a run of chips and the routes
+    of the parts rarely cross. Parts with placer constraints are placed
+    first, as by :py:class:`LocalityPlacer`, on chips that the other parts
+    then do not use. Each part is then routed by NER in a process of the
+    pool, with the biggest parts first, and the routes are merged; with one
+    part, or one process, the graph is placed by :py:class:`LocalityPlacer`
+    and routed by NER as normal. Keys are allocated to the whole graph
+    afterwards.
+
+    .. note::
+        Routing is bound by the CPU, so threads would not run it at the
+        same time; the pool is one of processes, and is only used when
+        more than one is asked for. Where processes are started by
+        *spawning* (the default on macOS and Windows), each of them imports
+        the ``__main__`` module of the program, so a script that maps with
+        more than one process must only set up and run its graph under
+        ``if __name__ == "__main__":``.
+    """
+
+    __slots__ = []
+
+    def __call__(self, machine_graph, machine, plan_n_timesteps,
+                 n_processes=1):
+        """
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+            The graph to map
+        :param ~spinn_machine.Machine machine: The machine to map it on
+        :param int plan_n_timesteps: number of timesteps to plan for
+        :param n_processes:
+            How many processes to route in; ``None`` for one a CPU. Any more
+            than one need the guard in the note above
+        :type n_processes: int or None
+        :return: The placements and the routes
+        :rtype: tuple(~pacman.model.placements.Placements,
+            ~pacman.model.routing_table_by_partition.MulticastRoutingTableByPartition)
+        :raises PacmanPlaceException: If the vertices do not all fit
+        """
+        components = connected_components(machine_graph)
+        if n_processes is None:
+            n_processes = os.cpu_count() or 1
+        n_processes = min(n_processes, len(components))
+        if n_processes <= 1:
+            placements = super().__call__(
+                machine_graph, machine, plan_n_timesteps)
+            return placements, NerRoute()(machine_graph, machine, placements)
+
+        self._check_constraints(
+            machine_graph.vertices,
+            additional_placement_constraints={SameChipAsConstraint})
+        placements = self._place_components(
+            machine_graph, components, machine, plan_n_timesteps)
+        return placements, self._route_components(
+            machine_graph, components, machine, placements, n_processes)
+
+    def _place_components(
+            self, machine_graph, components, machine, plan_n_timesteps):
+        """
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        :param list(list(~pacman.model.graphs.machine.MachineVertex)) \
+                components:
+        :param ~spinn_machine.Machine machine:
+        :param int plan_n_timesteps:
+        :rtype: ~pacman.model.placements.Placements
+        :raises PacmanPlaceException: If the vertices do not all fit
+        """
+        progress = ProgressBar(
+            machine_graph.n_vertices, "Placing graph components")
+        placements = Placements()
+        resource_tracker = ResourceTracker(
+            machine, plan_n_timesteps, self._generate_hilbert_chips(machine))
+        vertices_on_same_chip = get_same_chip_vertex_groups(machine_graph)
+
+        # Parts that are tied to chips, or to each other, go where they can
+        free_components = list()
+        for component in components:
+            if all(len(vertices_on_same_chip[vertex]) == 1 and
+                   not isinstance(vertex, AbstractVirtual) and
+                   not any(isinstance(constraint, AbstractPlacerConstraint)
+                           for constraint in vertex.constraints)
+                   for vertex in component):
+                free_components.append(component)
+                continue
+            placed = set()
+            for vertex in sort_vertices_by_known_constraints(
+                    self._locality_order(machine_graph, component)):
+                if vertex not in placed:
+                    group = vertices_on_same_chip[vertex]
+                    self._place_group(
+                        group, resource_tracker,
+                        self._generate_hilbert_chips(machine), placements)
+                    placed.update(group)
+            progress.update(len(component))
+
+        # The rest fill the chips along the curve, one part after another
+        used = {(placement.x, placement.y)
+                for placement in placements.placements}
+        chips = [chip for chip in self._generate_hilbert_chips(machine)
+                 if machine.is_chip_at(*chip) and chip not in used]
+        index = 0
+        for component in free_components:
+            for vertex in self._locality_order(machine_graph, component):
+                while True:
+                    if index >= len(chips):
+                        raise PacmanPlaceException(
+                            "Only {} of the {} vertices fit on the "
+                            "machine".format(
+                                placements.n_placements,
+                                machine_graph.n_vertices))
+                    try:
+                        self._place_group(
+                            [vertex], resource_tracker, [chips[index]],
+                            placements)
+                        break
+                    except (PacmanInvalidParameterException,
+                            PacmanValueError):
+                        # The resource tracker forgets chips once they are
+                        # full, and then says that they are not valid
+                        index += 1
+            progress.update(len(component))
+        progress.end()
+        return placements
+
+    @staticmethod
+    def _route_components(
+            machine_graph, components, machine, placements, n_processes):
+        """
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        :param list(list(~pacman.model.graphs.machine.MachineVertex)) \
+                components:
+        :param ~spinn_machine.Machine machine:
+        :param ~pacman.model.placements.Placements placements:
+        :param int n_processes:
+        :rtype: MulticastRoutingTableByPartition
+        """
+        # The biggest go first, so that they are not left until last
+        components = sorted(components, key=len, reverse=True)
+        described = list()
+        partitions = list()
+        for component in components:
+            index_of = {vertex: index for index, vertex in enumerate(
+                component)}
+            locations = list()
+            component_partitions = list()
+            for vertex in component:
+                placement = placements.get_placement_of_vertex(vertex)
+                locations.append((placement.x, placement.y, placement.p))
+                component_partitions.extend(
+                    machine_graph.
+                    get_multicast_edge_partitions_starting_at_vertex(vertex))
+            described.append((locations, [
+                (index_of[partition.pre_vertex], partition.identifier,
+                 [index_of[edge.post_vertex] for edge in partition.edges])
+                for partition in component_partitions]))
+            partitions.append(component_partitions)
+
+        with multiprocessing.Pool(
+                n_processes, _set_worker_machine, (machine, )) as pool:
+            routes = pool.map(_route_in_worker, described, chunksize=1)
+
+        routing_tables = MulticastRoutingTableByPartition()
+        for component_partitions, entries in zip(partitions, routes):
+            for x, y, index, entry in entries:
+                routing_tables.add_path_entry(
+                    entry, x, y, component_partitions[index])
+        return routing_tables
@@ -0,0 +1,59 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinnaker_graph_front_end.utilities.abstract_has_graph_invariants import (
+    AbstractHasGraphInvariants)
+from spinnaker_graph_front_end.utilities.degree_index import DegreeIndex
+
+#: The most problems that are listed when a graph is rejected
+MAX_PROBLEMS_REPORTED = 20
+
+
+class GraphValidator(object):
+    """ Rejects a machine graph, before it is mapped, if any vertex that is\
+        :py:class:`AbstractHasGraphInvariants` does not have the edges that\
+        it needs.
+
+    The degrees of the vertices are counted once, in a single pass over the
+    graph, so the check takes time linear in the size of the graph.
+    """
+
+    __slots__ = []
+
+    def __call__(self, machine_graph):
+        """
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        :raises ConfigurationException: If any vertex does not have the
+            edges that it needs
+        """
+        vertices = [
+            vertex for vertex in machine_graph.vertices
+            if isinstance(vertex, AbstractHasGraphInvariants)]
+        if not vertices:
+            return
+        degree_index = DegreeIndex(machine_graph)
+        problems = list()
+        for vertex in vertices:
+            problems.extend(
+                vertex.graph_invariants.violations(vertex, degree_index))
+        if not problems:
+            return
+        message = "The graph is not as its vertices need:\n    " + \
+            "\n    ".join(problems[:MAX_PROBLEMS_REPORTED])
+        if len(problems) > MAX_PROBLEMS_REPORTED:
+            message += "\n    and {} more problems".format(
+                len(problems) - MAX_PROBLEMS_REPORTED)
+        raise ConfigurationException(message)
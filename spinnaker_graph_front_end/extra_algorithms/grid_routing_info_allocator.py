@@ -0,0 +1,236 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+import logging
+import numpy
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.progress_bar import ProgressBar
+from pacman.exceptions import PacmanRouteInfoAllocationException
+from pacman.model.constraints.key_allocator_constraints import (
+    AbstractKeyAllocatorConstraint, ContiguousKeyRangeContraint,
+    FixedKeyAndMaskConstraint, FixedMaskConstraint, ShareKeyConstraint)
+from pacman.model.routing_info import BaseKeyAndMask, RoutingInfo
+from pacman.operations.routing_info_allocator_algorithms import (
+    MallocBasedRoutingInfoAllocator)
+from pacman.utilities.algorithm_utilities.routing_info_allocator_utilities \
+    import check_types_of_edge_constraint, get_mulitcast_edge_groups
+from pacman.utilities.utility_calls import (
+    check_algorithm_can_support_constraints)
+from spinnaker_graph_front_end.utilities.abstract_has_grid_position import (
+    AbstractHasGridPosition)
+from .locality_placer import tile_side
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+_ALL_ONES = 0xFFFFFFFF
+
+
+def morton_index(x, y, levels):
+    """ The distances along a Z-order (Morton) curve of points in a square\
+        of side ``2 ** levels``; every aligned block of ``4 ** n`` distances\
+        is a square of side ``2 ** n``.
+
+    :param ~numpy.ndarray x: The x-coordinates of the points
+    :param ~numpy.ndarray y: The y-coordinates of the points
+    :param int levels: The number of levels of the curve
+    :rtype: ~numpy.ndarray
+    """
+    x = numpy.array(x, dtype="int64")
+    y = numpy.array(y, dtype="int64")
+    distance = numpy.zeros(len(x), dtype="int64")
+    for bit in range(levels):
+        distance |= ((x >> bit) & 1) << (2 * bit)
+        distance |= ((y >> bit) & 1) << (2 * bit + 1)
+    return distance
+
+
+def _power_of_two_at_least(n):
+    """
+    :param int n:
+    :rtype: int
+    """
+    return 1 << (max(n, 1) - 1).bit_length()
+
+
+class GridRoutingInfoAllocator(MallocBasedRoutingInfoAllocator):
+    """ A routing key allocator that gives neighbouring sources keys that\
+        a router can match with one mask, so that their routing entries can\
+        be compressed together.
+
+    Partitions with constraints on their keys are allocated as by
+    :py:class:`MallocBasedRoutingInfoAllocator`. The other partitions of
+    vertices that are :py:class:`AbstractHasGridPosition` then share one
+    aligned block of keys, in which each position of the grid has a slot of
+    the same power-of-two size. The grid is cut into the same square tiles
+    as :py:class:`LocalityPlacer` puts on each chip, each tile has an
+    aligned block of slots at its distance along a Z-order curve of the
+    tiles, and each position its slot at its distance along a Z-order curve
+    within its tile; the keys of a tile, and of any aligned square of
+    ``2 ** n`` by ``2 ** n`` positions in a tile or of tiles, are therefore
+    covered by one key and mask, so a router that sends all of them the same
+    way needs only one entry for them. The remaining partitions are
+    allocated in turn with those that go to the same vertices next to each
+    other, so that they too can often share an entry.
+    """
+
+    __slots__ = []
+
+    def __call__(self, machine_graph, n_keys_map, machine=None):
+        """
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        :param ~pacman.model.routing_info.AbstractMachinePartitionNKeysMap \
+                n_keys_map:
+        :param machine:
+            The machine that the graph is placed on, for the size of the
+            tiles of the grid; without it, each tile is one position
+        :type machine: ~spinn_machine.Machine or None
+        :rtype: ~pacman.model.routing_info.RoutingInfo
+        :raises PacmanRouteInfoAllocationException:
+        """
+        self._n_keys_map = n_keys_map
+        check_algorithm_can_support_constraints(
+            constrained_vertices=machine_graph.outgoing_edge_partitions,
+            supported_constraints=[
+                FixedMaskConstraint, FixedKeyAndMaskConstraint,
+                ContiguousKeyRangeContraint, ShareKeyConstraint],
+            abstract_constraint_type=AbstractKeyAllocatorConstraint)
+        check_types_of_edge_constraint(machine_graph)
+
+        routing_infos = RoutingInfo()
+        (fixed_keys, shared_keys, fixed_masks, fixed_fields, continuous,
+         noncontinuous) = get_mulitcast_edge_groups(machine_graph)
+        progress = ProgressBar(
+            machine_graph.n_outgoing_edge_partitions,
+            "Allocating routing keys by grid position")
+
+        # Keys that are asked for go first, so that they are free
+        for group in progress.over(fixed_keys, False):
+            self._allocate_fixed_keys(group, routing_infos)
+        for group in progress.over(fixed_masks, False):
+            self._allocate_fixed_masks(group, routing_infos)
+        for group in progress.over(fixed_fields, False):
+            self._allocate_fixed_fields(group, routing_infos)
+        for group in progress.over(shared_keys, False):
+            self._allocate_share_key(group, routing_infos)
+
+        grid_groups = list()
+        other_groups = list()
+        for group in continuous:
+            self.__sort_group(group, True, grid_groups, other_groups)
+        for group in noncontinuous:
+            self.__sort_group(group, False, grid_groups, other_groups)
+
+        if grid_groups:
+            try:
+                self._allocate_grid(
+                    [group[0] for group in grid_groups], routing_infos,
+                    1 if machine is None else tile_side(machine))
+            except PacmanRouteInfoAllocationException:
+                logger.warning(
+                    "No single block of keys is free for the {} grid "
+                    "partitions; allocating them one at a time",
+                    len(grid_groups))
+                other_groups = [
+                    (group, True) for group in grid_groups] + other_groups
+            progress.update(len(grid_groups))
+
+        for group, contiguous in progress.over(
+                self._by_destinations(other_groups)):
+            self._allocate_other_groups(group, routing_infos, contiguous)
+        return routing_infos
+
+    @staticmethod
+    def __sort_group(group, contiguous, grid_groups, other_groups):
+        """
+        :param ConstraintGroup group:
+        :param bool contiguous:
+        :param list(ConstraintGroup) grid_groups:
+        :param list(tuple(ConstraintGroup, bool)) other_groups:
+        """
+        if len(group) == 1 and isinstance(
+                group[0].pre_vertex, AbstractHasGridPosition):
+            grid_groups.append(group)
+        else:
+            other_groups.append((group, contiguous))
+
+    def _allocate_grid(self, partitions, routing_infos, side):
+        """ Allocate one block of keys to the partitions of vertices in a\
+            grid, with the keys of each tile of the grid at its distance\
+            along a Z-order curve of the tiles, and the keys of each\
+            position in a tile at its distance along a Z-order curve of the\
+            tile.
+
+        :param list(AbstractSingleSourcePartition) partitions:
+        :param ~pacman.model.routing_info.RoutingInfo routing_infos:
+        :param int side: The side of a tile of the grid
+        :raises PacmanRouteInfoAllocationException:
+            If there is no block big enough free
+        """
+        # The partitions at each position, biggest first so that each
+        # starts at a multiple of its own size within the slot
+        by_position = OrderedDict()
+        for partition in partitions:
+            by_position.setdefault(
+                tuple(partition.pre_vertex.grid_position), list()).append(
+                    (_power_of_two_at_least(
+                        self._n_keys_map.n_keys_for_partition(partition)),
+                     partition))
+        for in_slot in by_position.values():
+            in_slot.sort(key=lambda size_partition: -size_partition[0])
+        slot_size = max(
+            _power_of_two_at_least(sum(size for size, _ in in_slot))
+            for in_slot in by_position.values())
+
+        positions = numpy.array(list(by_position), dtype="int64")
+        positions -= positions.min(axis=0)
+        tiles = positions // side
+        tile_levels = (side - 1).bit_length()
+        levels = int(tiles.max()).bit_length()
+        distances = (
+            morton_index(tiles[:, 0], tiles[:, 1], levels) <<
+            (2 * tile_levels)) | morton_index(
+                positions[:, 0] % side, positions[:, 1] % side, tile_levels)
+        n_keys = slot_size << (2 * (levels + tile_levels))
+        if n_keys > 1 << 32:
+            raise PacmanRouteInfoAllocationException(
+                "A grid of {} by {} positions needs more than 2^32 "
+                "keys".format(*(positions.max(axis=0) + 1)))
+        [block] = self._allocate_keys_and_masks(None, None, n_keys)
+
+        for in_slot, distance in zip(by_position.values(), distances):
+            key = block.key + int(distance) * slot_size
+            for size, partition in in_slot:
+                self._update_routing_objects(
+                    [BaseKeyAndMask(key, _ALL_ONES & ~(size - 1))],
+                    routing_infos, partition)
+                key += size
+
+    @staticmethod
+    def _by_destinations(groups):
+        """ Put groups that go to the same vertices next to each other,\
+            keeping them otherwise in the order given.
+
+        :param list(tuple(ConstraintGroup, bool)) groups:
+        :rtype: list(tuple(ConstraintGroup, bool))
+        """
+        by_destinations = OrderedDict()
+        for group, contiguous in groups:
+            destinations = frozenset(
+                edge.post_vertex for partition in group
+                for edge in partition.edges)
+            by_destinations.setdefault(destinations, list()).append(
+                (group, contiguous))
+        return [group for same in by_destinations.values() for group in same]
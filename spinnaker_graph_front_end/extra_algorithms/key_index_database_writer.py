@@ -0,0 +1,38 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinnaker_graph_front_end.utilities.key_index import KeyIndex
+
+
+class KeyIndexDatabaseWriter(object):
+    """ Adds the index of keys to the notification database, when there is\
+        one, so that tools reading the database can decode keys by range\
+        lookups.
+
+    This runs as the first of the run algorithms that can use the database,
+    so the index is there before anything is told about the database.
+    """
+
+    __slots__ = []
+
+    def __call__(self, routing_infos, database_file_path):
+        """
+        :param ~pacman.model.routing_info.RoutingInfo routing_infos:
+        :param database_file_path: Where the database is, if there is one
+        :type database_file_path: str or None
+        """
+        if database_file_path is None:
+            return
+        KeyIndex(routing_infos).write_to_database(database_file_path)
@@ -0,0 +1,236 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+import itertools
+import math
+import numpy
+from spinn_utilities.progress_bar import ProgressBar
+from pacman.model.constraints.placer_constraints import SameChipAsConstraint
+from pacman.model.placements import Placement, Placements
+from pacman.operations.rigged_algorithms import HilbertPlacer
+from pacman.utilities.algorithm_utilities.placer_algorithm_utilities import (
+    get_same_chip_vertex_groups, sort_vertices_by_known_constraints)
+from pacman.utilities.utility_objs import ResourceTracker
+from spinnaker_graph_front_end.utilities.abstract_has_grid_position import (
+    AbstractHasGridPosition)
+
+
+def hilbert_index(x, y, levels):
+    """ The distances along a Hilbert curve of points in a square of side\
+        ``2 ** levels``.
+
+    :param ~numpy.ndarray x: The x-coordinates of the points
+    :param ~numpy.ndarray y: The y-coordinates of the points
+    :param int levels: The number of levels of the curve
+    :rtype: ~numpy.ndarray
+    """
+    x = numpy.array(x, dtype="int64")
+    y = numpy.array(y, dtype="int64")
+    distance = numpy.zeros(len(x), dtype="int64")
+    side = 1 << levels
+    s = side >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        distance += s * s * ((3 * rx) ^ ry)
+        # Turn the quadrant so that the curve within it starts at its origin
+        flip = rx & ~ry
+        x[flip] = side - 1 - x[flip]
+        y[flip] = side - 1 - y[flip]
+        swap = ~ry
+        x[swap], y[swap] = y[swap], x[swap]
+        s >>= 1
+    return distance
+
+
+def tile_side(machine):
+    """ The side of the largest square tile of a grid that fits in the\
+        cores of a chip; the :py:class:`LocalityPlacer` puts each such tile\
+        of vertices that are :py:class:`AbstractHasGridPosition` on a chip.
+
+    :param ~spinn_machine.Machine machine:
+    :rtype: int
+    """
+    return max(1, int(math.sqrt(machine.boot_chip.n_user_processors)))
+
+
+class LocalityPlacer(HilbertPlacer):
+    """ A placer that keeps vertices that talk to each other on the same or\
+        neighbouring chips.
+
+    Vertices that are :py:class:`AbstractHasGridPosition` are cut into square
+    tiles of the grid, each small enough to fit on one chip, and each tile
+    goes to the chip at the same place in the machine as the tile is in the
+    tiling; if the tiling is bigger than the machine, tiles go to chips
+    along a Hilbert curve instead, in the order of the tiles along a Hilbert
+    curve of their own, so that neighbouring tiles still mostly land on
+    neighbouring chips. Other vertices are placed in breadth-first order of
+    the graph, filling chips along a Hilbert curve, so that the vertices
+    that they are connected to are placed just before or after them.
+    Vertices that do not fit where they are meant to go are placed on the
+    first chip along the Hilbert curve that has room.
+    """
+
+    __slots__ = []
+
+    def __call__(self, machine_graph, machine, plan_n_timesteps):
+        """
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+            The graph to place
+        :param ~spinn_machine.Machine machine: The machine to place it on
+        :param int plan_n_timesteps: number of timesteps to plan for
+        :return: Placements of vertices on the machine
+        :rtype: ~pacman.model.placements.Placements
+        """
+        self._check_constraints(
+            machine_graph.vertices,
+            additional_placement_constraints={SameChipAsConstraint})
+        placements = Placements()
+        chip_of_tile = self._tile_chips(machine_graph, machine)
+        vertices = sort_vertices_by_known_constraints(
+            self._locality_order(machine_graph, machine_graph.vertices))
+
+        progress = ProgressBar(
+            machine_graph.n_vertices, "Placing graph vertices by locality")
+        resource_tracker = ResourceTracker(
+            machine, plan_n_timesteps, self._generate_hilbert_chips(machine))
+        vertices_on_same_chip = get_same_chip_vertex_groups(machine_graph)
+        all_vertices_placed = set()
+        for vertex in progress.over(vertices):
+            if vertex in all_vertices_placed:
+                continue
+            chips = self._generate_hilbert_chips(machine)
+            if vertex in chip_of_tile:
+                chips = itertools.chain([chip_of_tile[vertex]], chips)
+            group = vertices_on_same_chip[vertex]
+            self._place_group(group, resource_tracker, chips, placements)
+            all_vertices_placed.update(group)
+        return placements
+
+    @staticmethod
+    def _place_group(group, resource_tracker, chips, placements):
+        """ Place vertices that must go on the same chip.
+
+        :param list(~pacman.model.graphs.machine.MachineVertex) group:
+        :param ~pacman.utilities.utility_objs.ResourceTracker \
+                resource_tracker:
+        :param iterable(tuple(int, int)) chips: The chips to try, in order
+        :param ~pacman.model.placements.Placements placements:
+            Where to add the placements
+        :raises PacmanValueError: If none of the chips has room
+        """
+        if len(group) > 1:
+            assigned_values = \
+                resource_tracker.allocate_constrained_group_resources([
+                    (vert.resources_required, vert.constraints)
+                    for vert in group], chips)
+            for (x, y, p, _, _), vert in zip(assigned_values, group):
+                placements.add_placement(Placement(vert, x, y, p))
+        else:
+            [vertex] = group
+            (x, y, p, _, _) = resource_tracker.allocate_constrained_resources(
+                vertex.resources_required, vertex.constraints, chips)
+            placements.add_placement(Placement(vertex, x, y, p))
+
+    def _tile_chips(self, machine_graph, machine):
+        """ Work out which chip each vertex with a grid position is meant\
+            to go on.
+
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        :param ~spinn_machine.Machine machine:
+        :rtype: dict(~pacman.model.graphs.machine.MachineVertex,
+            tuple(int, int))
+        """
+        vertices = [vertex for vertex in machine_graph.vertices
+                    if isinstance(vertex, AbstractHasGridPosition)]
+        if not vertices:
+            return dict()
+        positions = numpy.array(
+            [vertex.grid_position for vertex in vertices], dtype="int64")
+        positions -= positions.min(axis=0)
+        tiles = positions // tile_side(machine)
+        tiles_x, tiles_y = tiles.max(axis=0) + 1
+
+        if tiles_x <= machine.width and tiles_y <= machine.height:
+            # The tiling fits, so it can be laid over the machine as it is
+            return {vertex: (int(x), int(y))
+                    for vertex, (x, y) in zip(vertices, tiles)}
+
+        levels = int(max(tiles_x, tiles_y) - 1).bit_length()
+        distances = hilbert_index(tiles[:, 0], tiles[:, 1], levels)
+        tile_ids, tile_of_vertex = numpy.unique(
+            distances, return_inverse=True)
+        chips = itertools.cycle(self._generate_hilbert_chips(machine))
+        chip_of_tile = [next(chips) for _ in range(len(tile_ids))]
+        return {vertex: chip_of_tile[tile]
+                for vertex, tile in zip(vertices, tile_of_vertex)}
+
+    def _locality_order(self, machine_graph, vertices):
+        """ Order vertices so that those that are close in the grid or the\
+            graph are close in the order.
+
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        :param iterable(~pacman.model.graphs.machine.MachineVertex) vertices:
+            The vertices to order
+        :rtype: list(~pacman.model.graphs.machine.MachineVertex)
+        """
+        positioned = list()
+        others = list()
+        for vertex in vertices:
+            if isinstance(vertex, AbstractHasGridPosition):
+                positioned.append(vertex)
+            else:
+                others.append(vertex)
+
+        order = list()
+        if positioned:
+            positions = numpy.array(
+                [vertex.grid_position for vertex in positioned],
+                dtype="int64")
+            positions -= positions.min(axis=0)
+            levels = int(positions.max()).bit_length()
+            distances = hilbert_index(
+                positions[:, 0], positions[:, 1], levels)
+            order.extend(positioned[i] for i in numpy.argsort(
+                distances, kind="stable"))
+        order.extend(self._breadth_first(machine_graph, others))
+        return order
+
+    @staticmethod
+    def _breadth_first(machine_graph, vertices):
+        """ Order vertices breadth first over the edges between them, in\
+            either direction.
+
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        :param list(~pacman.model.graphs.machine.MachineVertex) vertices:
+        :rtype: iterable(~pacman.model.graphs.machine.MachineVertex)
+        """
+        to_visit = set(vertices)
+        for start in vertices:
+            if start not in to_visit:
+                continue
+            to_visit.remove(start)
+            search = deque([start])
+            while search:
+                vertex = search.popleft()
+                yield vertex
+                for edge in itertools.chain(
+                        machine_graph.get_edges_starting_at_vertex(vertex),
+                        machine_graph.get_edges_ending_at_vertex(vertex)):
+                    for neighbour in (edge.pre_vertex, edge.post_vertex):
+                        if neighbour in to_visit:
+                            to_visit.remove(neighbour)
+                            search.append(neighbour)
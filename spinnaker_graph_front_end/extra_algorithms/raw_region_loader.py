@@ -0,0 +1,113 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.progress_bar import ProgressBar
+from spinn_front_end_common.utilities.helpful_functions import (
+    locate_memory_region_for_placement)
+from spinnaker_graph_front_end.utilities.region_layout_vertex import (
+    RegionLayoutVertex)
+
+
+class RawRegionLoader(object):
+    """ Loads the raw regions of region layout vertices straight from the\
+        buffers given to them, once the data specifications have been\
+        executed. Each buffer is written with a single bulk write; if the\
+        extra monitors are available for data in, they are used.
+    """
+
+    __slots__ = [
+        "_core_to_conn_map", "_machine", "_monitors", "_placements", "_txrx"]
+
+    def __init__(self):
+        self._core_to_conn_map = None
+        self._machine = None
+        self._monitors = None
+        self._placements = None
+        self._txrx = None
+
+    def __call__(
+            self, transceiver, machine, machine_graph, placements,
+            uses_advanced_monitors=False, extra_monitor_cores=None,
+            extra_monitor_cores_to_ethernet_connection_map=None,
+            disable_advanced_monitor_usage=False):
+        """
+        :param ~spinnman.transceiver.Transceiver transceiver:
+        :param ~spinn_machine.Machine machine:
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        :param ~pacman.model.placements.Placements placements:
+        :param bool uses_advanced_monitors:
+        :param list(ExtraMonitorSupportMachineVertex) extra_monitor_cores:
+        :param extra_monitor_cores_to_ethernet_connection_map:
+        :type extra_monitor_cores_to_ethernet_connection_map:
+            dict(tuple(int,int), DataSpeedUpPacketGatherMachineVertex)
+        :param bool disable_advanced_monitor_usage:
+        """
+        # pylint: disable=too-many-arguments
+        targets = [
+            vertex for vertex in machine_graph.vertices
+            if isinstance(vertex, RegionLayoutVertex) and
+            vertex.raw_region_data]
+        if not targets:
+            return
+
+        self._txrx = transceiver
+        self._machine = machine
+        self._placements = placements
+        self._monitors = extra_monitor_cores
+        self._core_to_conn_map = extra_monitor_cores_to_ethernet_connection_map
+        use_monitors = bool(
+            uses_advanced_monitors and not disable_advanced_monitor_usage and
+            extra_monitor_cores_to_ethernet_connection_map)
+
+        progress = ProgressBar(targets, "Loading raw region data")
+        if use_monitors:
+            self.__set_router_timeouts()
+        try:
+            for vertex in progress.over(targets):
+                self.__load_vertex(vertex, use_monitors)
+        finally:
+            if use_monitors:
+                self.__reset_router_timeouts()
+
+    def __load_vertex(self, vertex, use_monitors):
+        placement = self._placements.get_placement_of_vertex(vertex)
+        if use_monitors:
+            writer = self.__select_writer(placement.x, placement.y)
+        else:
+            writer = self._txrx.write_memory
+        for region_id, data in vertex.raw_region_data.items():
+            address = locate_memory_region_for_placement(
+                placement, region_id, self._txrx)
+            writer(placement.x, placement.y, address, data)
+
+    def __set_router_timeouts(self):
+        for receiver in self._core_to_conn_map.values():
+            receiver.load_system_routing_tables(
+                self._txrx, self._monitors, self._placements)
+            receiver.set_cores_for_data_streaming(
+                self._txrx, self._monitors, self._placements)
+
+    def __reset_router_timeouts(self):
+        for receiver in self._core_to_conn_map.values():
+            receiver.unset_cores_for_data_streaming(
+                self._txrx, self._monitors, self._placements)
+            receiver.load_application_routing_tables(
+                self._txrx, self._monitors, self._placements)
+
+    def __select_writer(self, x, y):
+        chip = self._machine.get_chip_at(x, y)
+        gatherer = self._core_to_conn_map[
+            chip.nearest_ethernet_x, chip.nearest_ethernet_y]
+        return gatherer.send_data_into_spinnaker
@@ -0,0 +1,131 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.progress_bar import ProgressBar
+from pacman.exceptions import PacmanPlaceException
+from pacman.model.constraints.placer_constraints import (
+    AbstractPlacerConstraint, BoardConstraint, ChipAndCoreConstraint)
+from pacman.model.placements import Placement, Placements
+from pacman.utilities.utility_calls import (
+    check_algorithm_can_support_constraints)
+from pacman.utilities.utility_objs import ResourceTracker
+
+
+def _needs_tracker_search(vertex, resources):
+    """ Whether a vertex must be placed by the resource tracker's own\
+        search, rather than on the next chip that has room for it.
+
+    :param ~pacman.model.graphs.machine.MachineVertex vertex:
+    :param ~pacman.model.resources.ResourceContainer resources:
+    :rtype: bool
+    """
+    return bool(resources.iptags or resources.reverse_iptags or any(
+        isinstance(constraint, AbstractPlacerConstraint)
+        for constraint in vertex.constraints))
+
+
+class SequentialPlacer(object):
+    """ A placer that takes time linear in the size of the graph: it puts\
+        the vertices, in the order of the graph, on the cores of one chip\
+        after another, moving to the next chip when a vertex does not fit.
+
+    It does not look at the edges; it is meant for finding out quickly
+    whether, and roughly how, a very large graph maps, rather than for
+    running it well. Vertices with a
+    :py:class:`~pacman.model.constraints.placer_constraints.ChipAndCoreConstraint`
+    or a
+    :py:class:`~pacman.model.constraints.placer_constraints.BoardConstraint`,
+    such as the monitors that the tools add, or with IP tags, are placed
+    first, by a resource tracker; the other vertices then fill the cores
+    and SDRAM that those leave.
+    """
+
+    __slots__ = []
+
+    def __call__(self, machine_graph, machine, plan_n_timesteps):
+        """
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        :param ~spinn_machine.Machine machine:
+        :param int plan_n_timesteps:
+        :rtype: ~pacman.model.placements.Placements
+        :raises PacmanInvalidParameterException:
+            If a vertex has a placer constraint other than those above
+        :raises PacmanPlaceException: If the vertices do not all fit
+        """
+        check_algorithm_can_support_constraints(
+            constrained_vertices=machine_graph.vertices,
+            supported_constraints=[ChipAndCoreConstraint, BoardConstraint],
+            abstract_constraint_type=AbstractPlacerConstraint)
+
+        progress = ProgressBar(
+            machine_graph.n_vertices, "Placing graph vertices in order")
+        placements = Placements()
+
+        # The tracker updates its SDRAM in time linear in the number of
+        # chips, so it only places the few vertices that need its search
+        tracker = ResourceTracker(machine, plan_n_timesteps)
+        ordinary = list()
+        for vertex in machine_graph.vertices:
+            resources = vertex.resources_required
+            if _needs_tracker_search(vertex, resources):
+                x, y, p, _, _ = tracker.allocate_constrained_resources(
+                    resources, vertex.constraints)
+                placements.add_placement(Placement(vertex, x, y, p))
+                progress.update()
+            else:
+                ordinary.append((vertex, resources))
+
+        chips = (chip for chip in machine.chips if not chip.virtual)
+        cores = iter(())
+        sdram = 0
+        for vertex, resources in ordinary:
+            needed = resources.sdram.get_total_sdram(plan_n_timesteps)
+            processor = next(cores, None)
+            while processor is None or needed > sdram:
+                chip = next(chips, None)
+                if chip is None:
+                    raise PacmanPlaceException(
+                        "Only {} of the {} vertices fit on the machine".format(
+                            placements.n_placements,
+                            machine_graph.n_vertices))
+                cores = self.__free_cores(chip, placements)
+                sdram = tracker.sdram_avilable_on_chip(chip.x, chip.y)
+                processor = next(cores, None)
+            if (resources.dtcm.get_value() > processor.dtcm_available or
+                    resources.cpu_cycles.get_value() >
+                    processor.cpu_cycles_available):
+                raise PacmanPlaceException(
+                    "{} needs more DTCM or CPU cycles than a core has".format(
+                        vertex))
+            sdram -= needed
+            placements.add_placement(Placement(
+                vertex, chip.x, chip.y, processor.processor_id))
+            progress.update()
+        progress.end()
+        return placements
+
+    @staticmethod
+    def __free_cores(chip, placements):
+        """ The application cores of a chip that no vertex has been placed\
+            on yet.
+
+        :param ~spinn_machine.Chip chip:
+        :param ~pacman.model.placements.Placements placements:
+        :rtype: iterable(~spinn_machine.Processor)
+        """
+        return (processor for processor in chip.processors
+                if not processor.is_monitor and
+                not placements.is_processor_occupied(
+                    chip.x, chip.y, processor.processor_id))
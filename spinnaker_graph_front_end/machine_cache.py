@@ -0,0 +1,166 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Keeping the descriptions of discovered machines on disk, so that a\
+    board that has not been rebooted since it was last discovered does not\
+    have to be discovered again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import appdirs
+from spinn_utilities.log import FormatAdapter
+from spinn_machine.json_machine import machine_from_json, to_json
+from spinnman.constants import SYSTEM_VARIABLE_BASE_ADDRESS
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+_ONE_WORD = struct.Struct("<I")
+
+#: The version of the layout of the cache files; files of other versions
+#: are ignored
+_CACHE_FORMAT = 1
+
+
+def default_cache_directory():
+    """ Where machine descriptions are kept unless configured otherwise.
+
+    :rtype: str
+    """
+    return os.path.join(
+        appdirs.user_cache_dir("spinnaker_graph_front_end"), "machines")
+
+
+def read_boot_signature(transceiver):
+    """ Read the value that the boot chip of a machine was given when it\
+        was booted, which changes with every boot.
+
+    :param ~spinnman.transceiver.Transceiver transceiver:
+    :rtype: int
+    """
+    address = (SYSTEM_VARIABLE_BASE_ADDRESS +
+               SystemVariableDefinition.boot_signature.offset)
+    return _ONE_WORD.unpack(
+        transceiver.read_memory(0, 0, address, _ONE_WORD.size))[0]
+
+
+class MachineCache(object):
+    """ The machine descriptions kept in a directory, one file for each\
+        machine and the settings that it was discovered with.
+
+    A description is only given back for the boot of the machine that it was
+    discovered in, as told by the boot signature of the machine, and only if
+    the machine is still the same size.
+    """
+
+    __slots__ = ["_directory"]
+
+    def __init__(self, directory=None):
+        """
+        :param directory:
+            Where to keep the descriptions, or ``None`` for
+            :py:func:`default_cache_directory`
+        :type directory: str or None
+        """
+        self._directory = directory or default_cache_directory()
+
+    @property
+    def directory(self):
+        """ Where the descriptions are kept.
+
+        :rtype: str
+        """
+        return self._directory
+
+    def path_of(self, key):
+        """ The file in which the description of a machine is kept.
+
+        :param tuple key:
+            The address of the machine, its board version and anything else
+            that changes what is discovered
+        :rtype: str
+        """
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, digest + ".json")
+
+    def load(self, key, boot_signature, width, height):
+        """ Get the kept description of a machine, if it is still valid.
+
+        :param tuple key: What the machine was discovered with
+        :param int boot_signature: The boot signature of the machine now
+        :param int width: The width of the machine now, in chips
+        :param int height: The height of the machine now, in chips
+        :return: The machine, or ``None`` if there is no valid description
+        :rtype: ~spinn_machine.Machine or None
+        """
+        path = self.path_of(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable machine cache file {}", path)
+            return None
+        if (entry.get("format") != _CACHE_FORMAT or
+                entry.get("key") != repr(key) or
+                entry.get("boot_signature") != boot_signature or
+                entry.get("width") != width or
+                entry.get("height") != height):
+            return None
+        try:
+            return machine_from_json(entry["machine"])
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Ignoring bad machine cache file {}", path)
+            return None
+
+    def store(self, key, boot_signature, machine):
+        """ Keep the description of a machine.
+
+        :param tuple key: What the machine was discovered with
+        :param int boot_signature: The boot signature of the machine
+        :param ~spinn_machine.Machine machine: The machine
+        """
+        path = self.path_of(key)
+        entry = {
+            "format": _CACHE_FORMAT,
+            "key": repr(key),
+            "boot_signature": boot_signature,
+            "width": machine.width,
+            "height": machine.height,
+            "machine": to_json(machine)}
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            # Write elsewhere first so that readers never see half a file
+            partial = "{}.{}.tmp".format(path, os.getpid())
+            with open(partial, "w") as f:
+                json.dump(entry, f)
+            os.replace(partial, path)
+        except OSError as e:
+            logger.warning("Could not keep the machine description in {}: {}",
+                           path, e)
+
+    def clear(self):
+        """ Forget every kept description.
+        """
+        if not os.path.isdir(self._directory):
+            return
+        for name in os.listdir(self._directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self._directory, name))
@@ -0,0 +1,207 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Keeping allocated machines between one simulator and the next in the\
+    same process, so that back-to-back ``setup()``/``stop()`` cycles do not\
+    each wait for an allocation and a boot.
+"""
+
+import atexit
+import logging
+import threading
+from spinn_utilities.log import FormatAdapter
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.exceptions import SpinnmanIOException, SpinnmanTimeoutException
+from spinnman.messages.scp.impl import GetVersion
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The outputs of the allocator algorithms that the machine generator needs
+ALLOCATION_OUTPUTS = (
+    "IPAddress", "BoardVersion", "BMPDetails", "ResetMachineOnStartupFlag",
+    "AutoDetectBMPFlag", "ScampConnectionData", "BootPortNum")
+
+#: How many times to ask a leased machine if it is there before giving up
+_HEALTH_CHECK_TRIES = 3
+_HEALTH_CHECK_TIMEOUT = 1.0
+
+#: Idle leases, by what was asked for to get them
+_idle_leases = dict()
+_leases_lock = threading.Lock()
+
+
+class MachineLease(object):
+    """ A machine allocation that can outlive the simulator that asked for\
+        it.
+    """
+
+    __slots__ = ["_allocation_outputs", "_controller", "_key", "_timer"]
+
+    def __init__(self, key, controller, allocation_outputs):
+        """
+        :param tuple key: What was asked for to get the machine
+        :param controller: What keeps the allocation alive
+        :type controller: ~spinn_front_end_common.abstract_models.\
+            AbstractMachineAllocationController
+        :param dict(str,object) allocation_outputs:
+            The outputs of the allocator, by the names in
+            :py:data:`ALLOCATION_OUTPUTS`
+        """
+        self._key = key
+        self._controller = controller
+        self._allocation_outputs = dict(allocation_outputs)
+        self._timer = None
+
+    @property
+    def key(self):
+        """ What was asked for to get the machine.
+
+        :rtype: tuple
+        """
+        return self._key
+
+    @property
+    def controller(self):
+        """ What keeps the allocation alive.
+
+        :rtype: ~spinn_front_end_common.abstract_models.\
+            AbstractMachineAllocationController
+        """
+        return self._controller
+
+    @property
+    def allocation_outputs(self):
+        """ The outputs of the allocator, to give to the machine generator\
+            in its place.
+
+        :rtype: dict(str,object)
+        """
+        return dict(self._allocation_outputs)
+
+    @property
+    def ip_address(self):
+        """ The address of the machine.
+
+        :rtype: str
+        """
+        return self._allocation_outputs["IPAddress"]
+
+    def is_healthy(self):
+        """ Whether the machine still answers.
+
+        :rtype: bool
+        """
+        connection = None
+        try:
+            connection = SCAMPConnection(remote_host=self.ip_address)
+            for _ in range(_HEALTH_CHECK_TRIES):
+                connection.send_scp_request(GetVersion(0, 0, 0))
+                try:
+                    connection.receive_scp_response(_HEALTH_CHECK_TIMEOUT)
+                    return True
+                except SpinnmanTimeoutException:
+                    continue
+            return False
+        except (OSError, SpinnmanIOException):
+            return False
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def hold(self, idle_timeout):
+        """ Start counting the time that the machine is idle for, releasing\
+            it if that goes on too long.
+
+        :param float idle_timeout: The most seconds to be idle for
+        """
+        self._timer = threading.Timer(idle_timeout, _expire, (self, ))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def resume(self):
+        """ Stop counting the time that the machine is idle for.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def release(self):
+        """ Give the machine back.
+        """
+        self.resume()
+        self._controller.close()
+
+
+def keep_lease(lease, idle_timeout):
+    """ Keep a machine that is no longer in use, until it is taken or has\
+        been idle for too long.
+
+    :param MachineLease lease: The machine to keep
+    :param float idle_timeout:
+        How many seconds to keep the machine for before releasing it
+    """
+    with _leases_lock:
+        previous = _idle_leases.pop(lease.key, None)
+        _idle_leases[lease.key] = lease
+        lease.hold(idle_timeout)
+    if previous is not None:
+        previous.release()
+    logger.info(
+        "Keeping machine {} for {} seconds for reuse", lease.ip_address,
+        idle_timeout)
+
+
+def take_lease(key):
+    """ Take a kept machine, if there is one for the same request that still\
+        answers. A kept machine that does not answer is released.
+
+    :param tuple key: What is being asked for
+    :rtype: MachineLease or None
+    """
+    with _leases_lock:
+        lease = _idle_leases.pop(key, None)
+        if lease is None:
+            return None
+        lease.resume()
+    if not lease.is_healthy():
+        logger.warning(
+            "Kept machine {} no longer answers; allocating another",
+            lease.ip_address)
+        lease.release()
+        return None
+    logger.info("Reusing kept machine {}", lease.ip_address)
+    return lease
+
+
+def _expire(lease):
+    with _leases_lock:
+        if _idle_leases.get(lease.key) is not lease:
+            return
+        del _idle_leases[lease.key]
+    logger.info("Releasing idle machine {}", lease.ip_address)
+    lease.release()
+
+
+def release_all():
+    """ Release every kept machine.
+    """
+    with _leases_lock:
+        leases = list(_idle_leases.values())
+        _idle_leases.clear()
+    for lease in leases:
+        lease.release()
+
+
+atexit.register(release_all)
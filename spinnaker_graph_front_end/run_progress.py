@@ -0,0 +1,313 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import threading
+import time
+from spinn_utilities.log import FormatAdapter
+from spinnman.model.enums import CPUState
+from spinn_front_end_common.abstract_models import AbstractHasAssociatedBinary
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: States in which a core will not make any more progress
+_STALLED_STATES = frozenset((
+    CPUState.DEAD, CPUState.POWERED_DOWN, CPUState.RUN_TIME_EXCEPTION,
+    CPUState.WATCHDOG))
+
+#: States in which a core has not yet started (or has paused) the run
+_WAITING_STATES = frozenset((
+    CPUState.INITIALISING, CPUState.READY, CPUState.C_MAIN, CPUState.SYNC0,
+    CPUState.SYNC1, CPUState.PAUSED))
+
+
+class RunProgress(object):
+    """ A snapshot of how far the current run has got.
+    """
+
+    __slots__ = [
+        "_elapsed", "_estimated_remaining", "_lagging_cores",
+        "_stalled_cores", "_steps_completed", "_steps_total"]
+
+    def __init__(self, steps_completed, steps_total, elapsed,
+                 estimated_remaining, stalled_cores, lagging_cores):
+        """
+        :param int steps_completed: The estimated steps run so far
+        :param steps_total: The steps the run is for, if known
+        :type steps_total: int or None
+        :param float elapsed: Seconds since the run was started
+        :param estimated_remaining: Estimated seconds until the run ends
+        :type estimated_remaining: float or None
+        :param list(tuple(int,int,int,CPUState)) stalled_cores:
+            Sampled cores that can make no more progress
+        :param list(tuple(int,int,int,CPUState)) lagging_cores:
+            Sampled cores that are not running while others are
+        """
+        self._steps_completed = steps_completed
+        self._steps_total = steps_total
+        self._elapsed = elapsed
+        self._estimated_remaining = estimated_remaining
+        self._stalled_cores = stalled_cores
+        self._lagging_cores = lagging_cores
+
+    @property
+    def steps_completed(self):
+        """ The number of timesteps run so far, estimated from the time\
+            since the cores were first seen running.
+
+        :rtype: int
+        """
+        return self._steps_completed
+
+    @property
+    def steps_total(self):
+        """ The number of timesteps in the run, or ``None`` if the run goes\
+            on until it is stopped or complete.
+
+        :rtype: int or None
+        """
+        return self._steps_total
+
+    @property
+    def elapsed(self):
+        """ The wall-clock time since the run was started, in seconds.
+
+        :rtype: float
+        """
+        return self._elapsed
+
+    @property
+    def estimated_remaining(self):
+        """ The estimated wall-clock time until the run ends, in seconds,\
+            or ``None`` if that cannot be known.
+
+        :rtype: float or None
+        """
+        return self._estimated_remaining
+
+    @property
+    def stalled_cores(self):
+        """ The sampled cores that have failed, with their states.
+
+        :rtype: list(tuple(int,int,int,~spinnman.model.enums.CPUState))
+        """
+        return self._stalled_cores
+
+    @property
+    def lagging_cores(self):
+        """ The sampled cores that are not running although others are,\
+            with their states.
+
+        :rtype: list(tuple(int,int,int,~spinnman.model.enums.CPUState))
+        """
+        return self._lagging_cores
+
+    def __repr__(self):
+        return "RunProgress({}/{} steps, {:.1f}s elapsed, {} stalled, " \
+            "{} lagging)".format(
+                self._steps_completed, self._steps_total, self._elapsed,
+                len(self._stalled_cores), len(self._lagging_cores))
+
+
+class RunProgressMonitor(object):
+    """ Keeps track of the run that is going on, and estimates its progress\
+        from the clock and from the states of a few cores.
+
+    The simulation interface does not publish the tick count of a core, so
+    the steps completed are estimated from the time since a sampled core
+    was first seen running in the current part of the run and the length
+    of a timestep in wall-clock time. Sampling reads the CPU information of
+    at most a few cores, so it is cheap enough to do every second or so.
+    """
+
+    __slots__ = [
+        "_callback", "_callback_thread", "_completed_steps", "_interval",
+        "_lock", "_running_since", "_sample", "_segment_started",
+        "_segment_steps", "_simulator", "_started", "_stop_callbacks",
+        "_total_steps"]
+
+    def __init__(self, simulator):
+        """
+        :param SpiNNaker simulator: The simulator whose runs to follow
+        """
+        self._simulator = simulator
+        self._lock = threading.Lock()
+        self._started = None
+        self._total_steps = None
+        self._completed_steps = 0
+        self._segment_started = None
+        self._segment_steps = None
+        self._running_since = None
+        self._sample = None
+        self._callback = None
+        self._interval = None
+        self._callback_thread = None
+        self._stop_callbacks = threading.Event()
+
+    def set_callback(self, callback, interval=1.0):
+        """ Have a function called with the progress periodically during\
+            each run.
+
+        :param callback:
+            Called with a :py:class:`RunProgress` from a background thread,
+            or ``None`` to stop calling
+        :type callback: callable(RunProgress) or None
+        :param float interval: Seconds between calls
+        """
+        self._callback = callback
+        self._interval = interval
+
+    def run_started(self, total_steps):
+        """ Note that a run has started.
+
+        :param total_steps: The number of steps in the run, if known
+        :type total_steps: int or None
+        """
+        with self._lock:
+            self._started = time.monotonic()
+            self._total_steps = total_steps
+            self._completed_steps = 0
+            self._segment_steps = None
+            self._running_since = None
+        if self._callback is not None:
+            self._stop_callbacks.clear()
+            self._callback_thread = threading.Thread(
+                target=self.__call_back, daemon=True,
+                name="run progress callback")
+            self._callback_thread.start()
+
+    def run_ended(self):
+        """ Note that the run that was going on has ended.
+        """
+        self._stop_callbacks.set()
+        if self._callback_thread is not None:
+            self._callback_thread.join()
+            self._callback_thread = None
+        with self._lock:
+            self._started = None
+
+    def segment_started(self, n_steps):
+        """ Note that the cores are about to be started for a part of the\
+            run.
+
+        :param n_steps:
+            The number of steps in this part, or ``None`` if it goes on until
+            stopped or complete
+        :type n_steps: int or None
+        """
+        with self._lock:
+            self._segment_started = time.monotonic()
+            self._segment_steps = n_steps
+            self._running_since = None
+            # The placements may have changed since the last part
+            self._sample = None
+
+    def segment_ended(self):
+        """ Note that a part of the run has ended. A part of unknown length\
+            carries on in the background, so is left as it is.
+        """
+        with self._lock:
+            if self._segment_steps is not None:
+                self._completed_steps += self._segment_steps
+                self._segment_started = None
+                self._segment_steps = None
+                self._running_since = None
+
+    def __call_back(self):
+        while not self._stop_callbacks.wait(self._interval):
+            progress = self.current_progress()
+            if progress is None:
+                return
+            try:
+                self._callback(progress)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Error in run progress callback")
+
+    def __sampled_cores(self, n_cores):
+        if self._sample is None:
+            cores = sorted(
+                (placement.x, placement.y, placement.p)
+                for placement in self._simulator.placements.placements
+                if isinstance(placement.vertex, AbstractHasAssociatedBinary))
+            # Spread the sample over the whole machine
+            stride = max(1, len(cores) // max(1, n_cores))
+            self._sample = cores[::stride][:n_cores]
+        return self._sample
+
+    def __read_states(self, cores):
+        txrx = self._simulator.transceiver
+        if txrx is None:
+            return []
+        return [
+            (x, y, p, txrx.get_cpu_information_from_core(x, y, p).state)
+            for (x, y, p) in cores]
+
+    def current_progress(self, n_cores=4):
+        """ Estimate the progress of the run going on now.
+
+        :param int n_cores: How many cores to read the states of
+        :return: The progress, or ``None`` if no run is going on
+        :rtype: RunProgress or None
+        """
+        with self._lock:
+            if self._started is None:
+                return None
+            cores = list()
+            if self._simulator.placements is not None and n_cores:
+                cores = self.__sampled_cores(n_cores)
+            segment_started = self._segment_started
+
+        # Reading the cores takes a round trip to each, so it must not hold
+        # up the run noting where it has got to
+        states = self.__read_states(cores)
+
+        with self._lock:
+            if self._started is None:
+                return None
+            now = time.monotonic()
+            if self._segment_started != segment_started:
+                # The states are of a part of the run that has since ended
+                return self.__estimate(now, [], [])
+            stalled = [core for core in states if core[3] in _STALLED_STATES]
+            running = [core for core in states if core[3] == CPUState.RUNNING]
+            lagging = list()
+            if running:
+                lagging = [
+                    core for core in states if core[3] in _WAITING_STATES]
+                if self._running_since is None:
+                    self._running_since = now
+            elif not states and self._segment_started is not None:
+                # No cores to look at (e.g., a virtual machine); the clock
+                # is all there is to go on
+                self._running_since = self._segment_started
+            return self.__estimate(now, stalled, lagging)
+
+    def __estimate(self, now, stalled, lagging):
+        sim = self._simulator
+        step_seconds = (
+            sim.machine_time_step * sim.time_scale_factor / 1000000.0)
+        steps = 0
+        if self._running_since is not None:
+            steps = int((now - self._running_since) / step_seconds)
+        if self._segment_steps is not None:
+            steps = min(steps, self._segment_steps)
+        steps += self._completed_steps
+        remaining = None
+        if self._total_steps is not None:
+            steps = min(steps, self._total_steps)
+            remaining = (self._total_steps - steps) * step_seconds
+        return RunProgress(
+            steps, self._total_steps, now - self._started, remaining,
+            stalled, lagging)
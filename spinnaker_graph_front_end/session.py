@@ -0,0 +1,171 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from contextlib import contextmanager
+import functools
+import threading
+from spinn_front_end_common.utilities import globals_variables
+import spinnaker_graph_front_end as gfe
+
+#: Serialises the use of the simulator global between sessions; a call on a
+#: session, a whole run included, holds it
+_session_lock = threading.RLock()
+
+#: The functions of the module API that are available as session methods
+SESSION_FUNCTIONS = (
+    "run", "run_until_complete", "set_progress_callback", "stop",
+    "read_xml_file", "add_vertex", "add_vertex_instance", "add_machine_vertex",
+    "add_machine_vertex_instance", "add_edge",
+    "add_application_edge_instance", "add_machine_edge",
+    "add_machine_edge_instance", "add_socket_address", "get_txrx",
+    "get_number_of_available_cores_on_machine", "has_ran",
+    "machine_time_step", "no_machine_time_steps", "time_scale_factor",
+    "machine_graph", "application_graph", "routing_infos", "key_index",
+    "placements", "transceiver", "tags", "buffer_manager", "machine",
+    "is_allocated_machine", "use_virtual_machine")
+
+
+@contextmanager
+def _activated(simulator):
+    """ Make a simulator the current one for the duration of the block,\
+        restoring whatever was current before afterwards.
+
+    :param SpiNNaker simulator: The simulator to make current
+    """
+    with _session_lock:
+        previous = _current()
+        globals_variables.set_simulator(simulator)
+        try:
+            yield simulator
+        finally:
+            globals_variables.set_simulator(previous)
+
+
+def _current():
+    """ Get the current simulator, if there is one.
+
+    :rtype: SpiNNaker or None
+    """
+    if globals_variables.has_simulator():
+        return globals_variables.get_simulator()
+    return None
+
+
+class Session(object):
+    """ A simulator of its own, with the functions of the module API as\
+        methods. The module-level functions keep working on the default\
+        simulator, whether or not sessions exist.
+
+    Sessions keep several jobs apart in one program: each has its own
+    configuration, graphs, machine and mapping. They do not make those jobs
+    run at the same time; see the note below.
+
+    A session can be used as a context manager, in which case it is stopped
+    at the end of the block::
+
+        with Session(n_boards_required=1) as session:
+            session.add_machine_vertex_instance(vertex)
+            session.run(100)
+
+    .. note::
+        The tool chain below the front end reads the current simulator from
+        a process-wide global. Each call on a session makes that session
+        current for the duration of the call, under a lock shared by all
+        sessions; so sessions may be used from several threads, but their
+        calls, mapping and runs included, happen one at a time. To map or
+        run several jobs in parallel, give each its own process (e.g., with
+        :py:mod:`multiprocessing`), with one session in each. Only
+        :py:meth:`current_progress` and :py:meth:`stop_run` skip the lock.
+    """
+
+    __slots__ = ["_simulator", "_stopped"]
+
+    def __init__(self, **setup_parameters):
+        """
+        :param setup_parameters:
+            The parameters of :py:func:`~spinnaker_graph_front_end.setup`
+        """
+        self._stopped = False
+        with _session_lock:
+            previous = _current()
+            try:
+                gfe.setup(**setup_parameters)
+                self._simulator = globals_variables.get_simulator()
+            finally:
+                globals_variables.set_simulator(previous)
+
+    @property
+    def simulator(self):
+        """ The simulator of this session.
+
+        :rtype: ~spinnaker_graph_front_end.spinnaker.SpiNNaker
+        """
+        return self._simulator
+
+    @property
+    def stopped(self):
+        """ Whether this session has been stopped.
+
+        :rtype: bool
+        """
+        return self._stopped
+
+    def __getattr__(self, name):
+        if name not in SESSION_FUNCTIONS:
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(
+                    type(self).__name__, name))
+        function = getattr(gfe, name)
+
+        @functools.wraps(function)
+        def in_session(*args, **kwargs):
+            with _activated(self._simulator):
+                result = function(*args, **kwargs)
+            if name == "stop":
+                self._stopped = True
+            return result
+        return in_session
+
+    # These are for use from other threads while a run is going on, so they
+    # go straight to the simulator rather than waiting for the lock
+
+    def current_progress(self, n_cores=4):
+        """ Get an estimate of how far the run of this session has got.
+
+        :param int n_cores: how many cores to read the states of
+        :rtype: ~spinnaker_graph_front_end.run_progress.RunProgress or None
+        """
+        return self._simulator.current_progress(n_cores)
+
+    def stop_run(self):
+        """ Stop a run of this session that goes on until asked to stop.
+        """
+        self._simulator.stop_run()
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(SESSION_FUNCTIONS))
+
+    def close(self):
+        """ Stop the session, unless it is already stopped.
+        """
+        if not self._stopped:
+            self.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -13,18 +13,30 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import itertools
 import logging
+import math
 import os
+from spinn_utilities import conf_loader
 from spinn_utilities.abstract_base import AbstractBase
+from spinn_utilities.configs import CamelCaseConfigParser
 from spinn_utilities.overrides import overrides
 from spinn_utilities.log import FormatAdapter
+from pacman.model.resources import PreAllocatedResourceContainer
+from spinn_front_end_common.interface import config_handler
 from spinn_front_end_common.interface.abstract_spinnaker_base import (
     AbstractSpinnakerBase)
-from spinn_front_end_common.interface.config_handler import ConfigHandler
 from spinn_front_end_common.utilities import SimulatorInterface
 from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.failed_state import FailedState
 from ._version import __version__ as version
+from .extra_algorithms import ALGORITHMS_METADATA_FILE
+from .machine_lease import (
+    ALLOCATION_OUTPUTS, MachineLease, keep_lease, take_lease)
+from .run_progress import RunProgressMonitor
+from .utilities.indexed_executable_finder import IndexedExecutableFinder
+from .utilities.key_index import KeyIndex
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -32,6 +44,151 @@ logger = FormatAdapter(logging.getLogger(__name__))
 CONFIG_FILE_NAME = "spiNNakerGraphFrontEnd.cfg"
 
 
+#: The mapping profile that maps with the algorithms named by the
+#: ``[Mapping]`` options as they are
+DEFAULT_MAPPING_PROFILE = "default"
+#: The mapping profile that maps with the ``[Mapping] fast_...`` algorithms
+#: and without writing reports
+FAST_MAPPING_PROFILE = "fast"
+#: The name of the configuration file of defaults for the fast mapping profile
+FAST_MAPPING_CONFIG_NAME = "fast_mapping.cfg"
+#: The options of ``[Mapping]`` that name the algorithms that map the
+#: machine graph, which the fast mapping profile replaces
+_MAPPING_ALGORITHM_OPTIONS = (
+    "machine_graph_to_machine_algorithms",
+    "machine_graph_to_virtual_machine_algorithms")
+#: The routing key allocator in the ``[Mapping]`` algorithms, which
+#: ``[Mapping] routing_info_allocator`` replaces
+_DEFAULT_ROUTING_INFO_ALLOCATOR = "MallocBasedRoutingInfoAllocator"
+
+#: Parsed configurations, keyed by the files they come from and their mtimes
+_config_cache = dict()
+
+
+def _default_config_files(default_config_paths=(), profile=None):
+    """ The files of defaults that the configuration is read on top of, in\
+        the order that the simulator reads them.
+
+    :param ~collections.abc.Iterable(str) default_config_paths:
+        The extra default configurations given to the simulator
+    :param profile: The mapping profile, if it has defaults of its own
+    :type profile: str or None
+    :rtype: list(str)
+    """
+    files = [
+        os.path.join(
+            os.path.dirname(config_handler.__file__),
+            config_handler.CONFIG_FILE),
+        SpiNNaker.extended_config_path()]
+    files.extend(default_config_paths)
+    if profile == FAST_MAPPING_PROFILE:
+        files.append(os.path.join(
+            os.path.dirname(__file__), FAST_MAPPING_CONFIG_NAME))
+    return files
+
+
+def _user_config_files():
+    """ The places that the user's configuration files are read from.
+
+    :rtype: list(str)
+    """
+    # pylint: disable=protected-access
+    return conf_loader._config_locations(CONFIG_FILE_NAME)
+
+
+def _validation_config_file():
+    """ The file that the configuration is checked against.
+
+    :rtype: str
+    """
+    return os.path.join(
+        os.path.dirname(__file__), SpiNNaker.VALIDATION_CONFIG_NAME)
+
+
+def _config_cache_key(default_files):
+    """ Describe the current state of every file that the configuration\
+        is read from.
+
+    :param list(str) default_files: The files of defaults
+    :rtype: tuple(tuple(str, int or None))
+    """
+    key = list()
+    for source in itertools.chain(
+            default_files, [_validation_config_file()],
+            _user_config_files()):
+        try:
+            key.append((source, os.stat(source).st_mtime_ns))
+        except OSError:
+            key.append((source, None))
+    return tuple(key)
+
+
+def _copy_config(config):
+    """ Copy a parsed configuration, so that changes to the copy do not\
+        leak into the cache.
+
+    :param CamelCaseConfigParser config:
+    :rtype: CamelCaseConfigParser
+    """
+    copied = CamelCaseConfigParser()
+    copied.read_dict(config)
+    return copied
+
+
+def _cache_config(config, default_files):
+    """ Remember a freshly parsed configuration, before anything has\
+        changed it, for the current state of the configuration files.
+
+    :param CamelCaseConfigParser config:
+    :param list(str) default_files: The files of defaults it was read with
+    """
+    _config_cache.clear()
+    _config_cache[_config_cache_key(default_files)] = _copy_config(config)
+
+
+def cached_config(default_config_paths=()):
+    """ Get the configuration as it would be read by\
+        :py:func:`~spinnaker_graph_front_end.setup` with the default mapping\
+        profile, parsing the configuration files only if they have not\
+        been parsed in this process since they last changed.
+
+    .. note::
+        The result is a copy; changing it does not change the cache.
+
+    :param ~collections.abc.Iterable(str) default_config_paths:
+        Extra default configurations, as given to the simulator
+    :rtype: ~spinn_utilities.configs.CamelCaseConfigParser
+    """
+    default_files = _default_config_files(default_config_paths)
+    config = _config_cache.get(_config_cache_key(default_files))
+    if config is None:
+        config = conf_loader.load_config(
+            CONFIG_FILE_NAME, default_files,
+            validation_cfg=_validation_config_file())
+        _cache_config(config, default_files)
+    return _copy_config(config)
+
+
+def _mapping_profile(default_config_paths=()):
+    """ Get the ``[Mapping] mapping_profile`` that the configuration asks\
+        for, without parsing the whole configuration when it is not already\
+        cached.
+
+    :param ~collections.abc.Iterable(str) default_config_paths:
+        Extra default configurations, as given to the simulator
+    :rtype: str
+    """
+    config = _config_cache.get(
+        _config_cache_key(_default_config_files(default_config_paths)))
+    if config is None:
+        # Only these files can change the profile from the default
+        config = CamelCaseConfigParser()
+        config.read(list(default_config_paths) + _user_config_files())
+        if not config.has_option("Mapping", "mapping_profile"):
+            return DEFAULT_MAPPING_PROFILE
+    return config.get("Mapping", "mapping_profile")
+
+
 def _is_allocated_machine(config):
     return (config.get("Machine", "spalloc_server") != "None" or
             config.get("Machine", "remote_spinnaker_url") != "None")
@@ -54,6 +211,9 @@ class SpiNNaker(AbstractSpinnakerBase, GraphFrontEndSimulatorInterface):
     """
     #: The base name of the configuration file (but no path)
     __slots__ = (
+        "_key_index",
+        "_machine_lease",
+        "_progress_monitor",
         "_user_dsg_algorithm"
     )
 
@@ -112,6 +272,11 @@ class SpiNNaker(AbstractSpinnakerBase, GraphFrontEndSimulatorInterface):
         """
         # DSG algorithm store for user defined algorithms
         self._user_dsg_algorithm = dsg_algorithm
+        self._progress_monitor = RunProgressMonitor(self)
+        # The key index, with the routing information it was built from
+        self._key_index = (None, None)
+        # The allocated machine in use, if it can be kept after stop()
+        self._machine_lease = None
 
         front_end_versions = [("SpiNNakerGraphFrontEnd", version)]
 
@@ -120,13 +285,26 @@ class SpiNNaker(AbstractSpinnakerBase, GraphFrontEndSimulatorInterface):
         this_default_config_paths.append(self.extended_config_path())
         if default_config_paths is not None:
             this_default_config_paths.extend(default_config_paths)
+        # The profile's defaults must be in place before the base class
+        # reads the configuration, as it sets up reports as it starts
+        profile = self.__check_mapping_profile(
+            _mapping_profile(default_config_paths or ()))
+        if profile == FAST_MAPPING_PROFILE:
+            this_default_config_paths.append(os.path.join(
+                os.path.dirname(__file__), FAST_MAPPING_CONFIG_NAME))
+
+        # support extra algorithms
+        this_extra_xml_paths = list()
+        this_extra_xml_paths.append(ALGORITHMS_METADATA_FILE)
+        if extra_xml_paths is not None:
+            this_extra_xml_paths.extend(extra_xml_paths)
 
         super().__init__(
             configfile=CONFIG_FILE_NAME,
             executable_finder=executable_finder,
             graph_label=graph_label,
             database_socket_addresses=database_socket_addresses,
-            extra_algorithm_xml_paths=extra_xml_paths,
+            extra_algorithm_xml_paths=this_extra_xml_paths,
             n_chips_required=n_chips_required,
             n_boards_required=n_boards_required,
             default_config_paths=this_default_config_paths,
@@ -134,6 +312,13 @@ class SpiNNaker(AbstractSpinnakerBase, GraphFrontEndSimulatorInterface):
                                         self.VALIDATION_CONFIG_NAME),
             front_end_versions=front_end_versions)
 
+        # share the parse of the files, before anything changes it
+        _cache_config(self.config, _default_config_files(
+            default_config_paths or (), profile))
+        self.__select_routing_info_allocator()
+        if profile == FAST_MAPPING_PROFILE:
+            self.__apply_fast_mapping_profile()
+
         if _is_allocated_machine(self.config) and \
                 n_chips_required is None and n_boards_required is None:
             self.set_n_boards_required(1)
@@ -141,10 +326,22 @@ class SpiNNaker(AbstractSpinnakerBase, GraphFrontEndSimulatorInterface):
         extra_mapping_inputs = dict()
         extra_mapping_inputs["CreateAtomToEventIdMapping"] = self.config.\
             getboolean("Database", "create_routing_info_to_atom_id_mapping")
+        extra_mapping_inputs["RouterCompressionHostLimit"] = self.config.\
+            getint("Mapping", "router_compression_host_limit")
+        extra_mapping_inputs["WriteRoutingTablePressureReport"] = (
+            self.config.getboolean("Reports", "reports_enabled") and
+            self.config.getboolean(
+                "Reports", "write_routing_table_pressure_report"))
+        extra_mapping_inputs["MappingProcesses"] = self._read_config_int(
+            "Mapping", "n_mapping_processes")
 
         self.update_extra_mapping_inputs(extra_mapping_inputs)
+        if self.config.getboolean("Mapping", "validate_graph"):
+            self.extend_extra_mapping_algorithms(["GraphValidator"])
         self.prepend_extra_pre_run_algorithms(extra_pre_run_algorithms)
+        self.prepend_extra_pre_run_algorithms(["KeyIndexDatabaseWriter"])
         self.extend_extra_post_run_algorithms(extra_post_run_algorithms)
+        self.extend_extra_load_algorithms(["RawRegionLoader"])
 
         self.set_up_machine_specifics(host_name)
         self.set_up_timings(machine_time_step, time_scale_factor)
@@ -157,6 +354,44 @@ class SpiNNaker(AbstractSpinnakerBase, GraphFrontEndSimulatorInterface):
         logger.info("Setting machine time step to {} micro-seconds."
                     .format(self.machine_time_step))
 
+    def __select_routing_info_allocator(self):
+        """ Allocate routing keys with ``[Mapping] routing_info_allocator``\
+            in place of the allocator in the mapping algorithms.
+        """
+        allocator = self.config.get("Mapping", "routing_info_allocator")
+        if allocator == _DEFAULT_ROUTING_INFO_ALLOCATOR:
+            return
+        for option in _MAPPING_ALGORITHM_OPTIONS:
+            algorithms = [
+                allocator if name.strip() == _DEFAULT_ROUTING_INFO_ALLOCATOR
+                else name.strip()
+                for name in self.config.get("Mapping", option).split(",")]
+            self._config.set("Mapping", option, ", ".join(algorithms))
+
+    @staticmethod
+    def __check_mapping_profile(profile):
+        """ Check a ``[Mapping] mapping_profile``.
+
+        :param str profile:
+        :rtype: str
+        :raises ConfigurationException: If the profile is not known
+        """
+        profile = profile.lower()
+        if profile not in (DEFAULT_MAPPING_PROFILE, FAST_MAPPING_PROFILE):
+            raise ConfigurationException(
+                "Unknown [Mapping] mapping_profile {}; it must be {} or "
+                "{}".format(profile, DEFAULT_MAPPING_PROFILE,
+                            FAST_MAPPING_PROFILE))
+        return profile
+
+    def __apply_fast_mapping_profile(self):
+        """ Map with the ``[Mapping] fast_...`` algorithms.
+        """
+        for option in _MAPPING_ALGORITHM_OPTIONS:
+            self._config.set("Mapping", option, self.config.get(
+                "Mapping", "fast_" + option))
+        logger.info("Mapping with the fast profile, without reports")
+
     @property
     def is_allocated_machine(self):
         """ Is this an allocated machine? Otherwise, it is local.
@@ -165,6 +400,47 @@ class SpiNNaker(AbstractSpinnakerBase, GraphFrontEndSimulatorInterface):
         """
         return _is_allocated_machine(self.config)
 
+    @property
+    def progress_monitor(self):
+        """ What keeps track of the progress of runs.
+
+        :rtype: RunProgressMonitor
+        """
+        return self._progress_monitor
+
+    def current_progress(self, n_cores=4):
+        """ Estimate the progress of the run going on now.
+
+        :param int n_cores: How many cores to read the states of
+        :rtype: RunProgress or None
+        """
+        return self._progress_monitor.current_progress(n_cores)
+
+    def key_index(self):
+        """ Get the index of the keys of the current mapping, building it\
+            if the mapping has changed since it was last built.
+
+        :rtype: KeyIndex
+        :raise ConfigurationException: if the graph has not been mapped
+        """
+        routing_infos = self.routing_infos
+        if routing_infos is None:
+            raise ConfigurationException(
+                "The key index is only available after the graph is mapped")
+        built_from, index = self._key_index
+        if built_from is not routing_infos:
+            index = KeyIndex(routing_infos)
+            self._key_index = (routing_infos, index)
+        return index
+
+    def __check_binaries(self):
+        """ Report missing binaries before spending any time on mapping.
+        """
+        if isinstance(self._executable_finder, IndexedExecutableFinder):
+            self._executable_finder.check_binaries(itertools.chain(
+                self.original_application_graph.vertices,
+                self.original_machine_graph.vertices))
+
     def run(self, run_time):
         """ Run a simulation for a fixed amount of time
 
@@ -176,8 +452,154 @@ class SpiNNaker(AbstractSpinnakerBase, GraphFrontEndSimulatorInterface):
         if self._user_dsg_algorithm is not None:
             self.dsg_algorithm = self._user_dsg_algorithm
 
+        self.__check_binaries()
+
         # run normal procedure
-        super().run(run_time)
+        total_steps = None
+        if run_time is not None:
+            total_steps = int(math.ceil(
+                run_time * 1000.0 / self.machine_time_step))
+        self._progress_monitor.run_started(total_steps)
+        try:
+            super().run(run_time)
+        finally:
+            self._progress_monitor.run_ended()
+
+    def run_until_complete(self, n_steps=None):
+        """ Run a simulation until it completes
+
+        :param int n_steps:
+            If not ``None``, the number of steps the simulation should be
+            requested to run for
+        """
+        # pylint: disable=arguments-differ
+        self.__check_binaries()
+        self._progress_monitor.run_started(n_steps)
+        try:
+            super().run_until_complete(n_steps)
+        finally:
+            self._progress_monitor.run_ended()
+
+    def _do_run(self, n_machine_time_steps, graph_changed, run_until_complete):
+        # pylint: disable=arguments-differ
+        self._progress_monitor.segment_started(n_machine_time_steps)
+        try:
+            super()._do_run(
+                n_machine_time_steps, graph_changed, run_until_complete)
+        finally:
+            self._progress_monitor.segment_ended()
+
+    def _run_algorithms(
+            self, inputs, algorithms, outputs, tokens, required_tokens,
+            provenance_name, optional_algorithms=None):
+        # pylint: disable=too-many-arguments
+        if "MachineGenerator" in algorithms and self._read_config_boolean(
+                "Machine", "use_machine_cache"):
+            # Make the machine with a generator that can skip discovery
+            algorithms = [
+                "CachedMachineGenerator" if name == "MachineGenerator"
+                else name for name in algorithms]
+            inputs = dict(inputs)
+            inputs["MachineCacheDirectory"] = self._read_config(
+                "Machine", "machine_cache_directory")
+        return super()._run_algorithms(
+            inputs, algorithms, outputs, tokens, required_tokens,
+            provenance_name, optional_algorithms)
+
+    def __lease_key(self):
+        """ Describe the machine asked for, so that a kept machine is only\
+            reused for the same request.
+
+        :return: The description, or ``None`` if the machine is sized to the
+            graph, and so must not be kept
+        :rtype: tuple or None
+        """
+        if self._n_chips_required is None and \
+                self._n_boards_required is None:
+            return None
+        return (
+            self._spalloc_server, self._remote_spinnaker_url,
+            self._read_config("Machine", "spalloc_port"),
+            self._read_config("Machine", "spalloc_user"),
+            self._read_config("Machine", "spalloc_machine"),
+            self._n_chips_required, self._n_boards_required)
+
+    def _machine_by_remote(self, n_machine_time_steps, total_run_time):
+        key = self.__lease_key()
+        lease = None
+        if key is not None and self.__lease_idle_timeout():
+            lease = take_lease(key)
+        if lease is None:
+            super()._machine_by_remote(n_machine_time_steps, total_run_time)
+            if key is not None and \
+                    self._machine_allocation_controller is not None:
+                self._machine_lease = MachineLease(
+                    key, self._machine_allocation_controller,
+                    {name: self._machine_outputs[name]
+                     for name in ALLOCATION_OUTPUTS})
+            return
+
+        # Generate the machine as after an allocation, but without one
+        inputs, algorithms = self._get_machine_common(
+            n_machine_time_steps, total_run_time)
+        inputs.update(lease.allocation_outputs)
+        inputs["ReportFolder"] = self._report_default_directory
+        inputs["ReportWaitingLogsFlag"] = self._config.getboolean(
+            "Machine", "report_waiting_logs")
+        inputs["MemoryPreAllocatedResources"] = PreAllocatedResourceContainer()
+        algorithms.append("MachineGenerator")
+        executor = self._run_algorithms(
+            inputs, algorithms, ["MemoryMachine", "MemoryTransceiver"], [], [],
+            "machine_generation")
+        self._machine_outputs = executor.get_items()
+        self._machine_tokens = executor.get_completed_tokens()
+        self._machine = executor.get_item("MemoryMachine")
+        self._txrx = executor.get_item("MemoryTransceiver")
+        self._ip_address = lease.ip_address
+        self._machine_allocation_controller = lease.controller
+        self._machine_lease = lease
+
+    def __lease_idle_timeout(self):
+        """ How long to keep allocated machines for after stop().
+
+        :return: The time in seconds, or ``None`` to not keep them
+        :rtype: float or None
+        """
+        timeout = self.config.get_float(
+            "Machine", "machine_lease_idle_timeout")
+        return timeout if timeout and timeout > 0 else None
+
+    def stop(self, turn_off_machine=None, clear_routing_tables=None,
+             clear_tags=None):
+        """ Stop the simulation. If so configured, an allocated machine is\
+            kept for a while for reuse by the next simulation in this\
+            process that asks for the same machine, rather than released.
+
+        :param bool turn_off_machine:
+            Whether to power down the machine; a machine that is powered
+            down is never kept
+        :param bool clear_routing_tables:
+            Whether to clear the routing tables of the machine
+        :param bool clear_tags: Whether to clear the tags of the machine
+        """
+        # pylint: disable=arguments-differ
+        if turn_off_machine is None:
+            turn_off_machine = self._config.getboolean(
+                "Machine", "turn_off_machine")
+        timeout = self.__lease_idle_timeout()
+        lease = self._machine_lease
+        self._machine_lease = None
+        if (lease is None or timeout is None or turn_off_machine or
+                self._machine_allocation_controller is not lease.controller):
+            super().stop(turn_off_machine, clear_routing_tables, clear_tags)
+            return
+
+        # Hide the allocation from the shutdown so that it is not released
+        self._machine_allocation_controller = None
+        try:
+            super().stop(turn_off_machine, clear_routing_tables, clear_tags)
+        finally:
+            keep_lease(lease, timeout)
 
     def __repr__(self):
         return "SpiNNaker Graph Front End object for machine {}".format(
@@ -195,9 +617,7 @@ class _GraphFrontEndFailedState(GraphFrontEndSimulatorInterface, FailedState):
         logger.warning(
             "Accessing config before setup is not recommended as setup could"
             " change some config values. ")
-        handler = ConfigHandler(
-            CONFIG_FILE_NAME, [SpiNNaker.extended_config_path()], [])
-        return handler.config
+        return cached_config()
 
 
 # At import time change the default FailedState
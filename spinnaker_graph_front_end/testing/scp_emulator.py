@@ -0,0 +1,442 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import socket
+import struct
+import threading
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.model.enums import CPUState
+from spinnman.utilities.utility_functions import get_vcpu_address
+
+#: The padding before an SDP message in a UDP datagram, and the SDP header
+_SDP_HEADER = struct.Struct("<2x8B")
+#: The SCP command (or result) and sequence number
+_SCP_HEADER = struct.Struct("<2H")
+_WORD = struct.Struct("<I")
+#: What comes before the name in the reply to a version request
+_VERSION = struct.Struct("<BBBBHHI")
+#: The reply to a request for the details of an IP tag
+_IPTAG = struct.Struct("<4s6s3HIH3B")
+#: The reply to a request for the IP tag configuration
+_IPTAG_INFO = struct.Struct("<Bx2B")
+
+_SDP_OFFSET = 2
+_SCP_OFFSET = _SDP_OFFSET + 8
+_ARGS_OFFSET = _SCP_OFFSET + _SCP_HEADER.size
+#: The SDP flags of a message to which no reply is expected
+_REPLY_NOT_EXPECTED = 0x07
+_MAX_DATAGRAM = 65536
+_RECEIVE_BUFFER_SIZE = 8 * 1024 * 1024
+#: The destination of requests for whichever chip receives them
+_THIS_CHIP = (255, 255)
+
+_PAGE_BITS = 12
+_PAGE_SIZE = 1 << _PAGE_BITS
+
+# Sub-commands of CMD_IPTAG
+_IPTAG_TTO = 0
+_IPTAG_SET = 1
+_IPTAG_GET = 2
+_IPTAG_CLEAR = 3
+_IPTAG_INFO_CMD = 4
+_N_IPTAGS = 8
+_IPTAG_IN_USE = 0x8000
+_IPTAG_REVERSE = 0x0200
+
+#: The type of signal that asks for a count of cores in a state
+_COUNT_SIGNAL_TYPE = 1
+
+#: Where the state and application ID are in the vcpu_t of a core
+_STATE_OFFSET = 46
+_APP_NAME_OFFSET = 72
+_APP_NAME_BYTES = 16
+
+_NAME = b"SC&MP/SpiNNaker\0" + b"3.0.1\0"
+_BUILD_DATE = 0x5F000000
+
+
+class SCPEmulator(object):
+    """ A local stand-in for SC&MP on the monitor processors of the chips\
+        of a board, answering a subset of SCP over UDP from memory, so that\
+        the host side of input and output can be exercised without\
+        hardware.
+
+    This is not a whole board: it cannot be booted or discovered, so
+    :py:func:`~spinnaker_graph_front_end.setup` cannot be pointed at it.
+    It is for driving a transceiver, or the connections below one,
+    directly.
+
+    What is emulated:
+
+    * version requests (``CMD_VER``), answered as SC&MP 3.0.1;
+    * memory reads, writes and fills (``CMD_READ``, ``CMD_WRITE``,
+      ``CMD_FILL``) of every chip, backed by sparse in-memory pages;
+    * the states of cores, which live in each core's ``vcpu_t`` structure in
+      that memory just as on a board, so they can be read by
+      :py:meth:`~spinnman.transceiver.Transceiver.get_cpu_information` and
+      counted with ``CMD_SIG``; the host sets them with
+      :py:meth:`set_core_state`;
+    * IP tags and reverse IP tags (``CMD_IPTAG``);
+    * reflection: EIEIO sent by SDP to a core (as to a live input) can be
+      sent straight back out of an IP tag, as a live packet gatherer would.
+
+    Other signals and commands that only change what runs on cores are
+    acknowledged and remembered in :py:attr:`signals`; anything else is
+    answered with ``RC_CMD``. Booting, machine discovery, loading and the
+    running of binaries are not emulated, so the emulator is for the layers
+    above the transceiver's discovery of the machine: connections, data
+    movement, live I/O and their throughput.
+
+    Connect to it with, for example,
+    ``SCAMPConnection(remote_host="127.0.0.1", remote_port=emulator.port)``.
+    """
+
+    __slots__ = [
+        "_chips", "_iptags", "_lock", "_n_cores", "_n_requests", "_pages",
+        "_reflections", "_running", "_signals", "_socket", "_thread"]
+
+    def __init__(self, chips=((0, 0),), n_cores=18, local_host="127.0.0.1",
+                 local_port=0):
+        """
+        :param ~collections.abc.Iterable(tuple(int,int)) chips:
+            The coordinates of the chips of the board
+        :param int n_cores: The number of cores on each chip
+        :param str local_host: The address to answer on
+        :param int local_port:
+            The UDP port to answer on; by default, any free port
+        """
+        self._chips = frozenset(chips)
+        self._n_cores = n_cores
+        self._pages = dict()
+        self._iptags = dict()
+        self._reflections = dict()
+        self._signals = list()
+        self._n_requests = 0
+        self._lock = threading.Lock()
+        for x, y in self._chips:
+            for p in range(n_cores):
+                self.set_core_state(x, y, p, CPUState.IDLE)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Absorbs bursts of live input, as a board's links would
+        self._socket.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, _RECEIVE_BUFFER_SIZE)
+        self._socket.bind((local_host, local_port))
+        # Lets the serving thread notice that it has been closed
+        self._socket.settimeout(0.1)
+        self._running = True
+        self._thread = threading.Thread(
+            target=self.__serve, daemon=True, name="SCP emulator")
+        self._thread.start()
+
+    @property
+    def address(self):
+        """ The address and port being answered on.
+
+        :rtype: tuple(str, int)
+        """
+        return self._socket.getsockname()
+
+    @property
+    def port(self):
+        """ The UDP port being answered on.
+
+        :rtype: int
+        """
+        return self.address[1]
+
+    @property
+    def n_requests(self):
+        """ The number of datagrams handled so far.
+
+        :rtype: int
+        """
+        return self._n_requests
+
+    @property
+    def signals(self):
+        """ The signals and other acknowledged commands received, as\
+            (command, argument 1, argument 2, argument 3) tuples.
+
+        :rtype: list(tuple(SCPCommand, int, int, int))
+        """
+        return list(self._signals)
+
+    @property
+    def ip_tags(self):
+        """ The IP tags set, by tag, as (host, port, strip) tuples.
+
+        :rtype: dict(int, tuple(str, int, bool))
+        """
+        with self._lock:
+            return {tag: (host, port, strip)
+                    for tag, (host, port, strip, reverse) in
+                    self._iptags.items() if reverse is None}
+
+    def read_memory(self, x, y, address, length):
+        """ Read the memory of a chip directly.
+
+        :param int x:
+        :param int y:
+        :param int address:
+        :param int length:
+        :rtype: bytes
+        """
+        with self._lock:
+            return self.__read(x, y, address, length)
+
+    def write_memory(self, x, y, address, data):
+        """ Write the memory of a chip directly.
+
+        :param int x:
+        :param int y:
+        :param int address:
+        :param bytes data:
+        """
+        with self._lock:
+            self.__write(x, y, address, data)
+
+    def set_core_state(self, x, y, p, state, app_id=0, app_name=""):
+        """ Set what a core reports about itself, as if a binary on it had\
+            changed state.
+
+        :param int x:
+        :param int y:
+        :param int p:
+        :param ~spinnman.model.enums.CPUState state:
+        :param int app_id:
+        :param str app_name:
+        """
+        base = get_vcpu_address(p)
+        self.write_memory(
+            x, y, base + _STATE_OFFSET, bytes([state.value, app_id]))
+        self.write_memory(
+            x, y, base + _APP_NAME_OFFSET,
+            app_name.encode("ascii")[:_APP_NAME_BYTES].ljust(
+                _APP_NAME_BYTES, b"\0"))
+
+    def core_state(self, x, y, p):
+        """ Get the state of a core.
+
+        :param int x:
+        :param int y:
+        :param int p:
+        :rtype: ~spinnman.model.enums.CPUState
+        """
+        return CPUState(self.read_memory(
+            x, y, get_vcpu_address(p) + _STATE_OFFSET, 1)[0])
+
+    def set_ip_tag(self, tag, host, port, strip=True):
+        """ Set an IP tag directly.
+
+        :param int tag:
+        :param str host: Where the tag sends to
+        :param int port: The UDP port the tag sends to
+        :param bool strip: Whether to send without the SDP header
+        """
+        with self._lock:
+            self._iptags[tag] = (host, port, strip, None)
+
+    def reflect(self, x, y, p, tag):
+        """ Send the EIEIO that arrives by SDP at a core back out of an IP\
+            tag, as a live input connected to a live packet gatherer would.
+
+        :param int x:
+        :param int y:
+        :param int p:
+        :param int tag: The IP tag to send through
+        """
+        with self._lock:
+            self._reflections[x, y, p] = tag
+
+    def __read(self, x, y, address, length):
+        data = bytearray(length)
+        done = 0
+        while done < length:
+            page, offset = divmod(address + done, _PAGE_SIZE)
+            n_bytes = min(length - done, _PAGE_SIZE - offset)
+            stored = self._pages.get((x, y, page))
+            if stored is not None:
+                data[done:done + n_bytes] = stored[offset:offset + n_bytes]
+            done += n_bytes
+        return bytes(data)
+
+    def __write(self, x, y, address, data):
+        done = 0
+        while done < len(data):
+            page, offset = divmod(address + done, _PAGE_SIZE)
+            n_bytes = min(len(data) - done, _PAGE_SIZE - offset)
+            stored = self._pages.get((x, y, page))
+            if stored is None:
+                stored = self._pages[x, y, page] = bytearray(_PAGE_SIZE)
+            stored[offset:offset + n_bytes] = data[done:done + n_bytes]
+            done += n_bytes
+
+    def __serve(self):
+        datagram = bytearray(_MAX_DATAGRAM)
+        while self._running:
+            try:
+                n_bytes, sender = self._socket.recvfrom_into(datagram)
+            except socket.timeout:
+                continue
+            except OSError:
+                # The socket has been closed
+                return
+            self._n_requests += 1
+            if n_bytes < _SCP_OFFSET:
+                continue
+            with self._lock:
+                reply = self.__handle(bytes(datagram[:n_bytes]), sender)
+            if reply is not None:
+                self._socket.sendto(reply, sender)
+
+    def __handle(self, data, sender):
+        (_flags, _tag, dest_port_cpu, src_port_cpu, dest_y, dest_x,
+         src_y, src_x) = _SDP_HEADER.unpack_from(data)
+        port = dest_port_cpu >> 5
+        cpu = dest_port_cpu & 0x1F
+        if port != 0:
+            self.__reflect(dest_x, dest_y, cpu, data[_SCP_OFFSET:])
+            return None
+        if len(data) < _ARGS_OFFSET:
+            return None
+        command, sequence = _SCP_HEADER.unpack_from(data, _SCP_OFFSET)
+        args = [0, 0, 0]
+        n_args = min(3, (len(data) - _ARGS_OFFSET) // 4)
+        args[:n_args] = struct.unpack_from(
+            "<{}I".format(n_args), data, _ARGS_OFFSET)
+        payload = data[_ARGS_OFFSET + 12:]
+        chip = (dest_x, dest_y)
+        if chip == _THIS_CHIP:
+            chip = min(self._chips)
+        if chip not in self._chips:
+            result, reply = SCPResult.RC_ROUTE, b""
+        else:
+            result, reply = self.__command(
+                *chip, cpu, command, args, payload, sender)
+        header = _SDP_HEADER.pack(
+            _REPLY_NOT_EXPECTED, 0xFF, src_port_cpu, dest_port_cpu,
+            src_y, src_x, dest_y, dest_x)
+        return header + _SCP_HEADER.pack(result.value, sequence) + reply
+
+    def __command(self, x, y, p, command, args, payload, sender):
+        # pylint: disable=too-many-arguments, too-many-return-statements
+        if command == SCPCommand.CMD_VER.value:
+            return SCPResult.RC_OK, _VERSION.pack(
+                p, p, y, x, 0, 0xFFFF, _BUILD_DATE) + _NAME
+        if command == SCPCommand.CMD_READ.value:
+            return SCPResult.RC_OK, self.__read(x, y, args[0], args[1])
+        if command == SCPCommand.CMD_WRITE.value:
+            self.__write(x, y, args[0], payload[:args[1]])
+            return SCPResult.RC_OK, b""
+        if command == SCPCommand.CMD_FILL.value:
+            base, word, size = args
+            self.__write(x, y, base, _WORD.pack(word) * (size // 4))
+            return SCPResult.RC_OK, b""
+        if command == SCPCommand.CMD_IPTAG.value:
+            return self.__iptag(args, sender)
+        if command == SCPCommand.CMD_SIG.value and \
+                args[0] == _COUNT_SIGNAL_TYPE:
+            return SCPResult.RC_OK, _WORD.pack(self.__count_state(args[1]))
+        if command in (SCPCommand.CMD_SIG.value, SCPCommand.CMD_NNP.value,
+                       SCPCommand.CMD_AS.value, SCPCommand.CMD_LED.value):
+            self._signals.append((SCPCommand(command), *args))
+            return SCPResult.RC_OK, b""
+        return SCPResult.RC_CMD, b""
+
+    def __iptag(self, args, sender):
+        sub_command = (args[0] >> 16) & 0xF
+        tag = args[0] & 0xFF
+        if sub_command == _IPTAG_SET:
+            strip = bool((args[0] >> 28) & 1)
+            if (args[0] >> 29) & 1:
+                # Reverse: a port on the board sends to a core
+                self._iptags[tag] = (
+                    None, args[1] & 0xFFFF, strip,
+                    (args[1] >> 24, (args[1] >> 16) & 0xFF,
+                     (args[0] >> 8) & 0x1F))
+            else:
+                host = sender[0] if (args[0] >> 30) & 1 else socket.inet_ntoa(
+                    _WORD.pack(args[2]))
+                self._iptags[tag] = (host, args[1], strip, None)
+            return SCPResult.RC_OK, b""
+        if sub_command == _IPTAG_GET:
+            return SCPResult.RC_OK, b"".join(
+                self.__iptag_details(tag + i) for i in range(args[1]))
+        if sub_command == _IPTAG_CLEAR:
+            self._iptags.pop(tag, None)
+            return SCPResult.RC_OK, b""
+        if sub_command == _IPTAG_INFO_CMD:
+            return SCPResult.RC_OK, _IPTAG_INFO.pack(0, 0, _N_IPTAGS)
+        if sub_command == _IPTAG_TTO:
+            return SCPResult.RC_OK, _WORD.pack(0)
+        return SCPResult.RC_ARG, b""
+
+    def __iptag_details(self, tag):
+        if tag not in self._iptags:
+            return _IPTAG.pack(bytes(4), bytes(6), 0, 0, 0, 0, 0, 0, 0, 0)
+        host, port, _strip, reverse = self._iptags[tag]
+        flags = _IPTAG_IN_USE
+        ip_address = bytes(4)
+        rx_port, chip_x, chip_y, cpu = 0, 0, 0, 0
+        if reverse is None:
+            ip_address = socket.inet_aton(host)
+        else:
+            flags |= _IPTAG_REVERSE
+            rx_port, port = port, 0
+            chip_x, chip_y, cpu = reverse
+        return _IPTAG.pack(
+            ip_address, bytes(6), port, 0, flags, 0, rx_port, chip_y, chip_x,
+            (1 << 5) | cpu)
+
+    def __count_state(self, data):
+        app_id = data & 0xFF
+        app_mask = (data >> 8) & 0xFF
+        state = (data >> 16) & 0xF
+        count = 0
+        for x, y in self._chips:
+            for p in range(self._n_cores):
+                core_state, core_app_id = self.__read(
+                    x, y, get_vcpu_address(p) + _STATE_OFFSET, 2)
+                if core_state == state and \
+                        core_app_id & app_mask == app_id & app_mask:
+                    count += 1
+        return count
+
+    def __reflect(self, x, y, p, eieio):
+        tag = self._reflections.get((x, y, p))
+        if tag is None or tag not in self._iptags:
+            return
+        host, port, strip, reverse = self._iptags[tag]
+        if reverse is not None:
+            return
+        if not strip:
+            eieio = _SDP_HEADER.pack(
+                _REPLY_NOT_EXPECTED, tag, 0xFF, (1 << 5) | p, 0, 0, y, x) + \
+                eieio
+        self._socket.sendto(eieio, (host, port))
+
+    def close(self):
+        """ Stop answering.
+        """
+        self._running = False
+        self._thread.join()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -13,6 +13,33 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from .abstract_has_atom_connections import AbstractHasAtomConnections
+from .abstract_has_graph_invariants import AbstractHasGraphInvariants
+from .abstract_has_grid_position import AbstractHasGridPosition
+from .degree_index import DegreeIndex
+from .event_injector import EventInjector
+from .event_ring_buffer import EventRingBuffer, RingBufferReceiver
+from .graph_invariants import GraphInvariants
+from .indexed_executable_finder import IndexedExecutableFinder
+from .key_index import KeyIndex
+from .region_layout import (
+    recording_region, Region, RegionLayout, system_region)
+from .region_layout_vertex import RegionLayoutVertex
+from .replay_source import ReplaySource, write_replay_file
+from .resource_splitter import ResourceSplitter
+from .sdram_channel_vertex import SDRAMChannelVertex
+from .sdram_partitions import (
+    add_sdram_partition, choose_sdram_partition_type, max_sdram_left_on_chip,
+    sdram_left_on_chip, sdram_per_edge)
 from .simulator_vertex import SimulatorVertex
 
-__all__ = ["SimulatorVertex"]
+__all__ = ["AbstractHasAtomConnections", "AbstractHasGraphInvariants",
+           "AbstractHasGridPosition", "add_sdram_partition",
+           "choose_sdram_partition_type", "DegreeIndex",
+           "EventInjector", "EventRingBuffer", "GraphInvariants",
+           "IndexedExecutableFinder", "KeyIndex", "max_sdram_left_on_chip",
+           "recording_region",
+           "Region", "RegionLayout", "RegionLayoutVertex", "ReplaySource",
+           "ResourceSplitter", "RingBufferReceiver", "SDRAMChannelVertex",
+           "sdram_left_on_chip", "sdram_per_edge", "SimulatorVertex",
+           "system_region", "write_replay_file"]
@@ -0,0 +1,37 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from spinn_utilities.require_subclass import require_subclass
+from pacman.model.graphs.application import ApplicationEdge
+
+
+@require_subclass(ApplicationEdge)
+class AbstractHasAtomConnections(object, metaclass=AbstractBase):
+    """ Marks an application edge that can say which atoms of its pre\
+        vertex send to which atoms of its post vertex, so that machine edges\
+        are made only between the slices that need them.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get_atom_connections(self):
+        """ Get the atoms joined by the edge, as arrays of the same length:\
+            the atom of the pre vertex and the atom of the post vertex of\
+            each connection.
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
@@ -0,0 +1,35 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.abstract_base import AbstractBase, abstractproperty
+from spinn_utilities.require_subclass import require_subclass
+from pacman.model.graphs.machine import MachineVertex
+
+
+@require_subclass(MachineVertex)
+class AbstractHasGraphInvariants(object, metaclass=AbstractBase):
+    """ Marks a machine vertex that only works with certain edges around\
+        it, such as a Conway's cell that needs exactly eight neighbours, so\
+        that a graph without them is rejected before it is mapped.
+    """
+
+    __slots__ = ()
+
+    @abstractproperty
+    def graph_invariants(self):
+        """ What the vertex needs of the edges around it.
+
+        :rtype: GraphInvariants
+        """
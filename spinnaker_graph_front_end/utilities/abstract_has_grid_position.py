@@ -0,0 +1,35 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.abstract_base import AbstractBase, abstractproperty
+from spinn_utilities.require_subclass import require_subclass
+from pacman.model.graphs.machine import MachineVertex
+
+
+@require_subclass(MachineVertex)
+class AbstractHasGridPosition(object, metaclass=AbstractBase):
+    """ Marks a machine vertex that stands for a place in a 2D grid, such as\
+        a cell of a Conway's Game of Life board, so that placers can keep\
+        vertices that are near in the grid near on the machine.
+    """
+
+    __slots__ = ()
+
+    @abstractproperty
+    def grid_position(self):
+        """ Where the vertex is in the grid, as whole-number coordinates.
+
+        :rtype: tuple(int, int)
+        """
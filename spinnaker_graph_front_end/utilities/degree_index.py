@@ -0,0 +1,75 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import Counter
+
+
+class DegreeIndex(object):
+    """ The numbers of edges into and out of each vertex of a machine graph,\
+        and of the partitions that it sends on, counted in one pass over\
+        the graph.
+    """
+
+    __slots__ = [
+        "_n_incoming_edges", "_n_outgoing_edges", "_n_outgoing_partitions",
+        "_n_self_loops"]
+
+    def __init__(self, machine_graph):
+        """
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        """
+        self._n_incoming_edges = Counter()
+        self._n_outgoing_edges = Counter()
+        self._n_outgoing_partitions = Counter()
+        self._n_self_loops = Counter()
+        for partition in machine_graph.outgoing_edge_partitions:
+            self._n_outgoing_partitions[partition.pre_vertex] += 1
+            for edge in partition.edges:
+                self._n_outgoing_edges[edge.pre_vertex] += 1
+                self._n_incoming_edges[edge.post_vertex] += 1
+                if edge.pre_vertex is edge.post_vertex:
+                    self._n_self_loops[edge.pre_vertex] += 1
+
+    def n_incoming_edges(self, vertex):
+        """ The number of edges that end at a vertex.
+
+        :param ~pacman.model.graphs.machine.MachineVertex vertex:
+        :rtype: int
+        """
+        return self._n_incoming_edges[vertex]
+
+    def n_outgoing_edges(self, vertex):
+        """ The number of edges that start at a vertex.
+
+        :param ~pacman.model.graphs.machine.MachineVertex vertex:
+        :rtype: int
+        """
+        return self._n_outgoing_edges[vertex]
+
+    def n_outgoing_partitions(self, vertex):
+        """ The number of outgoing edge partitions that a vertex sends on.
+
+        :param ~pacman.model.graphs.machine.MachineVertex vertex:
+        :rtype: int
+        """
+        return self._n_outgoing_partitions[vertex]
+
+    def n_self_loops(self, vertex):
+        """ The number of edges from a vertex to itself.
+
+        :param ~pacman.model.graphs.machine.MachineVertex vertex:
+        :rtype: int
+        """
+        return self._n_self_loops[vertex]
@@ -0,0 +1,161 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Conversion between EIEIO data messages and NumPy arrays of events,\
+    a whole message at a time.
+
+The layout of the messages is that of
+:py:class:`~spinnman.messages.eieio.data_messages.EIEIODataMessage`.
+"""
+
+import struct
+import numpy
+from spinnman.exceptions import SpinnmanInvalidPacketException
+
+#: The type of a decoded event. ``timestamp`` is 0 unless the payloads of the
+#: message are timestamps, in which case ``payload`` is 0 instead.
+EVENT_DTYPE = numpy.dtype([
+    ("timestamp", "<u4"), ("key", "<u4"), ("payload", "<u4")])
+
+#: The most events that one message can hold
+MAX_EVENTS_PER_MESSAGE = 255
+
+#: The most 32-bit keys that fit in a message sent to a live input
+MAX_KEYS_PER_MESSAGE = 63
+
+#: The most 32-bit keys with 32-bit payloads that fit in a message sent to a
+#: live input
+MAX_KEYS_PAYLOADS_PER_MESSAGE = 31
+
+#: The header flags of messages of 32-bit keys, without and with payloads
+_KEY_32_BIT_FLAGS = 2 << 2
+_KEY_PAYLOAD_32_BIT_FLAGS = 3 << 2
+
+_HEADER = struct.Struct("<BB")
+
+#: For each EIEIO message type, the type of its elements and whether each
+#: key is followed by a payload
+_ELEMENT_TYPES = (
+    (numpy.dtype("<u2"), False), (numpy.dtype("<u2"), True),
+    (numpy.dtype("<u4"), False), (numpy.dtype("<u4"), True))
+
+
+def decode_eieio_data(data, out):
+    """ Decode the events of an EIEIO data message.
+
+    :param data: The message, as received from the network
+    :type data: bytes or bytearray or memoryview
+    :param ~numpy.ndarray out:
+        Where to put the events; an array of :py:data:`EVENT_DTYPE` with room
+        for at least :py:data:`MAX_EVENTS_PER_MESSAGE` events
+    :return: The number of events decoded; 0 for a command message
+    :rtype: int
+    :raise ~spinnman.exceptions.SpinnmanInvalidPacketException:
+        if the message is shorter than its header says
+    """
+    if len(data) < 2:
+        raise SpinnmanInvalidPacketException(
+            "EIEIODataMessage", "too short to hold a header")
+    count = data[0]
+    flags = data[1]
+    has_prefix = (flags >> 7) & 1
+    upper_prefix = (flags >> 6) & 1
+    if not has_prefix and upper_prefix:
+        # This is a command message, which has no events
+        return 0
+    has_payload_prefix = (flags >> 5) & 1
+    is_time = (flags >> 4) & 1
+    key_dtype, has_payloads = _ELEMENT_TYPES[(flags >> 2) & 3]
+
+    offset = 2
+    key_prefix = 0
+    if has_prefix:
+        key_prefix = int(numpy.frombuffer(
+            data, dtype="<u2", count=1, offset=offset)[0])
+        if upper_prefix:
+            key_prefix <<= 16
+        offset += 2
+    payload_prefix = 0
+    if has_payload_prefix:
+        payload_prefix = int(numpy.frombuffer(
+            data, dtype=key_dtype, count=1, offset=offset)[0])
+        offset += key_dtype.itemsize
+
+    n_elements = 2 if has_payloads else 1
+    if len(data) < offset + count * n_elements * key_dtype.itemsize:
+        raise SpinnmanInvalidPacketException(
+            "EIEIODataMessage",
+            "{} bytes cannot hold {} events".format(len(data), count))
+    elements = numpy.frombuffer(
+        data, dtype=key_dtype, count=count * n_elements, offset=offset)
+
+    events = out[:count]
+    events["key"] = elements[::n_elements]
+    if key_prefix:
+        events["key"] |= key_prefix
+    if has_payloads:
+        events["payload"] = elements[1::2]
+        if payload_prefix:
+            events["payload"] |= payload_prefix
+    else:
+        events["payload"] = payload_prefix
+    if is_time:
+        events["timestamp"] = events["payload"]
+        events["payload"] = 0
+    else:
+        events["timestamp"] = 0
+    return count
+
+
+def encode_eieio_data(keys, payloads=None):
+    """ Pack events into as few EIEIO data messages as will hold them.
+
+    The events are converted a message at a time, not an event at a time.
+
+    :param ~numpy.ndarray keys: The 32-bit keys of the events
+    :param payloads:
+        The 32-bit payloads of the events, if they have them; must be as long
+        as the keys
+    :type payloads: ~numpy.ndarray or None
+    :return: The messages, each with the number of events in it
+    :rtype: ~collections.abc.Iterable(tuple(bytes, int))
+    :raise ValueError: if there are not as many payloads as keys
+    """
+    keys = numpy.ascontiguousarray(keys, dtype="<u4")
+    if payloads is None:
+        elements = keys
+        per_message = MAX_KEYS_PER_MESSAGE
+        per_event = 1
+        flags = _KEY_32_BIT_FLAGS
+    else:
+        payloads = numpy.asarray(payloads, dtype="<u4")
+        if payloads.shape != keys.shape:
+            raise ValueError(
+                "{} payloads given for {} keys".format(
+                    len(payloads), len(keys)))
+        # Interleave the keys and payloads as the message needs them
+        elements = numpy.empty((len(keys), 2), dtype="<u4")
+        elements[:, 0] = keys
+        elements[:, 1] = payloads
+        per_message = MAX_KEYS_PAYLOADS_PER_MESSAGE
+        per_event = 2
+        flags = _KEY_PAYLOAD_32_BIT_FLAGS
+    data = elements.reshape(-1).view(numpy.uint8)
+    bytes_per_event = 4 * per_event
+    for start in range(0, len(keys), per_message):
+        count = min(per_message, len(keys) - start)
+        yield (_HEADER.pack(count, flags) + data[
+            start * bytes_per_event:(start + count) * bytes_per_event
+        ].tobytes(), count)
@@ -0,0 +1,123 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import socket
+import struct
+import time
+from pacman.model.graphs.machine import MachineVertex
+from spinnman.constants import SCP_SCAMP_PORT
+from spinnman.messages.sdp import SDPFlag, SDPHeader
+from spinn_front_end_common.utilities import globals_variables
+from .eieio_arrays import encode_eieio_data
+
+#: The padding that goes before an SDP message sent over UDP
+_TWO_SKIP = struct.Struct("<2x")
+
+#: Pacing delays shorter than this are not worth sleeping for
+_MIN_SLEEP = 0.0005
+
+
+class EventInjector(object):
+    """ Sends arrays of events to a live input (such as a\
+        :py:class:`~spinnaker_graph_front_end.ReverseIpTagMultiCastSource`)\
+        in as few messages as possible.
+
+    The messages are sent in the same way as by
+    :py:class:`~spinn_front_end_common.utilities.connections.LiveEventConnection`,
+    but the events are packed into them an array at a time.
+    """
+
+    __slots__ = ["_address", "_sdp_prefix", "_socket"]
+
+    def __init__(self, x, y, p, ip_address, port=SCP_SCAMP_PORT):
+        """
+        :param int x: The x-coordinate of the chip of the live input core
+        :param int y: The y-coordinate of the chip of the live input core
+        :param int p: The live input core
+        :param str ip_address: The address of the board of the chip
+        :param int port: The UDP port that the board listens for SDP on
+        """
+        # The SDP header is the same for every message, so is made only once
+        header = SDPHeader(
+            flags=SDPFlag.REPLY_NOT_EXPECTED, tag=0,
+            destination_port=1, destination_cpu=p,
+            destination_chip_x=x, destination_chip_y=y,
+            source_port=0, source_cpu=0,
+            source_chip_x=0, source_chip_y=0)
+        self._sdp_prefix = _TWO_SKIP.pack() + header.bytestring
+        self._address = (ip_address, port)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    @staticmethod
+    def for_vertex(vertex):
+        """ Make an injector for a live input vertex of the current\
+            simulation, which must have been run (or at least mapped). If\
+            the vertex has several machine vertices, the events go to the\
+            first, as for a live event connection.
+
+        :param vertex: The live input vertex
+        :type vertex: ~pacman.model.graphs.application.ApplicationVertex or
+            ~pacman.model.graphs.machine.MachineVertex
+        :rtype: EventInjector
+        """
+        sim = globals_variables.get_simulator()
+        machine_vertex = vertex
+        if not isinstance(vertex, MachineVertex):
+            machine_vertex = next(iter(vertex.machine_vertices))
+        placement = sim.placements.get_placement_of_vertex(machine_vertex)
+        chip = sim.machine.get_chip_at(placement.x, placement.y)
+        ethernet = sim.machine.get_chip_at(
+            chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+        return EventInjector(
+            placement.x, placement.y, placement.p, ethernet.ip_address)
+
+    def inject_array(self, keys, payloads=None, rate=None):
+        """ Send events, packing as many as fit into each message.
+
+        :param ~numpy.ndarray keys: The 32-bit keys of the events
+        :param payloads:
+            The 32-bit payloads of the events, if they have them
+        :type payloads: ~numpy.ndarray or None
+        :param rate:
+            The most events to send per second, or ``None`` to send as fast
+            as possible. The rate is kept to a message at a time.
+        :type rate: float or None
+        :return: The number of messages sent
+        :rtype: int
+        """
+        n_messages = 0
+        n_events = 0
+        start = time.perf_counter()
+        for message, count in encode_eieio_data(keys, payloads):
+            if rate:
+                delay = start + n_events / rate - time.perf_counter()
+                if delay > _MIN_SLEEP:
+                    time.sleep(delay)
+            self._socket.sendto(self._sdp_prefix + message, self._address)
+            n_messages += 1
+            n_events += count
+        return n_messages
+
+    def close(self):
+        """ Release the socket.
+        """
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,283 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import socket
+import threading
+import numpy
+from spinnman.exceptions import SpinnmanInvalidPacketException
+from .eieio_arrays import (
+    EVENT_DTYPE, MAX_EVENTS_PER_MESSAGE, decode_eieio_data)
+
+#: The largest UDP datagram that can be received
+_MAX_DATAGRAM = 65536
+
+
+class EventRingBuffer(object):
+    """ A fixed-size ring of events, written by one thread and read by\
+        another.
+
+    Events that arrive when the ring is full are dropped (and counted)
+    rather than overwriting events that have not been read yet, so the
+    memory used never grows. Reading does not copy: :py:meth:`peek` gives
+    read-only views of the ring, which stay valid until the events are
+    handed back with :py:meth:`release`.
+    """
+
+    __slots__ = [
+        "_buffer", "_capacity", "_condition", "_dropped", "_read_count",
+        "_write_count"]
+
+    def __init__(self, capacity):
+        """
+        :param int capacity: The most events that can be held at once
+        """
+        self._capacity = int(capacity)
+        self._buffer = numpy.zeros(self._capacity, dtype=EVENT_DTYPE)
+        self._condition = threading.Condition()
+        # Counts of all events ever written and read; the positions in the
+        # ring are these modulo the capacity
+        self._write_count = 0
+        self._read_count = 0
+        self._dropped = 0
+
+    @property
+    def capacity(self):
+        """ The most events that can be held at once.
+
+        :rtype: int
+        """
+        return self._capacity
+
+    @property
+    def n_available(self):
+        """ The number of events that can be read.
+
+        :rtype: int
+        """
+        return self._write_count - self._read_count
+
+    @property
+    def n_dropped(self):
+        """ The number of events dropped because the ring was full.
+
+        :rtype: int
+        """
+        return self._dropped
+
+    def write_space(self, n_events):
+        """ Get a view of the free space in the ring, to be filled in\
+            directly and then committed with :py:meth:`commit`.
+
+        :param int n_events: The number of events wanted
+        :return:
+            A view of up to that many free slots; it may be shorter if the
+            ring is nearly full or wraps around
+        :rtype: ~numpy.ndarray
+        """
+        free = self._capacity - (self._write_count - self._read_count)
+        start = self._write_count % self._capacity
+        return self._buffer[start:start + min(n_events, free)]
+
+    def commit(self, n_events):
+        """ Make events filled in with :py:meth:`write_space` readable.
+
+        :param int n_events: How many of the slots were filled in
+        """
+        with self._condition:
+            self._write_count += n_events
+            self._condition.notify_all()
+
+    def write(self, events):
+        """ Copy events into the ring, dropping those that do not fit.
+
+        :param ~numpy.ndarray events: Events of type :py:data:`EVENT_DTYPE`
+        :return: The number of events written
+        :rtype: int
+        """
+        written = 0
+        while written < len(events):
+            space = self.write_space(len(events) - written)
+            if not len(space):
+                break
+            space[:] = events[written:written + len(space)]
+            written += len(space)
+            self.commit(len(space))
+        if written < len(events):
+            with self._condition:
+                self._dropped += len(events) - written
+        return written
+
+    def wait(self, timeout=None):
+        """ Wait until there are events to read.
+
+        :param timeout: The most seconds to wait, or ``None`` for no limit
+        :type timeout: float or None
+        :return: Whether there are events to read
+        :rtype: bool
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._write_count > self._read_count, timeout)
+
+    def peek(self, max_events=None):
+        """ Get the events that can be read, without copying them.
+
+        :param max_events: The most events to get, or ``None`` for all
+        :type max_events: int or None
+        :return:
+            Up to two read-only views of the ring, oldest events first; two
+            views are only needed when the events wrap around the end of the
+            ring
+        :rtype: list(~numpy.ndarray)
+        """
+        n_events = self.n_available
+        if max_events is not None:
+            n_events = min(n_events, max_events)
+        start = self._read_count % self._capacity
+        first = min(n_events, self._capacity - start)
+        views = [self._buffer[start:start + first]]
+        if n_events > first:
+            views.append(self._buffer[:n_events - first])
+        for view in views:
+            view.flags.writeable = False
+        return [view for view in views if len(view)]
+
+    def release(self, n_events):
+        """ Hand back events that have been read, so that their space can\
+            be reused. The views from :py:meth:`peek` of those events must not\
+            be used after this.
+
+        :param int n_events: The number of (oldest) events to hand back
+        """
+        with self._condition:
+            self._read_count += min(n_events, self.n_available)
+
+    def read(self, max_events=None):
+        """ Copy out and release the events that can be read.
+
+        :param max_events: The most events to read, or ``None`` for all
+        :type max_events: int or None
+        :rtype: ~numpy.ndarray
+        """
+        views = self.peek(max_events)
+        events = (
+            numpy.concatenate(views) if views
+            else numpy.zeros(0, dtype=EVENT_DTYPE))
+        self.release(len(events))
+        return events
+
+
+class RingBufferReceiver(object):
+    """ Receives the EIEIO messages sent by a\
+        :py:class:`~spinnaker_graph_front_end.LivePacketGather` and decodes\
+        them straight into an :py:class:`EventRingBuffer`, a whole datagram\
+        at a time.
+
+    Point the live packet gatherer at :py:attr:`local_port` of this host.
+    """
+
+    __slots__ = [
+        "_datagram", "_n_malformed", "_ring", "_running", "_scratch",
+        "_socket", "_thread"]
+
+    def __init__(self, capacity=1 << 20, local_port=0, local_host="",
+                 receive_buffer_size=8 * 1024 * 1024):
+        """
+        :param int capacity: The most events to hold before dropping them
+        :param int local_port:
+            The UDP port to listen on; by default, any free port
+        :param str local_host: The local address to listen on
+        :param int receive_buffer_size:
+            The size of the socket's receive buffer, which absorbs bursts
+        """
+        self._ring = EventRingBuffer(capacity)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer_size)
+        self._socket.bind((local_host, local_port))
+        # Lets the receiving thread notice that it has been closed
+        self._socket.settimeout(0.1)
+        self._datagram = bytearray(_MAX_DATAGRAM)
+        self._scratch = numpy.zeros(MAX_EVENTS_PER_MESSAGE, dtype=EVENT_DTYPE)
+        self._n_malformed = 0
+        self._running = True
+        self._thread = threading.Thread(
+            target=self.__receive, daemon=True, name="EIEIO ring receiver")
+        self._thread.start()
+
+    @property
+    def ring(self):
+        """ Where the received events are put.
+
+        :rtype: EventRingBuffer
+        """
+        return self._ring
+
+    @property
+    def local_port(self):
+        """ The UDP port being listened on.
+
+        :rtype: int
+        """
+        return self._socket.getsockname()[1]
+
+    @property
+    def n_malformed(self):
+        """ The number of datagrams that could not be decoded.
+
+        :rtype: int
+        """
+        return self._n_malformed
+
+    def __receive(self):
+        view = memoryview(self._datagram)
+        while self._running:
+            try:
+                n_bytes = self._socket.recv_into(self._datagram)
+            except socket.timeout:
+                continue
+            except OSError:
+                # The socket has been closed
+                return
+            self.__store(view[:n_bytes])
+
+    def __store(self, datagram):
+        space = self._ring.write_space(MAX_EVENTS_PER_MESSAGE)
+        direct = len(space) == MAX_EVENTS_PER_MESSAGE
+        try:
+            # Decode in place if the whole message is sure to fit
+            n_events = decode_eieio_data(
+                datagram, space if direct else self._scratch)
+        except SpinnmanInvalidPacketException:
+            self._n_malformed += 1
+            return
+        if direct:
+            self._ring.commit(n_events)
+        else:
+            self._ring.write(self._scratch[:n_events])
+
+    def close(self):
+        """ Stop receiving. Events already received can still be read.
+        """
+        self._running = False
+        self._thread.join()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
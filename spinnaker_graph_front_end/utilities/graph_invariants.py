@@ -0,0 +1,129 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+def _allows(allowed, n):
+    """
+    :param allowed:
+    :type allowed: int or ~collections.abc.Container(int) or None
+    :param int n:
+    :rtype: bool
+    """
+    if allowed is None:
+        return True
+    if isinstance(allowed, int):
+        return n == allowed
+    return n in allowed
+
+
+def _describe(allowed):
+    """
+    :param allowed:
+    :type allowed: int or ~collections.abc.Container(int)
+    :rtype: str
+    """
+    if isinstance(allowed, int):
+        return "exactly {}".format(allowed)
+    if isinstance(allowed, range) and allowed.step == 1:
+        return "{} to {}".format(allowed.start, allowed.stop - 1)
+    return "one of {}".format(sorted(allowed))
+
+
+class GraphInvariants(object):
+    """ What a vertex needs of the edges around it, so that a graph that\
+        does not give it that can be rejected before it is mapped.
+
+    Each number is ``None`` if any number will do, a whole number if
+    exactly that number is needed, or a container (such as a ``range``) of
+    the numbers allowed.
+    """
+
+    __slots__ = [
+        "_n_incoming_edges", "_n_outgoing_edges", "_n_outgoing_partitions",
+        "_self_loops"]
+
+    def __init__(self, n_incoming_edges=None, n_outgoing_edges=None,
+                 n_outgoing_partitions=None, self_loops=True):
+        """
+        :param n_incoming_edges: The edges that must end at the vertex
+        :type n_incoming_edges: int or ~collections.abc.Container(int) or None
+        :param n_outgoing_edges: The edges that must start at the vertex
+        :type n_outgoing_edges: int or ~collections.abc.Container(int) or None
+        :param n_outgoing_partitions:
+            The outgoing edge partitions that the vertex must send on
+        :type n_outgoing_partitions:
+            int or ~collections.abc.Container(int) or None
+        :param bool self_loops: Whether the vertex may have edges to itself
+        """
+        self._n_incoming_edges = n_incoming_edges
+        self._n_outgoing_edges = n_outgoing_edges
+        self._n_outgoing_partitions = n_outgoing_partitions
+        self._self_loops = self_loops
+
+    @property
+    def n_incoming_edges(self):
+        """ The edges that must end at the vertex.
+
+        :rtype: int or ~collections.abc.Container(int) or None
+        """
+        return self._n_incoming_edges
+
+    @property
+    def n_outgoing_edges(self):
+        """ The edges that must start at the vertex.
+
+        :rtype: int or ~collections.abc.Container(int) or None
+        """
+        return self._n_outgoing_edges
+
+    @property
+    def n_outgoing_partitions(self):
+        """ The outgoing edge partitions that the vertex must send on.
+
+        :rtype: int or ~collections.abc.Container(int) or None
+        """
+        return self._n_outgoing_partitions
+
+    @property
+    def self_loops(self):
+        """ Whether the vertex may have edges to itself.
+
+        :rtype: bool
+        """
+        return self._self_loops
+
+    def violations(self, vertex, degree_index):
+        """ Describe how the edges around a vertex break these invariants.
+
+        :param ~pacman.model.graphs.machine.MachineVertex vertex:
+        :param DegreeIndex degree_index: The degrees of the graph
+        :return: One description for each invariant that is broken
+        :rtype: list(str)
+        """
+        problems = list()
+        for allowed, n, what in (
+                (self._n_incoming_edges,
+                 degree_index.n_incoming_edges(vertex), "incoming edges"),
+                (self._n_outgoing_edges,
+                 degree_index.n_outgoing_edges(vertex), "outgoing edges"),
+                (self._n_outgoing_partitions,
+                 degree_index.n_outgoing_partitions(vertex),
+                 "outgoing partitions")):
+            if not _allows(allowed, n):
+                problems.append("{} has {} {} but needs {}".format(
+                    vertex, n, what, _describe(allowed)))
+        if not self._self_loops and degree_index.n_self_loops(vertex):
+            problems.append("{} has an edge to itself".format(vertex))
+        return problems
@@ -0,0 +1,220 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import tempfile
+import time
+import appdirs
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
+from spinn_front_end_common.abstract_models import AbstractHasAssociatedBinary
+from spinn_front_end_common.utilities.exceptions import (
+    ExecutableNotFoundException)
+from spinn_front_end_common.utilities.utility_objs import ExecutableFinder
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The version of the layout of the index file
+_INDEX_FORMAT = 1
+
+#: How recently a folder can have changed and still have its listing kept
+_RACY_NS = 2 * 10 ** 9
+
+
+def default_index_file():
+    """ Where the binary index is kept between runs, unless told otherwise.
+
+    :rtype: str
+    """
+    return os.path.join(
+        appdirs.user_cache_dir("spinnaker_graph_front_end"),
+        "binary_index.json")
+
+
+class IndexedExecutableFinder(ExecutableFinder):
+    """ An executable finder that lists each binary folder once and then\
+        answers lookups from that listing.
+
+    The listing of a folder is kept with the modification time of the
+    folder, and is only rebuilt when that changes (i.e., when a file is
+    added, removed or renamed in it). The listings are saved in an index
+    file so that later processes can use them without listing the folders
+    again. Each folder is checked at most once per finder unless a lookup
+    fails, in which case the folders are checked again before giving up.
+    """
+
+    __slots__ = ["_checked", "_dirty", "_index", "_index_file"]
+
+    def __init__(self, binary_search_paths=None,
+                 include_common_binaries_folder=True, index_file=None):
+        """
+        :param binary_search_paths:
+            The initial set of folders to search for binaries.
+        :type binary_search_paths: ~collections.abc.Iterable(str)
+        :param bool include_common_binaries_folder:
+            Whether to search the common model binaries folder last
+        :param index_file:
+            Where to keep the index between runs; if ``None``, the default
+            location is used. If ``False``, the index is not saved.
+        :type index_file: str or None or bool
+        """
+        # Must exist before the base class adds any paths
+        self._checked = set()
+        self._dirty = False
+        self._index = None
+        if index_file is None:
+            index_file = default_index_file()
+        self._index_file = index_file
+        super().__init__(
+            binary_search_paths, include_common_binaries_folder)
+
+    @overrides(ExecutableFinder.add_path)
+    def add_path(self, path):
+        super().add_path(os.path.abspath(path))
+
+    @property
+    def index_file(self):
+        """ Where the index is saved, or ``False`` if it is not saved.
+
+        :rtype: str or bool
+        """
+        return self._index_file
+
+    def __load_index(self):
+        if self._index is not None:
+            return
+        self._index = dict()
+        if not self._index_file:
+            return
+        try:
+            with open(self._index_file) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        if stored.get("format") != _INDEX_FORMAT:
+            return
+        for folder, (mtime, names) in stored.get("folders", {}).items():
+            self._index[folder] = (mtime, frozenset(names))
+
+    def __save_index(self):
+        if not self._dirty or not self._index_file:
+            return
+        self._dirty = False
+        folders = {
+            folder: [mtime, sorted(names)]
+            for folder, (mtime, names) in self._index.items()}
+        index_dir = os.path.dirname(self._index_file)
+        try:
+            os.makedirs(index_dir, exist_ok=True)
+            # Replace the file in one step so readers never see half of it
+            fd, tmp_name = tempfile.mkstemp(dir=index_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"format": _INDEX_FORMAT, "folders": folders}, f)
+            os.replace(tmp_name, self._index_file)
+        except OSError:
+            logger.warning(
+                "Could not save the binary index to {}", self._index_file)
+
+    def __names_in(self, folder):
+        """ Get the names of the files in a folder, listing the folder only\
+            if it has changed since it was last listed.
+
+        :param str folder:
+        :rtype: frozenset(str)
+        """
+        if folder in self._checked:
+            return self._index[folder][1]
+        self._checked.add(folder)
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            mtime = None
+        entry = self._index.get(folder)
+        if entry is None or entry[0] != mtime:
+            names = frozenset()
+            if mtime is not None:
+                with os.scandir(folder) as entries:
+                    names = frozenset(
+                        entry.name for entry in entries if entry.is_file())
+                # A folder changed this recently could change again without
+                # its time changing, so the listing must not be trusted
+                if time.time() * 10 ** 9 - mtime < _RACY_NS:
+                    mtime = None
+            self._index[folder] = (mtime, names)
+            self._dirty = True
+        return self._index[folder][1]
+
+    def __lookup(self, executable_name):
+        for folder in self._binary_search_paths:
+            if executable_name in self.__names_in(folder):
+                return os.path.join(folder, executable_name)
+        return None
+
+    def refresh(self):
+        """ Check all the folders again on the next lookup.
+        """
+        self._checked.clear()
+
+    @overrides(ExecutableFinder.get_executable_path)
+    def get_executable_path(self, executable_name):
+        self.__load_index()
+        path = self.__lookup(executable_name)
+        if path is None or not os.path.isfile(path):
+            # The index may be out of date for this process; look again
+            self.refresh()
+            path = self.__lookup(executable_name)
+        self.__save_index()
+        if path is None:
+            raise KeyError("Executable {} not found in path".format(
+                executable_name))
+        # As the base does, so that check_logs() sees this binary as used
+        if self._binary_log:
+            try:
+                with open(self._binary_log, "a") as log_file:
+                    log_file.write(path)
+                    log_file.write("\n")
+            except Exception:  # pylint: disable=broad-except
+                pass
+        return path
+
+    def __is_found(self, executable_name):
+        try:
+            self.get_executable_path(executable_name)
+            return True
+        except KeyError:
+            return False
+
+    def check_binaries(self, vertices):
+        """ Check that the binary of every vertex that has one can be\
+            found, so that a missing binary is reported before any mapping\
+            is done.
+
+        :param ~collections.abc.Iterable(~pacman.model.graphs.AbstractVertex)\
+                vertices:
+            The vertices to check; those without a binary are ignored
+        :raise ExecutableNotFoundException:
+            if any binary cannot be found
+        """
+        names = {
+            vertex.get_binary_file_name() for vertex in vertices
+            if isinstance(vertex, AbstractHasAssociatedBinary)}
+        missing = sorted(
+            name for name in names if not self.__is_found(name))
+        if missing:
+            raise ExecutableNotFoundException(
+                "Cannot find the binaries {} in any of {}".format(
+                    ", ".join(missing), self.binary_paths))
@@ -0,0 +1,278 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_front_end_common.utilities.sqlite_db import SQLiteDB
+
+#: Creates the table that the index is stored in within a database. Each row
+#: is one key and mask; the keys of a row are those that match ``"key"``
+#: under ``mask``, and are the atoms of the vertex from ``first_atom`` on, in
+#: order. Rows are keyed by their key, so the row of a key is found with
+#: ``WHERE "key" <= ? ORDER BY "key" DESC LIMIT 1`` and a check of the mask.
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS key_index(
+        "key" INTEGER PRIMARY KEY,
+        mask INTEGER,
+        vertex_id INTEGER,
+        vertex_label TEXT,
+        partition_id TEXT,
+        first_atom INTEGER,
+        FOREIGN KEY (vertex_id) REFERENCES Machine_vertices(vertex_id))
+    """
+
+_FULL_MASK = 0xFFFFFFFF
+
+
+def _is_contiguous(mask):
+    """ Whether the bits not in a mask are all below the bits in it, so\
+        that the keys matching the mask form a single range.
+
+    :param int mask:
+    :rtype: bool
+    """
+    free = ~mask & _FULL_MASK
+    return free & (free + 1) == 0
+
+
+def _rank_in_mask(keys, mask):
+    """ The positions of keys among those that match a mask, found by\
+        packing together the bits of each key that are not in the mask.
+
+    :param ~numpy.ndarray keys: The keys, as ``uint64``
+    :param int mask:
+    :rtype: ~numpy.ndarray
+    """
+    ranks = numpy.zeros(len(keys), dtype="uint64")
+    position = 0
+    for bit in range(32):
+        if not (mask >> bit) & 1:
+            ranks |= ((keys >> numpy.uint64(bit)) & numpy.uint64(1)) << \
+                numpy.uint64(position)
+            position += 1
+    return ranks
+
+
+class KeyIndex(object):
+    """ Maps multicast keys back to the vertices that send them and the\
+        atoms that they stand for, many keys at a time.
+
+    The keys and masks of the routing information are sorted once, so that
+    the entry of each key is found by binary search rather than by a walk
+    over the routing information. The atoms of a partition are numbered in
+    the order of its keys, across all of its keys and masks.
+    """
+
+    __slots__ = [
+        "_app_first_atoms", "_app_vertex_ids", "_application_vertices",
+        "_first_atoms", "_irregular", "_keys", "_masks", "_partition_ids",
+        "_vertex_ids", "_vertices"]
+
+    def __init__(self, routing_infos):
+        """
+        :param ~pacman.model.routing_info.RoutingInfo routing_infos:
+            The routing information of a mapped graph
+        """
+        vertex_ids = dict()
+        app_vertex_ids = dict()
+        self._vertices = list()
+        self._application_vertices = list()
+        rows = list()
+        for info in routing_infos:
+            vertex = info.partition.pre_vertex
+            if vertex not in vertex_ids:
+                vertex_ids[vertex] = len(self._vertices)
+                self._vertices.append(vertex)
+            app_vertex = getattr(vertex, "app_vertex", None)
+            app_id = -1
+            app_lo_atom = 0
+            if app_vertex is not None:
+                if app_vertex not in app_vertex_ids:
+                    app_vertex_ids[app_vertex] = len(
+                        self._application_vertices)
+                    self._application_vertices.append(app_vertex)
+                app_id = app_vertex_ids[app_vertex]
+                app_lo_atom = vertex.vertex_slice.lo_atom
+            first_atom = 0
+            for key_and_mask in info.keys_and_masks:
+                rows.append((
+                    key_and_mask.key, key_and_mask.mask, vertex_ids[vertex],
+                    info.partition.identifier, first_atom, app_id,
+                    app_lo_atom + first_atom))
+                first_atom += key_and_mask.n_keys
+        rows.sort(key=lambda row: row[0])
+
+        self._keys = numpy.array([row[0] for row in rows], dtype="uint64")
+        self._masks = numpy.array([row[1] for row in rows], dtype="uint64")
+        self._vertex_ids = numpy.array(
+            [row[2] for row in rows], dtype="int32")
+        self._partition_ids = [row[3] for row in rows]
+        self._first_atoms = numpy.array(
+            [row[4] for row in rows], dtype="int64")
+        self._app_vertex_ids = numpy.array(
+            [row[5] for row in rows], dtype="int32")
+        self._app_first_atoms = numpy.array(
+            [row[6] for row in rows], dtype="int64")
+        # Masks with gaps match keys spread over more than one range, which
+        # binary search cannot find; they are looked up one mask at a time
+        self._irregular = [
+            index for index, (_, mask, *_) in enumerate(rows)
+            if not _is_contiguous(mask)]
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def vertices(self):
+        """ The vertices that send keys, in the order of their identifiers\
+            in the results of :py:meth:`lookup`.
+
+        :rtype: list(~pacman.model.graphs.machine.MachineVertex)
+        """
+        return self._vertices
+
+    @property
+    def application_vertices(self):
+        """ The application vertices of the vertices that send keys, in the\
+            order of their identifiers in the results of\
+            :py:meth:`lookup_application`.
+
+        :rtype: list(~pacman.model.graphs.application.ApplicationVertex)
+        """
+        return self._application_vertices
+
+    def entries_of(self, keys):
+        """ Find which key and mask matches each key.
+
+        :param ~numpy.ndarray keys: The keys to look up
+        :return: The index of the entry of each key, or -1 if no entry matches
+        :rtype: ~numpy.ndarray
+        """
+        keys = numpy.asarray(keys).astype("uint64", copy=False)
+        entries = numpy.searchsorted(self._keys, keys, side="right") - 1
+        found = entries >= 0
+        candidates = entries[found]
+        found[found] = (
+            keys[found] & self._masks[candidates]) == self._keys[candidates]
+        entries[~found] = -1
+        for index in self._irregular:
+            missing = entries < 0
+            matched = (keys[missing] & self._masks[index]) == self._keys[index]
+            entries[numpy.flatnonzero(missing)[matched]] = index
+        return entries
+
+    @staticmethod
+    def __per_key(entries, values):
+        result = numpy.full(len(entries), -1, dtype=values.dtype)
+        found = entries >= 0
+        result[found] = values[entries[found]]
+        return result
+
+    def __atoms(self, keys, entries, first_atoms):
+        atoms = numpy.full(len(entries), -1, dtype="int64")
+        found = entries >= 0
+        keys = numpy.asarray(keys).astype("uint64", copy=False)[found]
+        entries = entries[found]
+        # For the usual masks, the rank of a key is just its free bits
+        ranks = keys & ~self._masks[entries] & numpy.uint64(_FULL_MASK)
+        for index in self._irregular:
+            of_entry = entries == index
+            ranks[of_entry] = _rank_in_mask(
+                keys[of_entry], int(self._masks[index]))
+        atoms[found] = first_atoms[entries] + ranks.astype("int64")
+        return atoms
+
+    def lookup(self, keys):
+        """ Find the vertex that sent each key, and the atom it stands for.
+
+        :param ~numpy.ndarray keys: The keys to look up
+        :return:
+            The identifier of the vertex of each key (its index in
+            :py:attr:`vertices`) and the atom of each key within that vertex;
+            both are -1 for keys that no vertex sends
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        entries = self.entries_of(keys)
+        vertex_ids = self.__per_key(entries, self._vertex_ids)
+        return vertex_ids, self.__atoms(keys, entries, self._first_atoms)
+
+    def lookup_application(self, keys):
+        """ Find the application vertex that sent each key, and the atom of\
+            that vertex it stands for.
+
+        :param ~numpy.ndarray keys: The keys to look up
+        :return:
+            The identifier of the application vertex of each key (its index in
+            :py:attr:`application_vertices`) and the atom of each key within
+            that vertex; both are -1 for keys that no application vertex
+            sends
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        entries = self.entries_of(keys)
+        app_ids = self.__per_key(entries, self._app_vertex_ids)
+        entries[app_ids < 0] = -1
+        return app_ids, self.__atoms(keys, entries, self._app_first_atoms)
+
+    def decode(self, key):
+        """ Find out where a single key comes from.
+
+        :param int key: The key to look up
+        :return: The vertex, the partition identifier and the atom, or
+            ``None`` if no vertex sends the key
+        :rtype: tuple(~pacman.model.graphs.machine.MachineVertex, str, int)
+            or None
+        """
+        entry = int(self.entries_of([key])[0])
+        if entry < 0:
+            return None
+        atom = int(self.__atoms(
+            [key], numpy.array([entry]), self._first_atoms)[0])
+        return (self._vertices[self._vertex_ids[entry]],
+                self._partition_ids[entry], atom)
+
+    def write_to_database(self, database_file):
+        """ Store the index in the ``key_index`` table of a notification\
+            database, replacing whatever is there.
+
+        Each row is joined to the vertex of the same label in the
+        ``Machine_vertices`` table; if the label is not unique there, the
+        ``vertex_id`` of the row is ``NULL``.
+
+        :param str database_file: The database to write to
+        """
+        db = SQLiteDB(database_file, text_factory=str)
+        try:
+            with db.transaction() as cur:
+                cur.execute(_CREATE_TABLE)
+                cur.execute("DELETE FROM key_index")
+                db_ids = {
+                    label: vertex_id
+                    for label, vertex_id in cur.execute(
+                        "SELECT label, MIN(vertex_id) FROM Machine_vertices "
+                        "GROUP BY label HAVING COUNT(*) = 1")}
+                cur.executemany(
+                    """
+                    INSERT INTO key_index(
+                        "key", mask, vertex_id, vertex_label, partition_id,
+                        first_atom)
+                    VALUES(?, ?, ?, ?, ?, ?)
+                    """, (
+                        (int(key), int(mask), db_ids.get(str(vertex.label)),
+                         str(vertex.label), partition_id, int(first_atom))
+                        for key, mask, vertex, partition_id, first_atom in zip(
+                            self._keys, self._masks,
+                            (self._vertices[i] for i in self._vertex_ids),
+                            self._partition_ids, self._first_atoms)))
+        finally:
+            db.close()
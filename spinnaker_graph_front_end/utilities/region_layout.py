@@ -0,0 +1,254 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from data_specification.enums import DataType
+from pacman.model.resources import ConstantSDRAM, VariableSDRAM
+from spinn_front_end_common.interface.buffer_management.recording_utilities \
+    import get_recording_header_size
+from spinn_front_end_common.utilities.constants import (
+    DATA_SPECABLE_BASIC_SETUP_INFO_N_BYTES, SIMULATION_N_BYTES)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+
+class Region(object):
+    """ The description of one memory region of a simulator vertex.
+
+    A region has a fixed size and may also grow by a fixed number of bytes
+    for each timestep that the simulation is planned to run for (e.g., for
+    simple recording regions). A *raw* region is only reserved by the data
+    specification; its contents are loaded directly from a buffer supplied
+    to :py:meth:`~.RegionLayoutVertex.set_raw_region_data`.
+    """
+
+    __slots__ = [
+        "_region_id", "_label", "_n_bytes", "_per_timestep_bytes", "_raw"]
+
+    def __init__(self, region_id, label, n_bytes=0, per_timestep_bytes=0,
+                 raw=False):
+        """
+        :param int region_id:
+            The ID of the region in the data specification, from 0 to 15
+        :param str label:
+            A human readable label for the region (used in reports)
+        :param int n_bytes:
+            The fixed size of the region, in bytes
+        :param int per_timestep_bytes:
+            The number of bytes the region grows by per planned timestep
+        :param bool raw:
+            Whether the contents are loaded directly rather than written by
+            the data specification
+        """
+        self._region_id = int(region_id)
+        self._label = label
+        self._n_bytes = int(n_bytes)
+        self._per_timestep_bytes = int(per_timestep_bytes)
+        self._raw = bool(raw)
+
+    @property
+    def region_id(self):
+        """ The ID of the region in the data specification.
+
+        :rtype: int
+        """
+        return self._region_id
+
+    @property
+    def label(self):
+        """ The label of the region.
+
+        :rtype: str
+        """
+        return self._label
+
+    @property
+    def n_bytes(self):
+        """ The fixed size of the region, in bytes.
+
+        :rtype: int
+        """
+        return self._n_bytes
+
+    @property
+    def per_timestep_bytes(self):
+        """ The number of bytes that the region needs per planned timestep.
+
+        :rtype: int
+        """
+        return self._per_timestep_bytes
+
+    @property
+    def raw(self):
+        """ Whether the contents of the region are loaded directly from a\
+            buffer instead of being written by the data specification.
+
+        :rtype: bool
+        """
+        return self._raw
+
+    def size(self, n_timesteps=0):
+        """ The size of the region when planned for a number of timesteps.
+
+        :param int n_timesteps: The number of timesteps to plan for
+        :rtype: int
+        """
+        return self._n_bytes + self._per_timestep_bytes * n_timesteps
+
+    def __repr__(self):
+        return "Region({}, {!r}, {}, {}, raw={})".format(
+            self._region_id, self._label, self._n_bytes,
+            self._per_timestep_bytes, self._raw)
+
+
+def system_region(region_id=0):
+    """ Describe the system region used by the simulation interface.
+
+    :param int region_id: Which region is the system region
+    :rtype: Region
+    """
+    return Region(region_id, "systemInfo", SIMULATION_N_BYTES)
+
+
+def recording_region(region_id, n_channels):
+    """ Describe the header of the recording channels of a vertex, as used\
+        by ``recording.h``. The recorded data is not in the region.
+
+    :param int region_id: Which region is the recording region
+    :param int n_channels: The number of recording channels
+    :rtype: Region
+    """
+    return Region(
+        region_id, "Recording", get_recording_header_size(n_channels))
+
+
+class RegionLayout(object):
+    """ A declarative description of the memory regions of a vertex.
+
+    The SDRAM requirement of the vertex and the reservation of its regions
+    in the data specification are both derived from the same description,
+    so the two cannot drift apart.
+    """
+
+    __slots__ = ["_regions"]
+
+    def __init__(self, regions):
+        """
+        :param ~collections.abc.Iterable(Region) regions:
+            The regions of the vertex
+        :raise ConfigurationException:
+            if two regions share the same ID
+        """
+        self._regions = dict()
+        for region in regions:
+            if region.region_id in self._regions:
+                raise ConfigurationException(
+                    "Region {} is declared more than once".format(
+                        region.region_id))
+            self._regions[region.region_id] = region
+
+    def __iter__(self):
+        return iter(self._regions.values())
+
+    def __len__(self):
+        return len(self._regions)
+
+    def __contains__(self, region_id):
+        return int(region_id) in self._regions
+
+    def __getitem__(self, region_id):
+        """ Get the description of a region by its ID.
+
+        :param int region_id:
+        :rtype: Region
+        """
+        return self._regions[int(region_id)]
+
+    @property
+    def fixed_sdram(self):
+        """ The SDRAM needed irrespective of the length of the run,\
+            including the region table.
+
+        :rtype: int
+        """
+        return DATA_SPECABLE_BASIC_SETUP_INFO_N_BYTES + sum(
+            region.n_bytes for region in self._regions.values())
+
+    @property
+    def per_timestep_sdram(self):
+        """ The SDRAM needed per planned timestep.
+
+        :rtype: int
+        """
+        return sum(region.per_timestep_bytes
+                   for region in self._regions.values())
+
+    def sdram_required(self, extra_fixed_sdram=0, extra_per_timestep_sdram=0):
+        """ Get the SDRAM required by the regions of this layout.
+
+        :param int extra_fixed_sdram:
+            Any SDRAM that the vertex needs that is not in a region, such as
+            the SDRAM of buffered recording channels
+        :param int extra_per_timestep_sdram:
+            Any SDRAM that the vertex needs per planned timestep that is not
+            in a region, such as the data of recording channels
+        :rtype: ~pacman.model.resources.AbstractSDRAM
+        """
+        fixed_sdram = self.fixed_sdram + extra_fixed_sdram
+        per_timestep_sdram = self.per_timestep_sdram + extra_per_timestep_sdram
+        if per_timestep_sdram:
+            return VariableSDRAM(fixed_sdram, per_timestep_sdram)
+        return ConstantSDRAM(fixed_sdram)
+
+    def reserve(self, spec, n_timesteps=0):
+        """ Reserve all the regions of this layout. Raw regions are\
+            reserved empty, as their contents are loaded separately.
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification being built
+        :param int n_timesteps:
+            The number of timesteps to reserve the growing regions for
+        """
+        for region in self._regions.values():
+            spec.reserve_memory_region(
+                region=region.region_id, size=region.size(n_timesteps),
+                label=region.label, empty=region.raw)
+
+    def write(self, spec, region_id, data, data_type=DataType.UINT32):
+        """ Write the whole contents of a region in one operation.
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification being built
+        :param int region_id: The region to write
+        :param data: The values to write; converted to a NumPy array
+        :type data: ~numpy.ndarray or list(int)
+        :param ~data_specification.enums.DataType data_type:
+            The type of each of the values
+        :raise ConfigurationException:
+            if the data is larger than the fixed size of the region, or the
+            region is a raw region
+        """
+        region = self[region_id]
+        if region.raw:
+            raise ConfigurationException(
+                "Region {} ({}) is raw; its data must be set with "
+                "set_raw_region_data".format(region.region_id, region.label))
+        data = numpy.asarray(data, dtype=data_type.numpy_typename)
+        n_bytes = data.size * data_type.size
+        if not region.per_timestep_bytes and n_bytes > region.n_bytes:
+            raise ConfigurationException(
+                "{} bytes do not fit in region {} ({}) of {} bytes".format(
+                    n_bytes, region.region_id, region.label, region.n_bytes))
+        spec.switch_write_focus(region.region_id)
+        spec.write_array(data, data_type=data_type)
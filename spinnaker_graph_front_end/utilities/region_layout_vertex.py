@@ -0,0 +1,189 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.abstract_base import abstractproperty
+from spinn_utilities.overrides import overrides
+from data_specification.enums import DataType
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.interface.buffer_management import (
+    recording_utilities)
+from spinn_front_end_common.interface.simulation.simulation_utilities import (
+    get_simulation_header_array)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from .simulator_vertex import SimulatorVertex
+
+
+class RegionLayoutVertex(SimulatorVertex):
+    """ A simulator vertex whose memory regions are declared once, in a\
+        :py:class:`~spinnaker_graph_front_end.utilities.RegionLayout`, from\
+        which its SDRAM requirement, the reservation of its regions and the\
+        loading of its raw regions are all derived.
+
+    A vertex that needs more than the SDRAM of its regions (for example,
+    the buffers of its recording channels, or DTCM and CPU cycles) can
+    override :py:attr:`resources_required`, passing the extra SDRAM to
+    :py:meth:`~.RegionLayout.sdram_required`.
+    """
+
+    __slots__ = ["_raw_region_data"]
+
+    def __init__(self, label, binary_name, constraints=(), app_vertex=None,
+                 vertex_slice=None):
+        """
+        :param str label:
+            The label for the vertex.
+        :param str binary_name:
+            The name of the APLX implementing the vertex.
+        :param constraints:
+            Any placement or key-allocation constraints on the vertex.
+        :type constraints:
+            ~collections.abc.Iterable(~pacman.model.constraints.AbstractConstraint)
+        :param app_vertex:
+            The application vertex that this vertex implements part of, if
+            it was made by a splitter
+        :type app_vertex:
+            ~pacman.model.graphs.application.ApplicationVertex or None
+        :param vertex_slice:
+            The slice of the application vertex that this vertex implements
+        :type vertex_slice: ~pacman.model.graphs.common.Slice or None
+        """
+        super().__init__(
+            label, binary_name, constraints, app_vertex, vertex_slice)
+        self._raw_region_data = dict()
+
+    @abstractproperty
+    def region_layout(self):
+        """ The declarative layout of the memory regions of this vertex.
+
+        :rtype: ~spinnaker_graph_front_end.utilities.RegionLayout
+        """
+
+    @property
+    @overrides(MachineVertex.resources_required)
+    def resources_required(self):
+        return ResourceContainer(sdram=self.region_layout.sdram_required())
+
+    def reserve_regions(self, spec, n_timesteps=0):
+        """
+        Reserve all the regions declared in the :py:attr:`region_layout`.
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification being built
+        :param int n_timesteps:
+            The number of timesteps to size the growing regions for.
+        """
+        self.region_layout.reserve(spec, n_timesteps)
+
+    def write_region(self, spec, region_id, data, data_type=DataType.UINT32):
+        """
+        Write the contents of a declared region as a single array.
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification being built
+        :param int region_id:
+            Which region to write.
+        :param data:
+            The values to write.
+        :type data: ~numpy.ndarray or list(int)
+        :param ~data_specification.enums.DataType data_type:
+            The type of the values.
+        """
+        self.region_layout.write(spec, region_id, data, data_type)
+
+    def write_system_region(self, spec, region_id=0, timed=True):
+        """
+        Write the system region declared in the :py:attr:`region_layout`.
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification being built
+        :param int region_id:
+            Which region is the system region.
+        :param bool timed:
+            Whether the vertex uses the system timestep and time scale
+            factor; an untimed vertex gets zero for both.
+        """
+        if timed:
+            machine_time_step = self.front_end.machine_time_step()
+            time_scale_factor = self.front_end.time_scale_factor()
+        else:
+            machine_time_step = time_scale_factor = 0
+        self.write_region(spec, region_id, get_simulation_header_array(
+            self.get_binary_file_name(), machine_time_step,
+            time_scale_factor))
+
+    def write_recording_region(self, spec, region_id, channel_sizes):
+        """
+        Write the header of a recording region declared in the
+        :py:attr:`region_layout` (see
+        :py:func:`~spinnaker_graph_front_end.utilities.recording_region`).
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification being built
+        :param int region_id:
+            Which region is the recording region.
+        :param list(int) channel_sizes:
+            The sizes of each of the recording channels.
+        """
+        self.write_region(
+            spec, region_id,
+            recording_utilities.get_recording_header_array(channel_sizes))
+
+    def set_raw_region_data(self, region_id, data):
+        """
+        Supply the contents of a raw region as a contiguous buffer. The
+        buffer is loaded directly into SDRAM in bulk after the data
+        specifications have been executed, using the fast data-in path
+        where it is available; it is not encoded into the data
+        specification at all.
+
+        .. note::
+            The buffer is referenced, not copied, and is reloaded whenever
+            the application data is loaded onto the machine.
+
+        :param int region_id:
+            Which region to load; must be declared raw in the
+            :py:attr:`region_layout`.
+        :param data:
+            The contents of the region
+        :type data: ~numpy.ndarray or bytes or bytearray or memoryview
+        :raise ConfigurationException:
+            if the region is not raw or the data does not fit in it
+        """
+        region = self.region_layout[region_id]
+        if not region.raw:
+            raise ConfigurationException(
+                "Region {} ({}) of {} is not a raw region".format(
+                    region.region_id, region.label, self))
+        if isinstance(data, numpy.ndarray):
+            data = numpy.ascontiguousarray(data)
+        buffer = memoryview(data).cast("B")
+        if len(buffer) > region.n_bytes:
+            raise ConfigurationException(
+                "{} bytes do not fit in region {} ({}) of {} bytes".format(
+                    len(buffer), region.region_id, region.label,
+                    region.n_bytes))
+        self._raw_region_data[region.region_id] = buffer
+
+    @property
+    def raw_region_data(self):
+        """
+        The buffers to load into the raw regions of this vertex, by region
+        ID.
+
+        :rtype: dict(int, memoryview)
+        """
+        return self._raw_region_data
@@ -0,0 +1,275 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import queue
+import threading
+import time
+import numpy
+from spinn_utilities.log import FormatAdapter
+from spinn_front_end_common.utilities import globals_variables
+from .eieio_arrays import EVENT_DTYPE
+from .event_injector import EventInjector
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The type of the records of a replay file: the timestep of each event, its
+#: key and its payload, as little-endian 32-bit values, sorted by timestep
+REPLAY_DTYPE = EVENT_DTYPE
+
+#: Pacing delays shorter than this are not worth sleeping for
+_MIN_SLEEP = 0.0005
+
+
+def write_replay_file(filename, timesteps, keys, payloads=None):
+    """ Write events to a file that :py:class:`ReplaySource` can replay.
+
+    :param str filename: The file to write
+    :param ~numpy.ndarray timesteps: The timestep of each event
+    :param ~numpy.ndarray keys: The key of each event
+    :param payloads: The payload of each event, if any
+    :type payloads: ~numpy.ndarray or None
+    """
+    events = numpy.zeros(len(keys), dtype=REPLAY_DTYPE)
+    events["timestamp"] = timesteps
+    events["key"] = keys
+    if payloads is not None:
+        events["payload"] = payloads
+    events = events[numpy.argsort(events["timestamp"], kind="stable")]
+    events.tofile(filename)
+
+
+class ReplaySource(object):
+    """ Replays a file of recorded events into a live input, each event at\
+        the timestep it was recorded at.
+
+    The file is memory-mapped, never read in whole. A reader thread copies
+    out blocks of timesteps ahead of the machine clock, keeping at most a
+    fixed number of them in memory, and a sender thread sends the events of
+    each timestep when that timestep is due. The machine clock is taken to
+    start when :py:meth:`start` is called, or at a given time, and to
+    advance by one timestep every ``machine_time_step * time_scale_factor``
+    microseconds.
+    """
+
+    __slots__ = [
+        "_block_steps", "_blocks", "_clock_start", "_events",
+        "_events_sent", "_injector", "_lag", "_max_lag", "_n_events",
+        "_reader", "_sender", "_step_seconds", "_stopping",
+        "_with_payloads"]
+
+    def __init__(self, filename, injector, step_seconds, with_payloads=False,
+                 block_steps=100, read_ahead_blocks=10):
+        """
+        :param str filename:
+            The file of events, with records of :py:data:`REPLAY_DTYPE`
+        :param EventInjector injector: Where to send the events
+        :param float step_seconds:
+            The wall-clock length of a timestep of the simulation, in seconds
+        :param bool with_payloads: Whether to send the payloads of the events
+        :param int block_steps: The number of timesteps read at a time
+        :param int read_ahead_blocks:
+            The most blocks to have read but not yet sent
+        """
+        self._events = numpy.memmap(filename, dtype=REPLAY_DTYPE, mode="r")
+        self._n_events = len(self._events)
+        self._injector = injector
+        self._step_seconds = step_seconds
+        self._with_payloads = with_payloads
+        self._block_steps = block_steps
+        self._blocks = queue.Queue(maxsize=read_ahead_blocks)
+        self._stopping = threading.Event()
+        self._clock_start = None
+        self._reader = None
+        self._sender = None
+        self._events_sent = 0
+        self._lag = 0.0
+        self._max_lag = 0.0
+
+    @staticmethod
+    def for_vertex(vertex, filename, **kwargs):
+        """ Make a replay source for a live input vertex of the current\
+            simulation, which must have been mapped. The timestep comes from\
+            the simulation.
+
+        :param vertex: The live input vertex
+        :type vertex: ~pacman.model.graphs.application.ApplicationVertex or
+            ~pacman.model.graphs.machine.MachineVertex
+        :param str filename: The file of events
+        :param kwargs: Other parameters of :py:class:`ReplaySource`
+        :rtype: ReplaySource
+        """
+        sim = globals_variables.get_simulator()
+        step_seconds = sim.machine_time_step * sim.time_scale_factor / 1e6
+        return ReplaySource(
+            filename, EventInjector.for_vertex(vertex), step_seconds,
+            **kwargs)
+
+    @property
+    def n_events(self):
+        """ The number of events in the file.
+
+        :rtype: int
+        """
+        return self._n_events
+
+    @property
+    def events_sent(self):
+        """ The number of events sent so far.
+
+        :rtype: int
+        """
+        return self._events_sent
+
+    @property
+    def lag(self):
+        """ How far behind the machine clock the last timestep was sent,\
+            in seconds.
+
+        :rtype: float
+        """
+        return self._lag
+
+    @property
+    def max_lag(self):
+        """ The furthest behind the machine clock that any timestep was\
+            sent, in seconds.
+
+        :rtype: float
+        """
+        return self._max_lag
+
+    @property
+    def lag_steps(self):
+        """ :py:attr:`lag` in timesteps.
+
+        :rtype: float
+        """
+        return self._lag / self._step_seconds
+
+    @property
+    def finished(self):
+        """ Whether every event has been sent (or the replay was stopped).
+
+        :rtype: bool
+        """
+        return self._sender is not None and not self._sender.is_alive()
+
+    def start(self, clock_start=None):
+        """ Start replaying.
+
+        :param clock_start:
+            The :py:func:`time.perf_counter` value at which timestep 0 of
+            the simulation started; if ``None``, now
+        :type clock_start: float or None
+        """
+        self._clock_start = (
+            time.perf_counter() if clock_start is None else clock_start)
+        self._reader = threading.Thread(
+            target=self.__read, daemon=True, name="replay reader")
+        self._sender = threading.Thread(
+            target=self.__send, daemon=True, name="replay sender")
+        self._reader.start()
+        self._sender.start()
+
+    def __read(self):
+        timesteps = self._events["timestamp"]
+        index = 0
+        first_step = int(timesteps[0]) if len(timesteps) else 0
+        while not self._stopping.is_set() and index < self._n_events:
+            end_step = first_step + self._block_steps
+            end = int(numpy.searchsorted(timesteps, end_step, side="left"))
+            if end == index:
+                # Nothing to send for a while; skip to the next event
+                first_step = int(timesteps[index])
+                continue
+            # Copy the block out, so only blocks in the queue use memory
+            block = numpy.array(self._events[index:end])
+            bounds = numpy.searchsorted(
+                block["timestamp"], numpy.arange(first_step, end_step + 1))
+            self.__put((first_step, block, bounds))
+            index = end
+            first_step = end_step
+        self.__put(None)
+
+    def __put(self, item):
+        while not self._stopping.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __send(self):
+        while not self._stopping.is_set():
+            try:
+                item = self._blocks.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is None:
+                return
+            self.__send_block(*item)
+
+    def __send_block(self, first_step, block, bounds):
+        for step_offset in numpy.flatnonzero(bounds[1:] > bounds[:-1]):
+            step = first_step + int(step_offset)
+            events = block[bounds[step_offset]:bounds[step_offset + 1]]
+            due = self._clock_start + step * self._step_seconds
+            delay = due - time.perf_counter()
+            if delay > _MIN_SLEEP and self._stopping.wait(delay):
+                return
+            if self._stopping.is_set():
+                return
+            self._lag = max(0.0, time.perf_counter() - due)
+            self._max_lag = max(self._max_lag, self._lag)
+            self._injector.inject_array(
+                events["key"],
+                events["payload"] if self._with_payloads else None)
+            self._events_sent += len(events)
+
+    def join(self, timeout=None):
+        """ Wait for the replay to finish.
+
+        :param timeout: The most seconds to wait, or ``None`` for no limit
+        :type timeout: float or None
+        :return: Whether the replay has finished
+        :rtype: bool
+        """
+        if self._sender is not None:
+            self._sender.join(timeout)
+        return self.finished
+
+    def stop(self):
+        """ Stop replaying, and release the file and the injector.
+        """
+        self._stopping.set()
+        for thread in (self._reader, self._sender):
+            if thread is not None:
+                thread.join()
+        if self._lag:
+            logger.info(
+                "Replay finished {:.3f}s ({:.1f} timesteps) behind the "
+                "machine clock; at most {:.3f}s behind", self._lag,
+                self.lag_steps, self._max_lag)
+        self._injector.close()
+        # Drops the mapping of the file
+        self._events = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
@@ -0,0 +1,236 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import defaultdict
+import numpy
+from spinn_utilities.overrides import overrides
+from pacman.exceptions import (
+    PacmanConfigurationException, PacmanPartitionException, PacmanValueError)
+from pacman.model.graphs import AbstractVirtual
+from pacman.model.graphs.common import Slice
+from pacman.model.graphs.machine import MachineEdge
+from pacman.model.partitioner_interfaces import LegacyPartitionerAPI
+from pacman.model.partitioner_splitters.abstract_splitters import (
+    AbstractSplitterSlice)
+from pacman.utilities.algorithm_utilities.partition_algorithm_utilities \
+    import get_remaining_constraints
+from .abstract_has_atom_connections import AbstractHasAtomConnections
+
+
+def _slice_index(slices, atoms):
+    """ Find the slice that each atom is in.
+
+    :param list(~pacman.model.graphs.common.Slice) slices:
+        Slices, in order of their atoms, that cover all the atoms
+    :param ~numpy.ndarray atoms:
+    :rtype: ~numpy.ndarray
+    """
+    return numpy.searchsorted(
+        [vertex_slice.hi_atom for vertex_slice in slices], atoms)
+
+
+class ResourceSplitter(AbstractSplitterSlice):
+    """ Splits an application vertex into slices that each take as many\
+        atoms as fit on the core with the most resources left, finding the\
+        number of atoms by binary search over what the vertex says a slice\
+        needs.
+
+    The vertex must be a
+    :py:class:`~pacman.model.partitioner_interfaces.LegacyPartitionerAPI`,
+    telling the SDRAM, DTCM and CPU cycles of a slice, which must not fall
+    as the slice grows, and making the machine vertex of a slice. Incoming
+    application edges that are :py:class:`AbstractHasAtomConnections` only
+    get machine edges between the slices that they connect.
+    """
+
+    __slots__ = ["_connections"]
+
+    SPLITTER_NAME = "ResourceSplitter"
+
+    NOT_SUITABLE_VERTEX_ERROR = (
+        "The vertex {} cannot be split by the {} as it is not a "
+        "LegacyPartitionerAPI")
+
+    def __init__(self, splitter_name=None):
+        """
+        :param splitter_name: The name of the splitter, for messages
+        :type splitter_name: str or None
+        """
+        super().__init__(
+            self.SPLITTER_NAME if splitter_name is None else splitter_name)
+        self._connections = dict()
+
+    @overrides(AbstractSplitterSlice.set_governed_app_vertex)
+    def set_governed_app_vertex(self, app_vertex):
+        if not isinstance(app_vertex, LegacyPartitionerAPI):
+            raise PacmanConfigurationException(
+                self.NOT_SUITABLE_VERTEX_ERROR.format(
+                    app_vertex.label, self._splitter_name))
+        super().set_governed_app_vertex(app_vertex)
+
+    @overrides(AbstractSplitterSlice.create_machine_vertex)
+    def create_machine_vertex(
+            self, vertex_slice, resources, label, remaining_constraints):
+        return self._governed_app_vertex.create_machine_vertex(
+            vertex_slice, resources, label, remaining_constraints)
+
+    @overrides(AbstractSplitterSlice.get_resources_used_by_atoms)
+    def get_resources_used_by_atoms(self, vertex_slice):
+        return self._governed_app_vertex.get_resources_used_by_atoms(
+            vertex_slice)
+
+    def _fits(self, lo_atom, n_atoms, available, plan_n_time_steps):
+        """
+        :param int lo_atom:
+        :param int n_atoms:
+        :param ~pacman.model.resources.ResourceContainer available:
+        :param int plan_n_time_steps:
+        :return: What the slice needs, if it fits, or ``None``
+        :rtype: ~pacman.model.resources.ResourceContainer or None
+        """
+        used = self.get_resources_used_by_atoms(
+            Slice(lo_atom, lo_atom + n_atoms - 1))
+        if self._find_max_ratio(used, available, plan_n_time_steps) > 1.0:
+            return None
+        return used
+
+    def _largest_slice(self, lo_atom, most_atoms, resource_tracker):
+        """ Find the most atoms from ``lo_atom`` that fit on a core.
+
+        :param int lo_atom:
+        :param int most_atoms: The most atoms that the slice may have
+        :param ~pacman.utilities.utility_objs.ResourceTracker \
+                resource_tracker:
+        :return: The number of atoms and what they need
+        :rtype: tuple(int, ~pacman.model.resources.ResourceContainer)
+        :raises PacmanPartitionException: If not even one atom fits
+        """
+        plan_n_time_steps = resource_tracker.plan_n_time_steps
+        app_vertex = self._governed_app_vertex
+        used = self.get_resources_used_by_atoms(
+            Slice(lo_atom, lo_atom + most_atoms - 1))
+        available = resource_tracker.\
+            get_maximum_constrained_resources_available(
+                used, app_vertex.constraints)
+        if self._find_max_ratio(used, available, plan_n_time_steps) <= 1.0:
+            return most_atoms, used
+        if self._is_fixed_atoms_per_core:
+            fits = None
+        else:
+            fits = self._fits(lo_atom, 1, available, plan_n_time_steps)
+        if fits is None:
+            raise PacmanPartitionException(
+                self.NO_MORE_RESOURCE_AVAILABLE_ERROR.format(
+                    app_vertex, lo_atom,
+                    used.sdram.get_total_sdram(plan_n_time_steps),
+                    available.sdram.get_total_sdram(plan_n_time_steps)))
+
+        # Invariant: low atoms fit and high atoms do not
+        low, high = 1, most_atoms
+        while high - low > 1:
+            middle = (low + high) // 2
+            middle_fits = self._fits(
+                lo_atom, middle, available, plan_n_time_steps)
+            if middle_fits is None:
+                high = middle
+            else:
+                low, fits = middle, middle_fits
+        return low, fits
+
+    @overrides(AbstractSplitterSlice.create_machine_vertices)
+    def create_machine_vertices(self, resource_tracker, machine_graph):
+        app_vertex = self._governed_app_vertex
+        constraints = get_remaining_constraints(app_vertex)
+        is_virtual = isinstance(app_vertex, AbstractVirtual)
+        lo_atom = 0
+        while lo_atom < app_vertex.n_atoms:
+            most_atoms = min(
+                self._max_atoms_per_core, app_vertex.n_atoms - lo_atom)
+            if is_virtual:
+                n_atoms = most_atoms
+                resources = self.get_resources_used_by_atoms(
+                    Slice(lo_atom, lo_atom + n_atoms - 1))
+            else:
+                n_atoms, resources = self._largest_slice(
+                    lo_atom, most_atoms, resource_tracker)
+                try:
+                    resource_tracker.allocate_constrained_resources(
+                        resources, app_vertex.constraints)
+                except PacmanValueError as e:
+                    raise PacmanValueError(
+                        self.FAIL_TO_ALLOCATE_RESOURCES.format(
+                            app_vertex, e)) from e
+            vertex_slice = Slice(lo_atom, lo_atom + n_atoms - 1)
+            machine_graph.add_vertex(self.create_machine_vertex(
+                vertex_slice, resources, self.MACHINE_LABEL.format(
+                    app_vertex.label, vertex_slice.lo_atom,
+                    vertex_slice.hi_atom),
+                constraints))
+            lo_atom += n_atoms
+        self._called = True
+        return True
+
+    def _connected_vertices(self, app_edge):
+        """ Work out which machine vertices of this vertex each slice of\
+            the pre vertex of an edge sends to, for all the connections of\
+            the edge at once.
+
+        :param AbstractHasAtomConnections app_edge:
+        :return: The slices of the pre vertex, and the machine vertices sent
+            to by each slice that sends to any
+        :rtype: tuple(set(~pacman.model.graphs.common.Slice),
+            dict(~pacman.model.graphs.common.Slice,
+            list(~pacman.model.graphs.machine.MachineVertex)))
+        """
+        connected = self._connections.get(app_edge)
+        if connected is None:
+            pre_slices, _ = app_edge.pre_vertex.splitter.\
+                get_out_going_slices()
+            pre_slices = sorted(pre_slices, key=lambda s: s.lo_atom)
+            post_vertices = sorted(
+                self._governed_app_vertex.machine_vertices,
+                key=lambda v: v.vertex_slice.lo_atom)
+            pre_atoms, post_atoms = app_edge.get_atom_connections()
+            pairs = numpy.unique(
+                _slice_index(pre_slices, pre_atoms) * len(post_vertices) +
+                _slice_index([vertex.vertex_slice
+                              for vertex in post_vertices], post_atoms))
+            connected = defaultdict(list)
+            for pre_index, post_index in zip(*numpy.divmod(
+                    pairs, len(post_vertices))):
+                connected[pre_slices[pre_index]].append(
+                    post_vertices[post_index])
+            connected = (set(pre_slices), connected)
+            self._connections[app_edge] = connected
+        return connected
+
+    @overrides(AbstractSplitterSlice.get_in_coming_vertices)
+    def get_in_coming_vertices(
+            self, edge, outgoing_edge_partition, src_machine_vertex):
+        if isinstance(edge, AbstractHasAtomConnections):
+            pre_slices, connected = self._connected_vertices(edge)
+            # A pre vertex split in some other way gets all the edges
+            if src_machine_vertex.vertex_slice in pre_slices:
+                return {
+                    vertex: [MachineEdge]
+                    for vertex in connected.get(
+                        src_machine_vertex.vertex_slice, ())}
+        return super().get_in_coming_vertices(
+            edge, outgoing_edge_partition, src_machine_vertex)
+
+    @overrides(AbstractSplitterSlice.reset_called)
+    def reset_called(self):
+        super().reset_called()
+        self._connections = dict()
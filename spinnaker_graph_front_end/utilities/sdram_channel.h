@@ -0,0 +1,172 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Channels that hand elements from one core to another on the same
+//!        chip through SDRAM, as set up by the Python class
+//!        spinnaker_graph_front_end.utilities.SDRAMChannelVertex.
+//!
+//! Each channel is a ring of a power-of-two number of slots, after the
+//! counts of the elements ever written to and read from it. Only the
+//! sender changes the first count and only the receiver the second, so no
+//! locks are needed. A depth of two makes a double buffer.
+//!
+//! At start-up, the sender must call sdram_channel_table_reset() on its
+//! table of channels to write to before the first timestep. Each timestep,
+//! it then calls sdram_channel_send() (or sdram_channel_write_slot() and
+//! sdram_channel_commit_write()) for each channel, and the receiver calls
+//! sdram_channel_receive() (or sdram_channel_read_slot() and
+//! sdram_channel_commit_read()). The ends count the elements they hand
+//! over, and the times they cannot because the channel is full or empty,
+//! in the table, where the host can read them.
+#ifndef __SDRAM_CHANNEL_H__
+#define __SDRAM_CHANNEL_H__
+
+#include <common-typedefs.h>
+#include <spin1_api.h>
+
+//! The counts at the start of each channel in SDRAM
+typedef struct sdram_channel_header_t {
+    //! The number of elements ever written to the channel
+    volatile uint32_t n_written;
+    //! The number of elements ever read from the channel
+    volatile uint32_t n_read;
+} sdram_channel_header_t;
+
+//! One channel of a table, as written by the host
+typedef struct sdram_channel_t {
+    //! The channel, followed by its slots
+    sdram_channel_header_t *header;
+    //! The size of each slot, in bytes; a whole number of words
+    uint32_t slot_size;
+    //! The number of slots; a power of two
+    uint32_t depth;
+    //! The number of elements this core has handed over through the channel
+    uint32_t n_handoffs;
+    //! The number of times this core could not hand over an element,
+    //! because the channel was full (when writing) or empty (when reading)
+    uint32_t n_blocked;
+} sdram_channel_t;
+
+//! A table of channels, as written by the host into a region
+typedef struct sdram_channel_table_t {
+    //! The number of channels
+    uint32_t n_channels;
+    //! The channels
+    sdram_channel_t channels[];
+} sdram_channel_table_t;
+
+//! \brief Get a slot of a channel.
+//! \param[in] channel: The channel
+//! \param[in] count: The number of elements written or read before the one
+//!                   in the slot
+//! \return The slot
+static inline void *sdram_channel_slot(
+        const sdram_channel_t *channel, uint32_t count) {
+    uint8_t *slots = (uint8_t *) &channel->header[1];
+    return &slots[(count & (channel->depth - 1)) * channel->slot_size];
+}
+
+//! \brief Empty the channels that a core writes to, and forget how they
+//!        have been used.
+//! \param[in] table: The table of channels that the core writes to
+static inline void sdram_channel_table_reset(sdram_channel_table_t *table) {
+    for (uint32_t i = 0; i < table->n_channels; i++) {
+        sdram_channel_t *channel = &table->channels[i];
+        channel->header->n_written = 0;
+        channel->header->n_read = 0;
+        channel->n_handoffs = 0;
+        channel->n_blocked = 0;
+    }
+}
+
+//! \brief Get the slot that the next element should be written into,
+//!        without copying it; the element is handed over by
+//!        sdram_channel_commit_write().
+//! \param[in] channel: The channel to write to
+//! \return The slot, or NULL if the channel is full
+static inline void *sdram_channel_write_slot(sdram_channel_t *channel) {
+    sdram_channel_header_t *header = channel->header;
+    uint32_t n_written = header->n_written;
+    if (n_written - header->n_read >= channel->depth) {
+        channel->n_blocked++;
+        return NULL;
+    }
+    return sdram_channel_slot(channel, n_written);
+}
+
+//! \brief Hand over the element written into the slot given by
+//!        sdram_channel_write_slot().
+//! \param[in] channel: The channel written to
+static inline void sdram_channel_commit_write(sdram_channel_t *channel) {
+    channel->header->n_written++;
+    channel->n_handoffs++;
+}
+
+//! \brief Get the slot that the next element should be read from, without
+//!        copying it; the slot is given back by sdram_channel_commit_read().
+//! \param[in] channel: The channel to read from
+//! \return The slot, or NULL if the channel is empty
+static inline void *sdram_channel_read_slot(sdram_channel_t *channel) {
+    sdram_channel_header_t *header = channel->header;
+    uint32_t n_read = header->n_read;
+    if (n_read == header->n_written) {
+        channel->n_blocked++;
+        return NULL;
+    }
+    return sdram_channel_slot(channel, n_read);
+}
+
+//! \brief Give back the slot given by sdram_channel_read_slot(), so that
+//!        the sender can write to it again.
+//! \param[in] channel: The channel read from
+static inline void sdram_channel_commit_read(sdram_channel_t *channel) {
+    channel->header->n_read++;
+    channel->n_handoffs++;
+}
+
+//! \brief Copy an element into a channel.
+//! \param[in] channel: The channel to write to
+//! \param[in] element: The element, of the size of the slots
+//! \return Whether the element was written; false if the channel was full
+static inline bool sdram_channel_send(
+        sdram_channel_t *channel, const void *element) {
+    void *slot = sdram_channel_write_slot(channel);
+    if (slot == NULL) {
+        return false;
+    }
+    spin1_memcpy(slot, element, channel->slot_size);
+    sdram_channel_commit_write(channel);
+    return true;
+}
+
+//! \brief Copy an element out of a channel.
+//! \param[in] channel: The channel to read from
+//! \param[out] element: Where to put the element, of the size of the slots
+//! \return Whether an element was read; false if the channel was empty
+static inline bool sdram_channel_receive(
+        sdram_channel_t *channel, void *element) {
+    void *slot = sdram_channel_read_slot(channel);
+    if (slot == NULL) {
+        return false;
+    }
+    spin1_memcpy(element, slot, channel->slot_size);
+    sdram_channel_commit_read(channel);
+    return true;
+}
+
+#endif  // __SDRAM_CHANNEL_H__
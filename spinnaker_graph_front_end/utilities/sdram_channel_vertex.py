@@ -0,0 +1,278 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from pacman.executor.injection_decorator import inject_items
+from pacman.model.graphs import AbstractSupportsSDRAMEdges
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.helpful_functions import (
+    locate_memory_region_for_placement)
+from .region_layout_vertex import RegionLayoutVertex
+
+#: The depth of a channel with one element being read while the next is
+#: written
+DOUBLE_BUFFERED = 2
+
+#: The counts of elements written and read at the start of each channel
+CHANNEL_HEADER_BYTES = 2 * BYTES_PER_WORD
+
+# The words of a channel in a table: address, element size, depth, handoffs
+# and times blocked
+_CHANNEL_WORDS = 5
+_N_HANDOFFS = 3
+_N_BLOCKED = 4
+
+
+def _channels_out(vertex, partitions):
+    """ The edges of the SDRAM channels that a vertex writes to.
+
+    :param MachineVertex vertex:
+    :param iterable(AbstractSDRAMPartition) partitions:
+    :rtype: list(~pacman.model.graphs.machine.SDRAMMachineEdge)
+    """
+    return [edge for partition in partitions for edge in partition.edges
+            if edge.pre_vertex is vertex]
+
+
+def _channels_in(vertex, partitions):
+    """ The edges of the SDRAM channels that a vertex reads from.
+
+    :param MachineVertex vertex:
+    :param iterable(AbstractSDRAMPartition) partitions:
+    :rtype: list(~pacman.model.graphs.machine.SDRAMMachineEdge)
+    """
+    return [edge for partition in partitions for edge in partition.edges
+            if edge.post_vertex is vertex]
+
+
+class SDRAMChannelVertex(RegionLayoutVertex, AbstractSupportsSDRAMEdges):
+    """ A simulator vertex that passes elements of a fixed size to and from\
+        the vertices on the same chip through SDRAM edges, each edge being a\
+        channel with a ring of a fixed number of slots.
+
+    A pipeline of such vertices can hand data on from one stage to the
+    next every timestep without sending a packet. With a depth of 2 each
+    channel is double buffered: the receiver reads one element while the
+    sender writes the next. Deeper channels let the stages run out of step
+    for a while. Each end counts the elements that it hands over, and the
+    times that it cannot because the channel is full or empty; see
+    :py:meth:`read_channel_counters`.
+
+    The binary uses ``sdram_channel.h``, installed next to this module,
+    which reads the tables written by :py:meth:`write_channel_tables`. The
+    vertices at both ends of each SDRAM edge must have the same element
+    size and depth. The :py:attr:`region_layout` must declare the other
+    regions of the vertex, but not the two channel tables.
+    """
+
+    __slots__ = ["_element_size", "_depth", "_out_region", "_in_region"]
+
+    def __init__(self, label, binary_name, element_size,
+                 depth=DOUBLE_BUFFERED, out_region=1, in_region=2,
+                 constraints=(), app_vertex=None, vertex_slice=None):
+        """
+        :param str label: The label for the vertex
+        :param str binary_name: The name of the APLX implementing the vertex
+        :param int element_size:
+            The size of each element handed over, in bytes; each slot is
+            rounded up to whole words
+        :param int depth:
+            The number of slots in each channel; a power of two
+        :param int out_region:
+            The region of the table of channels that the vertex writes to
+        :param int in_region:
+            The region of the table of channels that the vertex reads from
+        :param constraints:
+            Any placement or key-allocation constraints on the vertex.
+        :type constraints:
+            ~collections.abc.Iterable(~pacman.model.constraints.AbstractConstraint)
+        :param app_vertex:
+            The application vertex that this vertex implements part of, if
+            it was made by a splitter
+        :type app_vertex:
+            ~pacman.model.graphs.application.ApplicationVertex or None
+        :param vertex_slice:
+            The slice of the application vertex that this vertex implements
+        :type vertex_slice: ~pacman.model.graphs.common.Slice or None
+        :raises ConfigurationException:
+            If the element size or depth cannot be used
+        """
+        super().__init__(
+            label, binary_name, constraints, app_vertex, vertex_slice)
+        if element_size <= 0:
+            raise ConfigurationException(
+                "The elements of {} must have a size, not {}".format(
+                    label, element_size))
+        if depth < 1 or depth & (depth - 1):
+            raise ConfigurationException(
+                "The channels of {} must have a depth that is a power of "
+                "two, not {}".format(label, depth))
+        self._element_size = element_size
+        self._depth = depth
+        self._out_region = out_region
+        self._in_region = in_region
+
+    @property
+    def element_size(self):
+        """ The size of each element handed over, in bytes.
+
+        :rtype: int
+        """
+        return self._element_size
+
+    @property
+    def depth(self):
+        """ The number of slots in each channel.
+
+        :rtype: int
+        """
+        return self._depth
+
+    @property
+    def slot_size(self):
+        """ The size of each slot of a channel, in bytes.
+
+        :rtype: int
+        """
+        return -(-self._element_size // BYTES_PER_WORD) * BYTES_PER_WORD
+
+    @property
+    def channel_size(self):
+        """ The SDRAM that each channel needs, in bytes.
+
+        :rtype: int
+        """
+        return CHANNEL_HEADER_BYTES + self._depth * self.slot_size
+
+    @overrides(AbstractSupportsSDRAMEdges.sdram_requirement)
+    def sdram_requirement(self, sdram_machine_edge):
+        return self.channel_size
+
+    @staticmethod
+    def channel_table_size(n_channels):
+        """ The size of a table of channels.
+
+        :param int n_channels:
+        :rtype: int
+        """
+        return (1 + n_channels * _CHANNEL_WORDS) * BYTES_PER_WORD
+
+    @property
+    @inject_items({"machine_graph": "MemoryMachineGraph"})
+    @overrides(MachineVertex.resources_required,
+               additional_arguments=["machine_graph"])
+    def resources_required(self, machine_graph):
+        # pylint: disable=arguments-differ
+        n_out = len(_channels_out(
+            self, machine_graph.get_sdram_edge_partitions_starting_at_vertex(
+                self)))
+        n_in = len(_channels_in(
+            self, machine_graph.get_sdram_edge_partitions_ending_at_vertex(
+                self)))
+        return ResourceContainer(sdram=self.region_layout.sdram_required(
+            self.channel_table_size(n_out) + self.channel_table_size(n_in)))
+
+    def write_channel_tables(self, spec, machine_graph):
+        """ Reserve and write the tables of the channels that the vertex\
+            writes to and reads from.
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification being built
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+            The graph of the vertex, with the memory of its SDRAM partitions
+            allocated
+        :raises ConfigurationException:
+            If channels of the vertex share memory, as the receivers of a
+            :py:class:`~pacman.model.graphs.machine.ConstantSDRAMMachinePartition`
+            do, or if the vertex at the other end of a channel does not
+            lay it out with the same slot size and depth
+        """
+        for region, label, edges in (
+                (self._out_region, "sdram_channels_out", _channels_out(
+                    self, machine_graph.
+                    get_sdram_edge_partitions_starting_at_vertex(self))),
+                (self._in_region, "sdram_channels_in", _channels_in(
+                    self, machine_graph.
+                    get_sdram_edge_partitions_ending_at_vertex(self)))):
+            if len({edge.sdram_base_address for edge in edges}) != \
+                    len(edges):
+                raise ConfigurationException(
+                    "Channels of {} share memory, but each channel can only "
+                    "have one receiver; use a "
+                    "DestinationSegmentedSDRAMMachinePartition".format(self))
+            for edge in edges:
+                self.__check_other_end(edge)
+            table = numpy.zeros(
+                (len(edges), _CHANNEL_WORDS), dtype=numpy.uint32)
+            for row, edge in zip(table, edges):
+                row[:3] = (edge.sdram_base_address, self.slot_size,
+                           self._depth)
+            spec.reserve_memory_region(
+                region=region, size=self.channel_table_size(len(edges)),
+                label=label)
+            spec.switch_write_focus(region)
+            spec.write_value(len(edges))
+            if len(edges):
+                spec.write_array(table.ravel())
+
+    def __check_other_end(self, edge):
+        """ Check that the vertex at the other end of a channel sees the\
+            same slots in it as this one does.
+
+        :param ~pacman.model.graphs.machine.SDRAMMachineEdge edge:
+        :raises ConfigurationException: If it does not
+        """
+        other = edge.post_vertex if edge.pre_vertex is self \
+            else edge.pre_vertex
+        if not isinstance(other, SDRAMChannelVertex):
+            raise ConfigurationException(
+                "{} cannot use {} as a channel, as {} is not an "
+                "SDRAMChannelVertex".format(self, edge, other))
+        if (other.slot_size, other.depth) != (self.slot_size, self._depth):
+            raise ConfigurationException(
+                "{} has slots of {} bytes in {} slots in each channel, but {} "
+                "at the other end of {} has slots of {} bytes in {}".format(
+                    self, self.slot_size, self._depth, other, edge,
+                    other.slot_size, other.depth))
+
+    def read_channel_counters(self):
+        """ Read how each channel has been used by this vertex so far. The\
+            simulation must have run.
+
+        :return: The number of elements handed over and the number of times
+            that one could not be, for each channel written to and then for
+            each channel read from, in the order of the tables
+        :rtype: tuple(list(tuple(int, int)), list(tuple(int, int)))
+        """
+        transceiver = self.front_end.transceiver()
+        placement = self.placement
+        counters = list()
+        for region in (self._out_region, self._in_region):
+            address = locate_memory_region_for_placement(
+                placement, region, transceiver)
+            n_channels = transceiver.read_word(
+                placement.x, placement.y, address)
+            table = numpy.frombuffer(transceiver.read_memory(
+                placement.x, placement.y, address + BYTES_PER_WORD,
+                n_channels * _CHANNEL_WORDS * BYTES_PER_WORD),
+                dtype=numpy.uint32).reshape(n_channels, _CHANNEL_WORDS)
+            counters.append([
+                (int(row[_N_HANDOFFS]), int(row[_N_BLOCKED]))
+                for row in table])
+        return counters[0], counters[1]
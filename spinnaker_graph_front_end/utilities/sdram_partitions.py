@@ -0,0 +1,222 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from pacman.model.graphs.machine import (
+    ConstantSDRAMMachinePartition, DestinationSegmentedSDRAMMachinePartition,
+    SDRAMMachineEdge, SourceSegmentedSDRAMMachinePartition)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+
+def choose_sdram_partition_type(
+        n_pre_vertices, n_post_vertices, shared=False):
+    """ Choose the kind of SDRAM partition that needs the least SDRAM to\
+        join some senders to some receivers on the same chip.
+
+    One sender that shares its data with all its receivers needs only one
+    region, in a :py:class:`ConstantSDRAMMachinePartition`; otherwise each
+    edge has a region of its own, in a
+    :py:class:`DestinationSegmentedSDRAMMachinePartition` for one sender or
+    a :py:class:`SourceSegmentedSDRAMMachinePartition` for one receiver.
+
+    :param int n_pre_vertices: The number of senders
+    :param int n_post_vertices: The number of receivers
+    :param bool shared:
+        Whether the receivers may all read the same data from one sender
+    :rtype: type
+    :raises ConfigurationException:
+        If no kind of SDRAM partition joins that many senders to that many
+        receivers
+    """
+    if n_pre_vertices < 1 or n_post_vertices < 1:
+        raise ConfigurationException(
+            "An SDRAM partition needs at least one sender and one receiver")
+    if n_pre_vertices == 1:
+        if shared or n_post_vertices == 1:
+            return ConstantSDRAMMachinePartition
+        return DestinationSegmentedSDRAMMachinePartition
+    if n_post_vertices == 1:
+        return SourceSegmentedSDRAMMachinePartition
+    raise ConfigurationException(
+        "No SDRAM partition joins {} senders to {} receivers; add one "
+        "partition for each sender, or for each receiver, instead".format(
+            n_pre_vertices, n_post_vertices))
+
+
+def sdram_per_edge(n_pre_vertices, n_post_vertices, sdram_budget,
+                   shared=False):
+    """ Work out the most SDRAM that each edge can ask for, if the\
+        partition that joins some senders to some receivers is to fit in\
+        the SDRAM left on their chip.
+
+    :param int n_pre_vertices: The number of senders
+    :param int n_post_vertices: The number of receivers
+    :param int sdram_budget: The SDRAM left on the chip, in bytes
+    :param bool shared:
+        Whether the receivers may all read the same data from one sender
+    :rtype: int
+    :raises ConfigurationException:
+        If no kind of SDRAM partition joins that many senders to that many
+        receivers
+    """
+    if choose_sdram_partition_type(
+            n_pre_vertices, n_post_vertices, shared) is \
+            ConstantSDRAMMachinePartition:
+        return max(sdram_budget, 0)
+    return max(sdram_budget, 0) // (n_pre_vertices * n_post_vertices)
+
+
+def sdram_left_on_chip(resource_tracker, chip_x, chip_y):
+    """ Work out the SDRAM of a chip that is left for SDRAM partitions once\
+        the system, the cores that the tools keep for themselves and every\
+        vertex allocated to the chip so far have what they need.
+
+    This only passes the question on to the tracker's
+    ``sdram_avilable_on_chip`` (spelt so in PACMAN), under a name in the
+    terms of this module.
+
+    The vertices that a partition joins must have been allocated to the
+    chip first. The tracker does not know about the partitions themselves,
+    so when adding more than one to a chip, reserve each with
+    ``resource_tracker.allocate_sdram`` before working out the next budget.
+
+    :param ~pacman.utilities.utility_objs.ResourceTracker resource_tracker:
+        The tracker of the resources allocated so far
+    :param int chip_x: The X coordinate of the chip
+    :param int chip_y: The Y coordinate of the chip
+    :rtype: int
+    """
+    return resource_tracker.sdram_avilable_on_chip(chip_x, chip_y)
+
+
+def max_sdram_left_on_chip(vertices, chip_sdram, plan_n_timesteps=0):
+    """ Work out the most SDRAM of a chip that can be left for SDRAM\
+        partitions once the vertices that they join, which must all be\
+        placed on that chip, have what they need.
+
+    This is only an upper bound, for use before there is a machine to
+    allocate resources on: any other vertices placed on the chip, and the
+    cores that the tools keep for themselves, take SDRAM from it too. Use
+    :py:func:`sdram_left_on_chip` where there is a resource tracker.
+
+    :param iterable(~pacman.model.graphs.machine.MachineVertex) vertices:
+        The vertices joined through SDRAM
+    :param int chip_sdram:
+        The SDRAM of the chip, in bytes, without what the system uses, as
+        in ``chip.sdram.size``
+    :param int plan_n_timesteps: The number of timesteps to plan for
+    :rtype: int
+    """
+    return chip_sdram - sum(
+        vertex.resources_required.sdram.get_total_sdram(plan_n_timesteps)
+        for vertex in set(vertices))
+
+
+def _too_big(n_pre_vertices, n_post_vertices, sizes, partition_type,
+             needed, budget, shared):
+    """
+    :param int n_pre_vertices:
+    :param int n_post_vertices:
+    :param list(int) sizes:
+    :param type partition_type:
+    :param int needed:
+    :param int budget:
+    :param bool shared:
+    :rtype: ConfigurationException
+    """
+    alternatives = list()
+    if (n_pre_vertices == 1 and n_post_vertices > 1 and not shared and
+            len(set(sizes)) == 1 and sizes[0] <= budget):
+        alternatives.append(
+            "let the receivers share one region of {} bytes".format(
+                sizes[0]))
+    most = sdram_per_edge(n_pre_vertices, n_post_vertices, budget, shared)
+    if most:
+        alternatives.append(
+            "ask for at most {} bytes an edge".format(most))
+    largest = max(sizes)
+    if len(sizes) > 1 and largest <= budget:
+        alternatives.append(
+            "split the edges over {} or more partitions, on more than one "
+            "chip".format(-(-needed // max(budget, 1))))
+    alternatives.append("send the data as multicast packets instead")
+    return ConfigurationException(
+        "A {} joining {} senders to {} receivers needs {} bytes of SDRAM, "
+        "but only {} bytes are left on the chip; {}".format(
+            partition_type.__name__, n_pre_vertices, n_post_vertices, needed,
+            budget, ", or ".join(alternatives)))
+
+
+def add_sdram_partition(
+        machine_graph, identifier, pre_vertices, post_vertices,
+        sdram_budget=None, shared=False, label=None):
+    """ Join senders to receivers on the same chip through SDRAM, with the\
+        kind of SDRAM partition that needs the least SDRAM, checking that\
+        it fits.
+
+    The size of each edge is asked of the vertices at its ends, which must
+    be :py:class:`~pacman.model.graphs.AbstractSupportsSDRAMEdges`; the
+    budget is only checked, and the edges are never made smaller to fit
+    it, as the vertices lay out their data for the sizes they ask for.
+    To fill a budget, size the vertices first, e.g. so that each asks for
+    :py:func:`sdram_per_edge` of it.
+
+    :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        The graph to add the partition and its edges to
+    :param str identifier: The identifier of the partition
+    :param list(~pacman.model.graphs.machine.MachineVertex) pre_vertices:
+        The senders, already in the graph
+    :param list(~pacman.model.graphs.machine.MachineVertex) post_vertices:
+        The receivers, already in the graph
+    :param sdram_budget:
+        The SDRAM left on the chip for the partition, in bytes, as from
+        :py:func:`sdram_left_on_chip` or :py:func:`max_sdram_left_on_chip`,
+        or ``None`` not to check
+    :type sdram_budget: int or None
+    :param bool shared:
+        Whether the receivers may all read the same data from one sender
+    :param label: The label of the partition and its edges
+    :type label: str or None
+    :return: The partition added
+    :rtype: ~pacman.model.graphs.machine.AbstractSDRAMPartition
+    :raises ConfigurationException:
+        If no kind of partition joins the vertices, shared data would have
+        different sizes, or the partition would not fit
+    """
+    partition_type = choose_sdram_partition_type(
+        len(pre_vertices), len(post_vertices), shared)
+    edges = [SDRAMMachineEdge(pre_vertex, post_vertex, label)
+             for pre_vertex in pre_vertices for post_vertex in post_vertices]
+    sizes = [edge.sdram_size for edge in edges]
+    if partition_type is ConstantSDRAMMachinePartition:
+        if len(set(sizes)) > 1:
+            raise ConfigurationException(
+                "The receivers of {} cannot share data of sizes {}".format(
+                    identifier, sorted(set(sizes))))
+        needed = sizes[0]
+    else:
+        needed = sum(sizes)
+    if sdram_budget is not None and needed > sdram_budget:
+        raise _too_big(
+            len(pre_vertices), len(post_vertices), sizes, partition_type,
+            needed, sdram_budget, shared)
+
+    if partition_type is SourceSegmentedSDRAMMachinePartition:
+        partition = partition_type(identifier, label, pre_vertices)
+    else:
+        partition = partition_type(identifier, pre_vertices[0], label)
+    machine_graph.add_outgoing_edge_partition(partition)
+    for edge in edges:
+        machine_graph.add_edge(edge, identifier)
+    return partition
@@ -33,7 +33,8 @@ class SimulatorVertex(MachineVertex, AbstractHasAssociatedBinary):
 
     __slots__ = ["_binary_name", "__front_end"]
 
-    def __init__(self, label, binary_name, constraints=()):
+    def __init__(self, label, binary_name, constraints=(), app_vertex=None,
+                 vertex_slice=None):
         """
         :param str label:
             The label for the vertex.
@@ -43,8 +44,16 @@ class SimulatorVertex(MachineVertex, AbstractHasAssociatedBinary):
             Any placement or key-allocation constraints on the vertex.
         :type constraints:
             ~collections.abc.Iterable(~pacman.model.constraints.AbstractConstraint)
+        :param app_vertex:
+            The application vertex that this vertex implements part of, if
+            it was made by a splitter
+        :type app_vertex:
+            ~pacman.model.graphs.application.ApplicationVertex or None
+        :param vertex_slice:
+            The slice of the application vertex that this vertex implements
+        :type vertex_slice: ~pacman.model.graphs.common.Slice or None
         """
-        super().__init__(label, constraints)
+        super().__init__(label, constraints, app_vertex, vertex_slice)
         self._binary_name = binary_name
         if not binary_name.lower().endswith(".aplx"):
             log.warning("APLX protocol used but name not matching; "
@@ -0,0 +1,89 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import threading
+import unittest
+from spinnaker_graph_front_end.async_run import AsyncRun, RunEvent
+
+
+class _ForeverSimulator(object):
+    """ Runs until asked to stop, like a run with no duration.
+    """
+
+    PROGRESS = object()
+
+    def __init__(self):
+        self.stopped = threading.Event()
+
+    def run(self):
+        self.stopped.wait(10)
+
+    def current_progress(self):
+        return self.PROGRESS
+
+    def stop_run(self):
+        self.stopped.set()
+
+
+class TestAsyncRun(unittest.TestCase):
+
+    def _run(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_events_until_finished(self):
+        async def follow():
+            sim = _ForeverSimulator()
+            run = AsyncRun(sim, sim.run, 0.01)
+            events = list()
+            async for event in run.events():
+                events.append(event)
+                if len(events) == 2:
+                    run.stop_run()
+            await run
+            return events
+
+        events = self._run(follow())
+        self.assertEqual(
+            [event.kind for event in events[:2]],
+            [RunEvent.RUNNING, RunEvent.RUNNING])
+        for event in events[:2]:
+            self.assertIs(event.progress, _ForeverSimulator.PROGRESS)
+        self.assertEqual(events[-1].kind, RunEvent.FINISHED)
+        self.assertIsNone(events[-1].progress)
+
+    def test_cancel_stops_run(self):
+        sim = _ForeverSimulator()
+
+        async def cancel():
+            task = asyncio.ensure_future(_await(AsyncRun(sim, sim.run, 1)))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        async def _await(run):
+            await run
+
+        self._run(cancel())
+        self.assertTrue(sim.stopped.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import MulticastRoutingEntry
+from pacman.model.routing_tables import (
+    MulticastRoutingTables, UnCompressedMulticastRoutingTable)
+from spinnaker_graph_front_end.extra_algorithms.auto_router_compression \
+    import (
+        HOST_COMPRESSION, NO_COMPRESSION, ON_CHIP_COMPRESSION,
+        choose_compression, compress_over_capacity)
+
+
+def _table(x, y, n_entries):
+    table = UnCompressedMulticastRoutingTable(x, y)
+    for key in range(n_entries):
+        table.add_multicast_routing_entry(MulticastRoutingEntry(
+            key, 0xFFFFFFFF, processor_ids=[1], link_ids=[]))
+    return table
+
+
+class TestChooseCompression(unittest.TestCase):
+
+    def test_fits(self):
+        compression, reason = choose_compression(
+            [(0, 0, 900, 1023), (1, 0, 10, 1023)], 100)
+        self.assertEqual(compression, NO_COMPRESSION)
+        self.assertIn("900 of 1023", reason)
+
+    def test_no_tables(self):
+        compression, _ = choose_compression([], 100)
+        self.assertEqual(compression, NO_COMPRESSION)
+
+    def test_few_over(self):
+        compression, _ = choose_compression(
+            [(0, 0, 1100, 1023), (1, 0, 10, 1023)], 2000)
+        self.assertEqual(compression, HOST_COMPRESSION)
+
+    def test_many_over(self):
+        compression, reason = choose_compression(
+            [(x, 0, 1100, 1023) for x in range(8)], 2000)
+        self.assertEqual(compression, ON_CHIP_COMPRESSION)
+        self.assertIn("8 tables", reason)
+
+
+class TestCompressOverCapacity(unittest.TestCase):
+
+    def test_only_tables_over(self):
+        over = _table(0, 0, 8)
+        under = _table(1, 0, 8)
+        tables = MulticastRoutingTables([over, under])
+        compressed = compress_over_capacity(
+            tables, [(0, 0, 8, 4), (1, 0, 8, 16)])
+        self.assertLessEqual(
+            compressed.get_routing_table_for_chip(0, 0).number_of_entries, 4)
+        self.assertIs(compressed.get_routing_table_for_chip(1, 0), under)
+
+    def test_own_capacity(self):
+        tables = MulticastRoutingTables([_table(0, 0, 8), _table(1, 0, 8)])
+        compressed = compress_over_capacity(
+            tables, [(0, 0, 8, 4), (1, 0, 8, 2)])
+        for x in range(2):
+            self.assertLessEqual(
+                compressed.get_routing_table_for_chip(x, 0).number_of_entries,
+                (4, 2)[x])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.resources import ResourceContainer
+from spinnaker_graph_front_end.extra_algorithms import ComponentMapper
+from spinnaker_graph_front_end.extra_algorithms.component_mapper import (
+    connected_components)
+
+
+def _rings(n_rings, size):
+    graph = MachineGraph("rings")
+    rings = [[SimpleMachineVertex(ResourceContainer()) for _ in range(size)]
+             for _ in range(n_rings)]
+    # Interleaved, so that the components are not just runs of the graph
+    for vertices in zip(*rings):
+        for vertex in vertices:
+            graph.add_vertex(vertex)
+    for ring in rings:
+        for i, vertex in enumerate(ring):
+            graph.add_edge(
+                MachineEdge(vertex, ring[(i + 1) % size]), "ring")
+    return graph, rings
+
+
+class TestComponentMapper(unittest.TestCase):
+
+    def test_connected_components(self):
+        graph, rings = _rings(3, 5)
+        lonely = SimpleMachineVertex(ResourceContainer())
+        graph.add_vertex(lonely)
+        components = connected_components(graph)
+        self.assertEqual(
+            [set(component) for component in components],
+            [set(ring) for ring in rings] + [{lonely}])
+
+    def test_components_packed(self):
+        graph, rings = _rings(4, 20)
+        machine = virtual_machine(width=8, height=8)
+        placements, routes = ComponentMapper()(graph, machine, 10, 2)
+        n_cores = machine.get_chip_at(0, 0).n_user_processors
+        chips = {(placement.x, placement.y)
+                 for placement in placements.placements}
+        self.assertEqual(len(chips), -(-graph.n_vertices // n_cores))
+
+        # Every partition is routed to the core of each of its targets
+        for ring in rings:
+            for vertex in ring:
+                partition = graph.\
+                    get_outgoing_edge_partition_starting_at_vertex(
+                        vertex, "ring")
+                for edge in partition.edges:
+                    target = placements.get_placement_of_vertex(
+                        edge.post_vertex)
+                    entry = routes.get_entry_on_coords_for_edge(
+                        partition, target.x, target.y)
+                    self.assertIn(target.p, entry.processor_ids)
+
+    def test_many_small_components(self):
+        # More parts than chips, as RadialPlacer would place them
+        machine = virtual_machine(width=8, height=8)
+        graph = MachineGraph("singletons")
+        for _ in range(machine.n_chips + 1):
+            graph.add_vertex(SimpleMachineVertex(ResourceContainer()))
+        placements, _ = ComponentMapper()(graph, machine, 10, 2)
+        self.assertEqual(placements.n_placements, graph.n_vertices)
+        n_cores = machine.get_chip_at(0, 0).n_user_processors
+        self.assertEqual(
+            len({(placement.x, placement.y)
+                 for placement in placements.placements}),
+            -(-graph.n_vertices // n_cores))
+
+
+if __name__ == '__main__':
+    unittest.main()
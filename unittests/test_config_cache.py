@@ -0,0 +1,84 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from spinn_utilities import conf_loader
+from spinn_front_end_common.utilities import globals_variables
+import spinnaker_graph_front_end as sim
+from spinnaker_graph_front_end import spinnaker
+from unittests.virtual_board import virtual_board
+
+
+class TestConfigCache(unittest.TestCase):
+
+    def test_cached_config_is_parsed_once(self):
+        spinnaker._config_cache.clear()
+        first = spinnaker.cached_config()
+        self.assertEqual(len(spinnaker._config_cache), 1)
+        second = spinnaker.cached_config()
+        self.assertEqual(len(spinnaker._config_cache), 1)
+        self.assertEqual(
+            first.get("Mapping", "loading_algorithms"),
+            second.get("Mapping", "loading_algorithms"))
+
+    def test_copies_are_independent(self):
+        first = spinnaker.cached_config()
+        first.set("Mapping", "loading_algorithms", "Changed")
+        second = spinnaker.cached_config()
+        self.assertNotEqual(
+            second.get("Mapping", "loading_algorithms"), "Changed")
+
+    def test_extra_defaults_are_kept_apart(self):
+        with tempfile.TemporaryDirectory() as directory:
+            extra = os.path.join(directory, "extra.cfg")
+            with open(extra, "w") as f:
+                f.write("[Mapping]\nloading_algorithms = Extra\n")
+            self.assertEqual(
+                spinnaker.cached_config([extra]).get(
+                    "Mapping", "loading_algorithms"), "Extra")
+            self.assertNotEqual(
+                spinnaker.cached_config().get(
+                    "Mapping", "loading_algorithms"), "Extra")
+
+    def test_setup_parses_once(self):
+        spinnaker._config_cache.clear()
+        with virtual_board(), mock.patch.object(
+                conf_loader, "load_config",
+                wraps=conf_loader.load_config) as load_config:
+            sim.setup()
+            try:
+                spinnaker.cached_config()
+            finally:
+                sim.stop()
+            self.assertEqual(load_config.call_count, 1)
+
+    def test_fast_defaults_are_kept_apart(self):
+        spinnaker._config_cache.clear()
+        with virtual_board("[Mapping]\nmapping_profile = fast\n"):
+            sim.setup()
+            try:
+                self.assertFalse(globals_variables.get_simulator().config.
+                                 getboolean("Reports", "reports_enabled"))
+                self.assertTrue(spinnaker.cached_config().getboolean(
+                    "Reports", "reports_enabled"))
+            finally:
+                sim.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import socket
+import struct
+import unittest
+import numpy
+from spinnaker_graph_front_end.utilities import (
+    EventRingBuffer, RingBufferReceiver)
+from spinnaker_graph_front_end.utilities.eieio_arrays import (
+    EVENT_DTYPE, MAX_EVENTS_PER_MESSAGE, MAX_KEYS_PAYLOADS_PER_MESSAGE,
+    decode_eieio_data, encode_eieio_data)
+
+
+def _events(keys):
+    events = numpy.zeros(len(keys), dtype=EVENT_DTYPE)
+    events["key"] = keys
+    return events
+
+
+class TestEventRingBuffer(unittest.TestCase):
+
+    def test_decode_prefixes_and_timestamps(self):
+        # 32-bit keys, upper-half key prefix, payload prefix as a timestamp
+        message = struct.pack("<BBHIII", 2, 0xF8, 0x1234, 17, 5, 6)
+        out = numpy.zeros(MAX_EVENTS_PER_MESSAGE, dtype=EVENT_DTYPE)
+        self.assertEqual(decode_eieio_data(message, out), 2)
+        self.assertEqual(list(out["key"][:2]), [0x12340005, 0x12340006])
+        self.assertEqual(list(out["timestamp"][:2]), [17, 17])
+        self.assertEqual(list(out["payload"][:2]), [0, 0])
+
+    def test_decode_key_payload(self):
+        message = struct.pack("<BBHHHH", 2, 0x04, 1, 10, 2, 20)
+        out = numpy.zeros(MAX_EVENTS_PER_MESSAGE, dtype=EVENT_DTYPE)
+        self.assertEqual(decode_eieio_data(message, out), 2)
+        self.assertEqual(list(out["key"][:2]), [1, 2])
+        self.assertEqual(list(out["payload"][:2]), [10, 20])
+
+    def test_encode_round_trip(self):
+        keys = numpy.arange(100, dtype="uint32") + 0x10000
+        payloads = keys * 3
+        out = numpy.zeros(MAX_EVENTS_PER_MESSAGE, dtype=EVENT_DTYPE)
+        decoded = list()
+        messages = list(encode_eieio_data(keys, payloads))
+        self.assertEqual(
+            len(messages), -(-100 // MAX_KEYS_PAYLOADS_PER_MESSAGE))
+        for message, count in messages:
+            self.assertLessEqual(len(message), 256)
+            self.assertEqual(decode_eieio_data(message, out), count)
+            decoded.append(out[:count].copy())
+        decoded = numpy.concatenate(decoded)
+        self.assertEqual(list(decoded["key"]), list(keys))
+        self.assertEqual(list(decoded["payload"]), list(payloads))
+
+    def test_wrap_and_drop(self):
+        ring = EventRingBuffer(4)
+        self.assertEqual(ring.write(_events([1, 2, 3])), 3)
+        self.assertEqual(list(ring.read(2)["key"]), [1, 2])
+        self.assertEqual(ring.write(_events([4, 5, 6, 7])), 3)
+        self.assertEqual(ring.n_dropped, 1)
+        views = ring.peek()
+        self.assertEqual(len(views), 2)
+        self.assertEqual(
+            [key for view in views for key in view["key"]], [3, 4, 5, 6])
+        with self.assertRaises(ValueError):
+            views[0]["key"] = 0
+        ring.release(4)
+        self.assertEqual(ring.n_available, 0)
+
+    def test_receive(self):
+        with RingBufferReceiver(capacity=16) as receiver:
+            sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sender.sendto(
+                struct.pack("<BBII", 2, 0x08, 7, 8),
+                ("127.0.0.1", receiver.local_port))
+            sender.close()
+            self.assertTrue(receiver.ring.wait(5))
+            self.assertEqual(list(receiver.ring.read()["key"]), [7, 8])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinnaker_graph_front_end.extra_algorithms import GraphValidator
+from spinnaker_graph_front_end.utilities import (
+    AbstractHasGraphInvariants, DegreeIndex, GraphInvariants)
+
+
+class _Link(SimpleMachineVertex, AbstractHasGraphInvariants):
+    INVARIANTS = GraphInvariants(
+        n_incoming_edges=range(1, 3), n_outgoing_partitions=1,
+        self_loops=False)
+
+    def __init__(self, label):
+        super().__init__(ResourceContainer(), label)
+
+    @property
+    def graph_invariants(self):
+        return self.INVARIANTS
+
+
+def _ring(size):
+    graph = MachineGraph("ring")
+    links = [_Link("link{}".format(i)) for i in range(size)]
+    for link in links:
+        graph.add_vertex(link)
+    for i, link in enumerate(links):
+        graph.add_edge(MachineEdge(link, links[(i + 1) % size]), "ring")
+    return graph, links
+
+
+class TestGraphValidator(unittest.TestCase):
+
+    def test_degree_index(self):
+        graph, links = _ring(4)
+        graph.add_edge(MachineEdge(links[0], links[0]), "self")
+        index = DegreeIndex(graph)
+        self.assertEqual(index.n_incoming_edges(links[0]), 2)
+        self.assertEqual(index.n_outgoing_edges(links[0]), 2)
+        self.assertEqual(index.n_outgoing_partitions(links[0]), 2)
+        self.assertEqual(index.n_self_loops(links[0]), 1)
+        self.assertEqual(index.n_incoming_edges(links[1]), 1)
+        self.assertEqual(index.n_self_loops(links[1]), 0)
+
+    def test_good_graph(self):
+        graph, _ = _ring(4)
+        GraphValidator()(graph)
+
+    def test_bad_graph(self):
+        graph, links = _ring(4)
+        # A second partition, which is also a self-loop
+        graph.add_edge(MachineEdge(links[2], links[2]), "self")
+        # A third edge in
+        graph.add_edge(MachineEdge(links[0], links[1]), "ring")
+        graph.add_edge(MachineEdge(links[3], links[1]), "ring")
+        with self.assertRaises(ConfigurationException) as context:
+            GraphValidator()(graph)
+        message = str(context.exception)
+        self.assertIn("link1 has 3 incoming edges but needs 1 to 2", message)
+        self.assertIn("link2 has 2 outgoing partitions but needs exactly 1",
+                      message)
+        self.assertIn("link2 has an edge to itself", message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import virtual_machine
+from pacman.model.constraints.key_allocator_constraints import (
+    FixedKeyAndMaskConstraint)
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.resources import ResourceContainer
+from pacman.model.routing_info import (
+    BaseKeyAndMask, DictBasedMachinePartitionNKeysMap)
+from spinnaker_graph_front_end.extra_algorithms import (
+    GridRoutingInfoAllocator)
+from spinnaker_graph_front_end.utilities import AbstractHasGridPosition
+
+
+class _Cell(SimpleMachineVertex, AbstractHasGridPosition):
+    def __init__(self, x, y):
+        super().__init__(ResourceContainer())
+        self._position = (x, y)
+
+    @property
+    def grid_position(self):
+        return self._position
+
+
+class TestGridRoutingInfoAllocator(unittest.TestCase):
+
+    def test_tiles_share_a_mask(self):
+        graph = MachineGraph("grid")
+        sink = SimpleMachineVertex(ResourceContainer())
+        graph.add_vertex(sink)
+        fixed = SimpleMachineVertex(ResourceContainer())
+        graph.add_vertex(fixed)
+        graph.add_edge(MachineEdge(fixed, sink), "fixed")
+        graph.get_outgoing_edge_partition_starting_at_vertex(
+            fixed, "fixed").add_constraint(FixedKeyAndMaskConstraint(
+                [BaseKeyAndMask(0x10, 0xFFFFFFF0)]))
+        cells = {(x, y): _Cell(x, y) for x in range(8) for y in range(8)}
+        n_keys_map = DictBasedMachinePartitionNKeysMap()
+        for cell in cells.values():
+            graph.add_vertex(cell)
+            graph.add_edge(MachineEdge(cell, sink), "state")
+            n_keys_map.set_n_keys_for_partition(
+                graph.get_outgoing_edge_partition_starting_at_vertex(
+                    cell, "state"), 3)
+        n_keys_map.set_n_keys_for_partition(
+            graph.get_outgoing_edge_partition_starting_at_vertex(
+                fixed, "fixed"), 16)
+
+        routing_infos = GridRoutingInfoAllocator()(graph, n_keys_map)
+
+        self.assertEqual(
+            routing_infos.get_first_key_from_pre_vertex(fixed, "fixed"), 0x10)
+        # Each cell has four keys, and each 4x4 tile of cells an aligned
+        # block of 64 keys
+        for tile_x in range(0, 8, 4):
+            for tile_y in range(0, 8, 4):
+                keys = [
+                    routing_infos.get_routing_info_from_pre_vertex(
+                        cells[x, y], "state").first_key_and_mask
+                    for x in range(tile_x, tile_x + 4)
+                    for y in range(tile_y, tile_y + 4)]
+                self.assertTrue(all(k.mask == 0xFFFFFFFC for k in keys))
+                first = min(k.key for k in keys)
+                self.assertEqual(first % 64, 0)
+                self.assertEqual(sorted(k.key for k in keys),
+                                 list(range(first, first + 64, 4)))
+
+    def test_tiles_of_the_placer(self):
+        # Nine cores for cells on each chip, so tiles of 3x3 cells
+        machine = virtual_machine(width=8, height=8, n_cpus_per_chip=10)
+        graph = MachineGraph("grid")
+        sink = SimpleMachineVertex(ResourceContainer())
+        graph.add_vertex(sink)
+        cells = {(x, y): _Cell(x, y) for x in range(6) for y in range(6)}
+        n_keys_map = DictBasedMachinePartitionNKeysMap()
+        for cell in cells.values():
+            graph.add_vertex(cell)
+            graph.add_edge(MachineEdge(cell, sink), "state")
+            n_keys_map.set_n_keys_for_partition(
+                graph.get_outgoing_edge_partition_starting_at_vertex(
+                    cell, "state"), 1)
+
+        routing_infos = GridRoutingInfoAllocator()(
+            graph, n_keys_map, machine)
+
+        # Each tile has an aligned block of 16 keys, the slots of a 4x4 tile
+        blocks = set()
+        for tile_x in range(0, 6, 3):
+            for tile_y in range(0, 6, 3):
+                keys = {
+                    routing_infos.get_first_key_from_pre_vertex(
+                        cells[x, y], "state") >> 4
+                    for x in range(tile_x, tile_x + 3)
+                    for y in range(tile_y, tile_y + 3)}
+                self.assertEqual(len(keys), 1)
+                blocks.update(keys)
+        self.assertEqual(len(blocks), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
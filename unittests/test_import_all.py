@@ -14,12 +14,65 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import subprocess
+import sys
 import unittest
 import spinn_utilities.package_loader as package_loader
 _CI = os.environ.get('CONTINUOUS_INTEGRATION', 'false').lower()
 
+#: The most time, in seconds, that importing the front end may take
+IMPORT_TIME_BUDGET = 1.0
+
+#: Modules that importing the front end must not import
+HEAVY_MODULES = (
+    "pacman.executor",
+    "spinnman.transceiver",
+    "spinn_front_end_common.interface.abstract_spinnaker_base",
+    "spinn_front_end_common.utility_models")
+
+_MEASURE_IMPORT = """
+import sys, time
+start = time.perf_counter()
+import spinnaker_graph_front_end
+print(time.perf_counter() - start)
+print(" ".join(name for name in {} if name in sys.modules))
+""".format(HEAVY_MODULES)
+
 
 class ImportAllModule(unittest.TestCase):
     def test_import_all(self):
         package_loader.load_module("spinnaker_graph_front_end",
                                    remove_pyc_files=(_CI != 'true'))
+
+    def test_lazy_matches_eager(self):
+        import spinnaker_graph_front_end as gfe
+        from pacman.model.graphs.machine import MachineEdge
+        from spinn_front_end_common.utility_models import (
+            LivePacketGather, ReverseIpTagMultiCastSource)
+        from spinnaker_graph_front_end.async_run import run_async
+        from spinnaker_graph_front_end.session import Session
+        from spinnaker_graph_front_end.spinnaker import SpiNNaker
+        for name in gfe.__all__:
+            self.assertIsNotNone(getattr(gfe, name), name)
+        # The front end documents these with thin subclasses
+        self.assertEqual(gfe.LivePacketGather.__bases__, (LivePacketGather,))
+        self.assertEqual(gfe.MachineEdge.__bases__, (MachineEdge,))
+        self.assertEqual(
+            gfe.ReverseIpTagMultiCastSource.__bases__,
+            (ReverseIpTagMultiCastSource,))
+        self.assertIs(gfe.Session, Session)
+        self.assertIs(gfe.SpiNNaker, SpiNNaker)
+        self.assertIs(gfe.run_async, run_async)
+        with self.assertRaises(AttributeError):
+            getattr(gfe, "NotAnAttribute")
+
+    @unittest.skipIf(sys.version_info < (3, 7),
+                     "lazy attributes need Python 3.7")
+    def test_import_is_cheap(self):
+        # A fresh interpreter, so nothing is already imported
+        output = subprocess.check_output(
+            [sys.executable, "-c", _MEASURE_IMPORT],
+            universal_newlines=True).splitlines()
+        self.assertLess(float(output[0]), IMPORT_TIME_BUDGET)
+        heavy_imported = output[1] if len(output) > 1 else ""
+        self.assertEqual(heavy_imported, "")
@@ -0,0 +1,99 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import tempfile
+import unittest
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.abstract_models import AbstractHasAssociatedBinary
+from spinn_front_end_common.utilities.exceptions import (
+    ExecutableNotFoundException)
+from spinn_front_end_common.utilities.utility_objs import ExecutableType
+from spinnaker_graph_front_end.utilities import IndexedExecutableFinder
+
+
+class _Binary(SimpleMachineVertex, AbstractHasAssociatedBinary):
+    def __init__(self, name):
+        super().__init__(ResourceContainer(), label=name)
+        self._name = name
+
+    def get_binary_file_name(self):
+        return self._name
+
+    def get_binary_start_type(self):
+        return ExecutableType.USES_SIMULATION_INTERFACE
+
+
+class TestIndexedExecutableFinder(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self._tmp.name, "binaries")
+        os.mkdir(self.folder)
+        self.index_file = os.path.join(self._tmp.name, "index.json")
+        self._touch("a.aplx")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _touch(self, name):
+        with open(os.path.join(self.folder, name), "w"):
+            pass
+
+    def _finder(self):
+        return IndexedExecutableFinder(
+            [self.folder], include_common_binaries_folder=False,
+            index_file=self.index_file)
+
+    def test_lookup_and_persist(self):
+        finder = self._finder()
+        self.assertEqual(finder.get_executable_path("a.aplx"),
+                         os.path.join(self.folder, "a.aplx"))
+        with self.assertRaises(KeyError):
+            finder.get_executable_path("b.aplx")
+        with open(self.index_file) as f:
+            stored = json.load(f)
+        self.assertEqual(stored["folders"][self.folder][1], ["a.aplx"])
+
+    def test_new_binary_is_found(self):
+        finder = self._finder()
+        with self.assertRaises(KeyError):
+            finder.get_executable_path("b.aplx")
+        self._touch("b.aplx")
+        self.assertEqual(finder.get_executable_path("b.aplx"),
+                         os.path.join(self.folder, "b.aplx"))
+
+    def test_binary_log(self):
+        os.environ["BINARY_LOGS_DIR"] = self._tmp.name
+        try:
+            finder = self._finder()
+        finally:
+            del os.environ["BINARY_LOGS_DIR"]
+        path = finder.get_executable_path("a.aplx")
+        with open(os.path.join(
+                self._tmp.name, "binary_files_used.log")) as f:
+            self.assertEqual(f.read(), path + "\n")
+
+    def test_check_binaries(self):
+        finder = self._finder()
+        finder.check_binaries([object()])
+        with self.assertRaises(ExecutableNotFoundException):
+            finder.check_binaries([_Binary("missing.aplx")])
+
+
+if __name__ == '__main__':
+    unittest.main()
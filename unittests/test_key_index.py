@@ -0,0 +1,94 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sqlite3
+import tempfile
+import unittest
+import numpy
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.resources import ResourceContainer
+from pacman.model.routing_info import (
+    BaseKeyAndMask, PartitionRoutingInfo, RoutingInfo)
+from spinnaker_graph_front_end.utilities import KeyIndex
+
+
+class TestKeyIndex(unittest.TestCase):
+
+    def setUp(self):
+        graph = MachineGraph("test")
+        self.a = SimpleMachineVertex(ResourceContainer(), label="a")
+        self.b = SimpleMachineVertex(ResourceContainer(), label="b")
+        for vertex in (self.a, self.b):
+            graph.add_vertex(vertex)
+        graph.add_edge(MachineEdge(self.a, self.b), "spikes")
+        graph.add_edge(MachineEdge(self.b, self.a), "spikes")
+        graph.add_edge(MachineEdge(self.b, self.a), "gaps")
+        self.infos = RoutingInfo()
+        self.infos.add_partition_info(PartitionRoutingInfo(
+            [BaseKeyAndMask(0x1000, 0xFFFFFFF0),
+             BaseKeyAndMask(0x0800, 0xFFFFFFFC)],
+            graph.get_outgoing_edge_partition_starting_at_vertex(
+                self.a, "spikes")))
+        self.infos.add_partition_info(PartitionRoutingInfo(
+            [BaseKeyAndMask(0x2000, 0xFFFFFFF8)],
+            graph.get_outgoing_edge_partition_starting_at_vertex(
+                self.b, "spikes")))
+        # A mask with a gap in it: keys 0x3000-0x3001 and 0x3010-0x3011
+        self.infos.add_partition_info(PartitionRoutingInfo(
+            [BaseKeyAndMask(0x3000, 0xFFFFFFEE)],
+            graph.get_outgoing_edge_partition_starting_at_vertex(
+                self.b, "gaps")))
+
+    def test_lookup(self):
+        index = KeyIndex(self.infos)
+        self.assertEqual(len(index), 4)
+        keys = numpy.array(
+            [0x1000, 0x100F, 0x0802, 0x2007, 0x1010, 0x07FF, 0x3011, 0x3002])
+        vertex_ids, atoms = index.lookup(keys)
+        vertices = [
+            index.vertices[i] if i >= 0 else None for i in vertex_ids]
+        self.assertEqual(
+            vertices, [self.a, self.a, self.a, self.b, None, None, self.b,
+                       None])
+        self.assertEqual(list(atoms), [0, 15, 18, 7, -1, -1, 3, -1])
+
+    def test_decode(self):
+        index = KeyIndex(self.infos)
+        self.assertEqual(index.decode(0x2003), (self.b, "spikes", 3))
+        self.assertEqual(index.decode(0x3010), (self.b, "gaps", 2))
+        self.assertIsNone(index.decode(0x2008))
+
+    def test_database_ids_by_label(self):
+        with tempfile.TemporaryDirectory() as directory:
+            database_file = os.path.join(directory, "input_output.sqlite3")
+            with sqlite3.connect(database_file) as db:
+                db.execute(
+                    "CREATE TABLE Machine_vertices("
+                    "vertex_id INTEGER PRIMARY KEY, label TEXT)")
+                # Not in the order of the graph, and with another "a"
+                db.executemany(
+                    "INSERT INTO Machine_vertices VALUES(?, ?)",
+                    [(1, "b"), (2, "a"), (3, "a")])
+            KeyIndex(self.infos).write_to_database(database_file)
+            with sqlite3.connect(database_file) as db:
+                rows = dict(db.execute(
+                    "SELECT vertex_label, vertex_id FROM key_index"))
+        self.assertEqual(rows, {"a": None, "b": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.resources import ResourceContainer
+from spinnaker_graph_front_end.extra_algorithms import LocalityPlacer
+from spinnaker_graph_front_end.extra_algorithms.locality_placer import (
+    hilbert_index)
+from spinnaker_graph_front_end.utilities import AbstractHasGridPosition
+
+
+class _Cell(SimpleMachineVertex, AbstractHasGridPosition):
+    def __init__(self, x, y):
+        super().__init__(ResourceContainer())
+        self._position = (x, y)
+
+    @property
+    def grid_position(self):
+        return self._position
+
+
+class TestLocalityPlacer(unittest.TestCase):
+
+    def test_hilbert_index(self):
+        x, y = numpy.meshgrid(numpy.arange(8), numpy.arange(8))
+        x = x.ravel()
+        y = y.ravel()
+        distances = hilbert_index(x, y, 3)
+        self.assertEqual(sorted(distances), list(range(64)))
+        # Each step along the curve is to a neighbouring point
+        order = numpy.argsort(distances)
+        steps = abs(numpy.diff(x[order])) + abs(numpy.diff(y[order]))
+        self.assertTrue((steps == 1).all())
+
+    def test_grid_tiles(self):
+        graph = MachineGraph("grid")
+        cells = {(x, y): _Cell(x, y) for x in range(8) for y in range(8)}
+        for cell in cells.values():
+            graph.add_vertex(cell)
+        placements = LocalityPlacer()(
+            graph, virtual_machine(width=8, height=8), 10)
+        for (x, y), cell in cells.items():
+            placement = placements.get_placement_of_vertex(cell)
+            self.assertEqual((placement.x, placement.y), (x // 4, y // 4))
+
+    def test_connected_together(self):
+        graph = MachineGraph("chains")
+        chains = [[SimpleMachineVertex(ResourceContainer()) for _ in range(8)]
+                  for _ in range(4)]
+        # Add the vertices of the chains interleaved, as a placer in graph
+        # order would spread them
+        for vertices in zip(*chains):
+            for vertex in vertices:
+                graph.add_vertex(vertex)
+        for chain in chains:
+            for pre, post in zip(chain, chain[1:]):
+                graph.add_edge(MachineEdge(pre, post), "chain")
+        placements = LocalityPlacer()(
+            graph, virtual_machine(width=8, height=8), 10)
+        for chain in chains:
+            chips = {(placements.get_placement_of_vertex(v).x,
+                      placements.get_placement_of_vertex(v).y)
+                     for v in chain}
+            self.assertLessEqual(len(chips), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import struct
+import tempfile
+import unittest
+from spinn_machine import virtual_machine
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.model import MachineDimensions
+from spinnaker_graph_front_end.extra_algorithms.cached_machine_generator \
+    import MachineCacheTransceiver
+from spinnaker_graph_front_end.machine_cache import MachineCache
+
+_KEY = ("192.0.2.1", 5, None, None, None, None, False, True)
+
+
+class _BootedTransceiver(MachineCacheTransceiver):
+    """ Answers the reads made before the cache is used as a booted 8x8\
+        machine would.
+    """
+    __slots__ = []
+
+    def read_memory(self, x, y, base_address, length, cpu=0):
+        return struct.pack("<I", 0x1234)
+
+    def get_machine_dimensions(self):
+        return MachineDimensions(8, 8)
+
+
+class TestMachineCache(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.cache = MachineCache(os.path.join(self._dir.name, "machines"))
+        self.machine = virtual_machine(width=8, height=8)
+        self.cache.store(_KEY, 0x1234, self.machine)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_same_boot(self):
+        machine = self.cache.load(_KEY, 0x1234, 8, 8)
+        self.assertIsNotNone(machine)
+        self.assertEqual(machine.n_chips, self.machine.n_chips)
+        self.assertEqual(
+            machine.total_available_user_cores,
+            self.machine.total_available_user_cores)
+
+    def test_rebooted(self):
+        self.assertIsNone(self.cache.load(_KEY, 0x1235, 8, 8))
+
+    def test_other_size(self):
+        self.assertIsNone(self.cache.load(_KEY, 0x1234, 2, 2))
+
+    def test_other_settings(self):
+        key = ("192.0.2.1", 5, "0,0", None, None, None, False, True)
+        self.assertIsNone(self.cache.load(key, 0x1234, 8, 8))
+
+    def test_transceiver_uses_cache(self):
+        txrx = _BootedTransceiver(
+            5, self.cache, _KEY,
+            connections=[SCAMPConnection(remote_host="127.0.0.1")])
+        try:
+            machine = txrx.get_machine_details()
+            self.assertEqual(machine.n_chips, self.machine.n_chips)
+            self.assertIsNotNone(txrx.app_id_tracker.get_new_id())
+        finally:
+            txrx.close()
+
+    def test_clear(self):
+        self.cache.clear()
+        self.assertIsNone(self.cache.load(_KEY, 0x1234, 8, 8))
+
+
+if __name__ == '__main__':
+    unittest.main()
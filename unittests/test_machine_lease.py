@@ -0,0 +1,66 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+import unittest
+from spinnaker_graph_front_end.machine_lease import (
+    MachineLease, keep_lease, release_all, take_lease)
+
+
+class _Controller(object):
+    """ Notes when the allocation is given back.
+    """
+
+    def __init__(self):
+        self.closed = threading.Event()
+
+    def close(self):
+        self.closed.set()
+
+
+def _lease(key):
+    return MachineLease(key, _Controller(), {"IPAddress": "192.0.2.1"})
+
+
+class TestMachineLease(unittest.TestCase):
+
+    def tearDown(self):
+        release_all()
+
+    def test_idle_timeout(self):
+        lease = _lease(("server", 1))
+        keep_lease(lease, 0.05)
+        self.assertTrue(lease.controller.closed.wait(5))
+        self.assertIsNone(take_lease(("server", 1)))
+
+    def test_only_same_request(self):
+        lease = _lease(("server", 1))
+        keep_lease(lease, 60)
+        self.assertIsNone(take_lease(("server", 2)))
+        self.assertFalse(lease.controller.closed.is_set())
+        release_all()
+        self.assertTrue(lease.controller.closed.is_set())
+
+    def test_replaced(self):
+        first = _lease(("server", 1))
+        second = _lease(("server", 1))
+        keep_lease(first, 60)
+        keep_lease(second, 60)
+        self.assertTrue(first.controller.closed.is_set())
+        self.assertFalse(second.controller.closed.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+from pacman.model.graphs.machine import MachineEdge, SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+import spinnaker_graph_front_end as sim
+from spinnaker_graph_front_end.spinnaker import SpiNNaker
+from spinnaker_graph_front_end.utilities import IndexedExecutableFinder
+from unittests.virtual_board import virtual_board
+
+
+class TestMappingProfile(unittest.TestCase):
+
+    def setUp(self):
+        globals_variables.unset_simulator()
+
+    def _simulator(self, profile):
+        with virtual_board() as directory:
+            extra = os.path.join(directory, "extra.cfg")
+            with open(extra, "w") as f:
+                f.write("[Mapping]\nmapping_profile = {}\n".format(profile))
+            return SpiNNaker(IndexedExecutableFinder(),
+                             default_config_paths=[extra])
+
+    def test_fast(self):
+        simulator = self._simulator("fast")
+        config = simulator.config
+        self.assertFalse(config.getboolean("Reports", "reports_enabled"))
+        self.assertFalse(config.getboolean("Reports", "write_provenance_data"))
+        self.assertFalse(config.getboolean("Reports", "write_energy_report"))
+        self.assertEqual(
+            config.get("Mapping", "machine_graph_to_machine_algorithms"),
+            config.get("Mapping", "fast_machine_graph_to_machine_algorithms"))
+        self.assertNotIn("GraphValidator", simulator._extra_mapping_algorithms)
+
+    def test_default(self):
+        simulator = self._simulator("default")
+        self.assertTrue(
+            simulator.config.getboolean("Reports", "write_provenance_data"))
+        self.assertIn("GraphValidator", simulator._extra_mapping_algorithms)
+
+    def test_unknown(self):
+        with self.assertRaises(ConfigurationException):
+            self._simulator("slow")
+
+    def test_fast_run(self):
+        # The tools add monitors with placer constraints to the graph
+        with virtual_board("[Mapping]\nmapping_profile = fast\n"):
+            sim.setup()
+            vertices = [SimpleMachineVertex(ResourceContainer(), label=label)
+                        for label in ("a", "b")]
+            for vertex in vertices:
+                sim.add_machine_vertex_instance(vertex)
+            sim.add_machine_edge_instance(
+                MachineEdge(vertices[0], vertices[1]), "DATA")
+            try:
+                sim.run(10)
+                placements = sim.placements()
+                for vertex in vertices:
+                    placements.get_placement_of_vertex(vertex)
+                # The monitors were placed too, each on a core of its own
+                cores = {(p.x, p.y, p.p) for p in placements.placements}
+                self.assertGreater(len(cores), len(vertices))
+                self.assertEqual(len(cores), placements.n_placements)
+            finally:
+                sim.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from pacman.model.resources import ConstantSDRAM, VariableSDRAM
+from spinn_front_end_common.interface.buffer_management.recording_utilities \
+    import get_recording_header_size
+from spinn_front_end_common.utilities.constants import (
+    DATA_SPECABLE_BASIC_SETUP_INFO_N_BYTES, SIMULATION_N_BYTES)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinnaker_graph_front_end.utilities import (
+    recording_region, Region, RegionLayout, RegionLayoutVertex,
+    SimulatorVertex, system_region)
+
+
+class _RecordingSpec(object):
+    """ Just enough of a data specification to see what was asked of it.
+    """
+
+    def __init__(self):
+        self.reserved = dict()
+        self.written = dict()
+        self.empty = set()
+        self._focus = None
+
+    def reserve_memory_region(self, region, size, label=None, empty=False):
+        self.reserved[region] = (size, label)
+        if empty:
+            self.empty.add(region)
+
+    def switch_write_focus(self, region):
+        self._focus = region
+
+    def write_array(self, array_values, data_type):
+        self.written[self._focus] = list(array_values)
+
+
+class _NoResources(SimulatorVertex):
+    pass
+
+
+class _NoLayout(RegionLayoutVertex):
+    pass
+
+
+class _Table(RegionLayoutVertex):
+    REGIONS = RegionLayout([
+        system_region(0), Region(1, "table", 16, raw=True),
+        recording_region(2, 1)])
+
+    @property
+    def region_layout(self):
+        return self.REGIONS
+
+
+class TestRegionLayout(unittest.TestCase):
+
+    def setUp(self):
+        self.layout = RegionLayout([
+            system_region(0),
+            Region(1, "params", 8),
+            Region(2, "results", 4, per_timestep_bytes=4)])
+
+    def test_sdram(self):
+        self.assertEqual(
+            self.layout.fixed_sdram,
+            DATA_SPECABLE_BASIC_SETUP_INFO_N_BYTES + SIMULATION_N_BYTES + 12)
+        self.assertEqual(self.layout.per_timestep_sdram, 4)
+        self.assertIsInstance(self.layout.sdram_required(), VariableSDRAM)
+        constant = RegionLayout([Region(0, "only", 16)])
+        self.assertIsInstance(constant.sdram_required(), ConstantSDRAM)
+
+    def test_reserve_matches_sdram(self):
+        spec = _RecordingSpec()
+        self.layout.reserve(spec, n_timesteps=10)
+        self.assertEqual(spec.reserved[1], (8, "params"))
+        self.assertEqual(spec.reserved[2], (44, "results"))
+        self.assertEqual(
+            sum(size for size, _ in spec.reserved.values()),
+            self.layout.fixed_sdram - DATA_SPECABLE_BASIC_SETUP_INFO_N_BYTES +
+            10 * self.layout.per_timestep_sdram)
+
+    def test_write(self):
+        spec = _RecordingSpec()
+        self.layout.write(spec, 1, [1, 2])
+        self.assertEqual(spec.written[1], [1, 2])
+        with self.assertRaises(ConfigurationException):
+            self.layout.write(spec, 1, [1, 2, 3])
+
+    def test_raw_region(self):
+        layout = RegionLayout([Region(0, "table", 1024, raw=True)])
+        spec = _RecordingSpec()
+        layout.reserve(spec)
+        self.assertEqual(spec.empty, {0})
+        with self.assertRaises(ConfigurationException):
+            layout.write(spec, 0, [1])
+
+    def test_extra_sdram(self):
+        sdram = self.layout.sdram_required(100, 2)
+        self.assertEqual(sdram.fixed, self.layout.fixed_sdram + 100)
+        self.assertEqual(sdram.per_timestep, 6)
+        self.assertEqual(
+            recording_region(3, 2).n_bytes, get_recording_header_size(2))
+
+    def test_vertex_must_declare(self):
+        with self.assertRaises(TypeError):
+            _NoResources("none", "none.aplx")
+        with self.assertRaises(TypeError):
+            _NoLayout("none", "none.aplx")
+
+    def test_vertex(self):
+        vertex = _Table("table", "table.aplx")
+        self.assertEqual(
+            vertex.resources_required.sdram.get_total_sdram(0),
+            _Table.REGIONS.fixed_sdram)
+        vertex.set_raw_region_data(1, bytes(16))
+        self.assertEqual(len(vertex.raw_region_data[1]), 16)
+        with self.assertRaises(ConfigurationException):
+            vertex.set_raw_region_data(1, bytes(20))
+        with self.assertRaises(ConfigurationException):
+            vertex.set_raw_region_data(2, bytes(4))
+
+    def test_duplicate_region(self):
+        with self.assertRaises(ConfigurationException):
+            RegionLayout([Region(1, "a", 4), Region(1, "b", 4)])
+
+
+if __name__ == '__main__':
+    unittest.main()
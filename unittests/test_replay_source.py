@@ -0,0 +1,71 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import time
+import unittest
+import numpy
+from spinnaker_graph_front_end.utilities.replay_source import (
+    ReplaySource, write_replay_file)
+
+
+class _RecordingInjector(object):
+    """ Remembers what it was asked to send, and when.
+    """
+
+    def __init__(self):
+        self.sent = list()
+        self.closed = False
+
+    def inject_array(self, keys, payloads=None, rate=None):
+        self.sent.append((time.perf_counter(), list(keys), payloads))
+
+    def close(self):
+        self.closed = True
+
+
+class TestReplaySource(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self._tmp.name, "events.bin")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_replay_in_step_order(self):
+        # Out of order on purpose, with a long gap after step 5
+        write_replay_file(
+            self.filename, numpy.array([5, 0, 0, 2000, 5]),
+            numpy.array([50, 1, 2, 7, 51]), numpy.array([0, 0, 0, 0, 9]))
+        injector = _RecordingInjector()
+        with ReplaySource(self.filename, injector, 0.001, with_payloads=True,
+                          block_steps=4, read_ahead_blocks=1) as replay:
+            start = time.perf_counter()
+            replay.start(clock_start=start - 1.99)
+            self.assertTrue(replay.join(5))
+        self.assertEqual(
+            [keys for _, keys, _ in injector.sent], [[1, 2], [50, 51], [7]])
+        self.assertEqual(list(injector.sent[1][2]), [0, 9])
+        # The first steps were already due when the replay started
+        self.assertGreater(replay.max_lag, 1.9)
+        self.assertGreaterEqual(injector.sent[2][0], start + 0.009)
+        self.assertEqual(replay.events_sent, 5)
+        self.assertTrue(injector.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from spinn_machine import virtual_machine
+from pacman.exceptions import (
+    PacmanConfigurationException, PacmanPartitionException)
+from pacman.model.graphs.application import (
+    ApplicationEdge, ApplicationGraph, ApplicationVertex)
+from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
+from pacman.model.partitioner_interfaces import LegacyPartitionerAPI
+from pacman.model.resources import ConstantSDRAM, ResourceContainer
+from pacman.utilities.utility_objs import ResourceTracker
+from spinnaker_graph_front_end.utilities import (
+    AbstractHasAtomConnections, ResourceSplitter)
+
+
+class _Array(ApplicationVertex, LegacyPartitionerAPI):
+    def __init__(self, n_atoms, sdram_per_atom, label):
+        super().__init__(label)
+        self._n_atoms = n_atoms
+        self._sdram_per_atom = sdram_per_atom
+
+    @property
+    def n_atoms(self):
+        return self._n_atoms
+
+    def get_resources_used_by_atoms(self, vertex_slice):
+        return ResourceContainer(sdram=ConstantSDRAM(
+            self._sdram_per_atom * vertex_slice.n_atoms))
+
+    def create_machine_vertex(
+            self, vertex_slice, resources_required, label=None,
+            constraints=None):
+        return SimpleMachineVertex(
+            resources_required, label, constraints, self, vertex_slice)
+
+
+class _Plain(ApplicationVertex):
+    @property
+    def n_atoms(self):
+        return 1
+
+
+class _OneToOne(ApplicationEdge, AbstractHasAtomConnections):
+    def get_atom_connections(self):
+        atoms = numpy.arange(self.pre_vertex.n_atoms)
+        return atoms, atoms
+
+
+class TestResourceSplitter(unittest.TestCase):
+
+    def setUp(self):
+        self.machine = virtual_machine(width=8, height=8)
+        self.chip_sdram = self.machine.get_chip_at(0, 0).sdram.size
+        self.app_graph = ApplicationGraph("arrays")
+        self.machine_graph = MachineGraph("arrays", self.app_graph)
+
+    def _split(self, n_atoms, sdram_per_atom, label):
+        vertex = _Array(n_atoms, sdram_per_atom, label)
+        vertex.splitter = ResourceSplitter()
+        self.app_graph.add_vertex(vertex)
+        vertex.splitter.create_machine_vertices(
+            ResourceTracker(self.machine, 0), self.machine_graph)
+        return vertex
+
+    def test_largest_slices(self):
+        vertex = self._split(25, self.chip_sdram // 10, "big")
+        self.assertEqual(
+            [(v.vertex_slice.lo_atom, v.vertex_slice.hi_atom)
+             for v in vertex.machine_vertices],
+            [(0, 9), (10, 19), (20, 24)])
+
+    def test_too_big(self):
+        with self.assertRaises(PacmanPartitionException):
+            self._split(2, self.chip_sdram + 1, "huge")
+
+    def test_not_legacy(self):
+        with self.assertRaises(PacmanConfigurationException):
+            _Plain("plain").splitter = ResourceSplitter()
+
+    def test_connected_slices(self):
+        pre = self._split(25, self.chip_sdram // 10, "pre")
+        post = self._split(25, self.chip_sdram // 5, "post")
+        edge = _OneToOne(pre, post)
+        self.app_graph.add_edge(edge, "ARRAY")
+        partition = self.app_graph.get_outgoing_partition_for_edge(edge)
+        for source in pre.machine_vertices:
+            targets = post.splitter.get_in_coming_vertices(
+                edge, partition, source)
+            self.assertEqual(
+                sorted(v.vertex_slice.lo_atom for v in targets),
+                list(range(source.vertex_slice.lo_atom,
+                           source.vertex_slice.hi_atom + 1, 5)))
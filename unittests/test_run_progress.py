@@ -0,0 +1,129 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+import time
+import unittest
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.abstract_models import AbstractHasAssociatedBinary
+from spinn_front_end_common.utilities.utility_objs import ExecutableType
+from spinnman.model.enums import CPUState
+from spinnaker_graph_front_end.run_progress import RunProgressMonitor
+
+
+class _VirtualSimulator(object):
+    """ Just enough of a simulator on a virtual machine.
+    """
+    machine_time_step = 1000
+    time_scale_factor = 1
+    placements = None
+    transceiver = None
+
+
+class _Binary(SimpleMachineVertex, AbstractHasAssociatedBinary):
+    def __init__(self):
+        super().__init__(ResourceContainer())
+
+    def get_binary_file_name(self):
+        return "binary.aplx"
+
+    def get_binary_start_type(self):
+        return ExecutableType.USES_SIMULATION_INTERFACE
+
+
+class _CPUInfo(object):
+    state = CPUState.RUNNING
+
+
+class _SlowTransceiver(object):
+    """ Holds each read of a core until it is let go.
+    """
+    def __init__(self):
+        self.reading = threading.Event()
+        self.release = threading.Event()
+
+    def get_cpu_information_from_core(self, x, y, p):
+        self.reading.set()
+        self.release.wait(10)
+        return _CPUInfo()
+
+
+class _BoardSimulator(_VirtualSimulator):
+    def __init__(self):
+        self.placements = Placements([Placement(_Binary(), 0, 0, 1)])
+        self.transceiver = _SlowTransceiver()
+
+
+class TestRunProgress(unittest.TestCase):
+
+    def test_not_running(self):
+        monitor = RunProgressMonitor(_VirtualSimulator())
+        self.assertIsNone(monitor.current_progress())
+
+    def test_estimate_from_clock(self):
+        monitor = RunProgressMonitor(_VirtualSimulator())
+        monitor.run_started(1000)
+        monitor.segment_started(500)
+        time.sleep(0.05)
+        progress = monitor.current_progress()
+        self.assertGreater(progress.steps_completed, 0)
+        self.assertLessEqual(progress.steps_completed, 500)
+        self.assertEqual(progress.steps_total, 1000)
+        self.assertAlmostEqual(
+            progress.estimated_remaining,
+            (1000 - progress.steps_completed) / 1000.0)
+        monitor.segment_ended()
+        self.assertEqual(monitor.current_progress().steps_completed, 500)
+        monitor.run_ended()
+        self.assertIsNone(monitor.current_progress())
+
+    def test_callback(self):
+        monitor = RunProgressMonitor(_VirtualSimulator())
+        seen = list()
+        monitor.set_callback(seen.append, 0.01)
+        monitor.run_started(None)
+        monitor.segment_started(None)
+        time.sleep(0.1)
+        monitor.run_ended()
+        self.assertTrue(seen)
+        self.assertIsNone(seen[-1].estimated_remaining)
+
+    def test_reads_do_not_hold_up_the_run(self):
+        simulator = _BoardSimulator()
+        monitor = RunProgressMonitor(simulator)
+        monitor.run_started(1000)
+        monitor.segment_started(500)
+        reader = threading.Thread(target=monitor.current_progress)
+        reader.start()
+        try:
+            self.assertTrue(simulator.transceiver.reading.wait(5))
+            # The core is still being read, but the run can carry on
+            ender = threading.Thread(target=monitor.segment_ended)
+            ender.start()
+            ender.join(2)
+            self.assertFalse(ender.is_alive())
+            monitor.segment_started(500)
+        finally:
+            simulator.transceiver.release.set()
+            reader.join()
+        simulator.transceiver.reading.clear()
+        progress = monitor.current_progress()
+        self.assertEqual(progress.steps_completed, 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.messages.scp.impl import (
+    CountState, GetVersion, IPTagSet, ReadMemory, WriteMemory)
+from spinnman.model.enums import CPUState
+from spinnaker_graph_front_end.testing import SCPEmulator
+from spinnaker_graph_front_end.utilities import (
+    EventInjector, RingBufferReceiver)
+
+
+def _call(connection, request):
+    connection.send_scp_request(request)
+    _result, _sequence, data, offset = connection.receive_scp_response()
+    response = request.get_scp_response()
+    response.read_bytestring(data, offset)
+    return response
+
+
+class TestSCPEmulator(unittest.TestCase):
+
+    def setUp(self):
+        self.board = SCPEmulator()
+        self.connection = SCAMPConnection(
+            remote_host="127.0.0.1", remote_port=self.board.port)
+
+    def tearDown(self):
+        self.connection.close()
+        self.board.close()
+
+    def test_version(self):
+        version = _call(self.connection, GetVersion(0, 0, 0)).version_info
+        self.assertEqual(version.name, "SC&MP")
+        self.assertEqual(version.version_number, (3, 0, 1))
+
+    def test_memory(self):
+        _call(self.connection, WriteMemory(0, 0, 0x60000ffe, b"spanning"))
+        read = _call(self.connection, ReadMemory(0, 0, 0x60000ffc, 12))
+        self.assertEqual(
+            bytes(read.data[read.offset:read.offset + read.length]),
+            b"\0\0spanning\0\0")
+
+    def test_core_states(self):
+        self.board.set_core_state(0, 0, 3, CPUState.RUNNING, app_id=30)
+        self.board.set_core_state(0, 0, 4, CPUState.RUNNING, app_id=30)
+        self.board.set_core_state(0, 0, 5, CPUState.RUNNING, app_id=31)
+        count = _call(self.connection, CountState(30, CPUState.RUNNING))
+        self.assertEqual(count.count, 2)
+
+    def test_reflection(self):
+        with RingBufferReceiver(capacity=1000) as receiver:
+            _call(self.connection, IPTagSet(
+                0, 0, [127, 0, 0, 1], receiver.local_port, 1, strip=True))
+            self.board.reflect(0, 0, 2, 1)
+            with EventInjector(0, 0, 2, "127.0.0.1", self.board.port) as inj:
+                self.assertEqual(inj.inject_array(numpy.arange(100)), 2)
+            events = list()
+            while len(events) < 100 and receiver.ring.wait(2):
+                events.extend(receiver.ring.read()["key"])
+        self.assertEqual(events, list(range(100)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from pacman.model.graphs.machine import (
+    ConstantSDRAMMachinePartition, DestinationSegmentedSDRAMMachinePartition,
+    MachineGraph, SDRAMMachineEdge)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinnaker_graph_front_end.utilities import (
+    RegionLayout, SDRAMChannelVertex, system_region)
+
+
+class _Stage(SDRAMChannelVertex):
+    def __init__(self, label, depth=2, element_size=5):
+        super().__init__(
+            label, "stage.aplx", element_size=element_size, depth=depth)
+
+    @property
+    def region_layout(self):
+        return RegionLayout([system_region(0)])
+
+
+class _RecordingSpec(object):
+    def __init__(self):
+        self.reserved = dict()
+        self.written = dict()
+        self._focus = None
+
+    def reserve_memory_region(self, region, size, label=None):
+        self.reserved[region] = size
+        self.written[region] = list()
+
+    def switch_write_focus(self, region):
+        self._focus = region
+
+    def write_value(self, data):
+        self.written[self._focus].append(data)
+
+    def write_array(self, array_values):
+        self.written[self._focus].extend(array_values)
+
+
+def _pipeline(partition_class, sink_depth=2, sink_element_size=5):
+    graph = MachineGraph("pipeline")
+    source = _Stage("source")
+    sink_a, sink_b = (_Stage(label, sink_depth, sink_element_size)
+                      for label in "ab")
+    for stage in (source, sink_a, sink_b):
+        graph.add_vertex(stage)
+    partition = partition_class("DATA", source, "data")
+    graph.add_outgoing_edge_partition(partition)
+    for sink in (sink_a, sink_b):
+        graph.add_edge(SDRAMMachineEdge(source, sink, "data"), "DATA")
+    partition.sdram_base_address = 0x1000
+    return graph, source, sink_a, sink_b
+
+
+class TestSDRAMChannelVertex(unittest.TestCase):
+
+    def test_sizes(self):
+        stage = _Stage("stage", depth=4)
+        self.assertEqual(stage.slot_size, 8)
+        self.assertEqual(stage.channel_size, 8 + 4 * 8)
+        self.assertEqual(stage.sdram_requirement(None), stage.channel_size)
+        with self.assertRaises(ConfigurationException):
+            _Stage("stage", depth=3)
+
+    def test_tables(self):
+        graph, source, sink_a, sink_b = _pipeline(
+            DestinationSegmentedSDRAMMachinePartition)
+        size = source.channel_size
+
+        spec = _RecordingSpec()
+        source.write_channel_tables(spec, graph)
+        self.assertEqual(spec.written[1], [
+            2, 0x1000, 8, 2, 0, 0, 0x1000 + size, 8, 2, 0, 0])
+        self.assertEqual(spec.written[2], [0])
+        self.assertEqual(spec.reserved[1], source.channel_table_size(2))
+
+        spec = _RecordingSpec()
+        sink_b.write_channel_tables(spec, graph)
+        self.assertEqual(spec.written[1], [0])
+        self.assertEqual(spec.written[2], [1, 0x1000 + size, 8, 2, 0, 0])
+
+    def test_shared_channel(self):
+        graph, source, _, _ = _pipeline(ConstantSDRAMMachinePartition)
+        with self.assertRaises(ConfigurationException):
+            source.write_channel_tables(_RecordingSpec(), graph)
+
+    def test_mismatched_slots(self):
+        # The channels are the same size, so PACMAN cannot tell them apart
+        graph, source, _, sink_b = _pipeline(
+            DestinationSegmentedSDRAMMachinePartition, sink_depth=1,
+            sink_element_size=16)
+        with self.assertRaises(ConfigurationException):
+            source.write_channel_tables(_RecordingSpec(), graph)
+        with self.assertRaises(ConfigurationException):
+            sink_b.write_channel_tables(_RecordingSpec(), graph)
+
+    def test_layout_required(self):
+        class _NoLayout(SDRAMChannelVertex):
+            pass
+        with self.assertRaises(TypeError):
+            _NoLayout("stage", "stage.aplx", element_size=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import virtual_machine
+from pacman.model.constraints.placer_constraints import ChipAndCoreConstraint
+from pacman.model.graphs import AbstractSupportsSDRAMEdges
+from pacman.model.graphs.machine import (
+    ConstantSDRAMMachinePartition, DestinationSegmentedSDRAMMachinePartition,
+    MachineGraph, SimpleMachineVertex, SourceSegmentedSDRAMMachinePartition)
+from pacman.model.resources import (
+    ConstantSDRAM, PreAllocatedResourceContainer, ResourceContainer,
+    SpecificChipSDRAMResource)
+from pacman.utilities.utility_objs import ResourceTracker
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinnaker_graph_front_end.utilities import (
+    add_sdram_partition, choose_sdram_partition_type, max_sdram_left_on_chip,
+    sdram_left_on_chip, sdram_per_edge)
+
+
+class _Vertex(SimpleMachineVertex, AbstractSupportsSDRAMEdges):
+    def __init__(self, label, sdram_per_edge=100):
+        super().__init__(
+            ResourceContainer(sdram=ConstantSDRAM(1000)), label)
+        self._sdram_per_edge = sdram_per_edge
+
+    def sdram_requirement(self, sdram_machine_edge):
+        return self._sdram_per_edge
+
+
+def _graph(n_vertices):
+    graph = MachineGraph("sdram")
+    vertices = [_Vertex("v{}".format(i)) for i in range(n_vertices)]
+    for vertex in vertices:
+        graph.add_vertex(vertex)
+    return graph, vertices
+
+
+class TestSDRAMPartitions(unittest.TestCase):
+
+    def test_choice(self):
+        self.assertIs(choose_sdram_partition_type(1, 1),
+                      ConstantSDRAMMachinePartition)
+        self.assertIs(choose_sdram_partition_type(1, 3, shared=True),
+                      ConstantSDRAMMachinePartition)
+        self.assertIs(choose_sdram_partition_type(1, 3),
+                      DestinationSegmentedSDRAMMachinePartition)
+        self.assertIs(choose_sdram_partition_type(3, 1),
+                      SourceSegmentedSDRAMMachinePartition)
+        with self.assertRaises(ConfigurationException):
+            choose_sdram_partition_type(2, 2)
+
+    def test_sizing(self):
+        self.assertEqual(sdram_per_edge(1, 4, 1000), 250)
+        self.assertEqual(sdram_per_edge(1, 4, 1000, shared=True), 1000)
+        _, vertices = _graph(3)
+        self.assertEqual(max_sdram_left_on_chip(vertices, 5000), 2000)
+
+    def test_left_on_chip(self):
+        machine = virtual_machine(2, 2)
+        # The tools keep some SDRAM on the chip for themselves
+        chip = machine.get_chip_at(0, 0)
+        tracker = ResourceTracker(
+            machine, 0, preallocated_resources=PreAllocatedResourceContainer(
+                specific_sdram_usage=[
+                    SpecificChipSDRAMResource(chip, ConstantSDRAM(500))]))
+        chip_sdram = chip.sdram.size
+        _, vertices = _graph(3)
+        for vertex in vertices:
+            tracker.allocate_constrained_resources(
+                vertex.resources_required, [ChipAndCoreConstraint(0, 0)])
+        # Another vertex on the same chip takes SDRAM from the partitions
+        other = _Vertex("other")
+        tracker.allocate_constrained_resources(
+            other.resources_required, [ChipAndCoreConstraint(0, 0)])
+
+        left = sdram_left_on_chip(tracker, 0, 0)
+        self.assertEqual(left, chip_sdram - 500 - 4000)
+        self.assertLess(left, max_sdram_left_on_chip(vertices, chip_sdram))
+
+    def test_add(self):
+        graph, (pre, post_a, post_b) = _graph(3)
+        partition = add_sdram_partition(
+            graph, "split", [pre], [post_a, post_b], sdram_budget=200)
+        self.assertIsInstance(
+            partition, DestinationSegmentedSDRAMMachinePartition)
+        self.assertEqual(partition.total_sdram_requirements(), 200)
+        self.assertEqual(len(partition.edges), 2)
+
+        graph, (pre_a, pre_b, post) = _graph(3)
+        partition = add_sdram_partition(
+            graph, "join", [pre_a, pre_b], [post], sdram_budget=200)
+        self.assertIsInstance(partition, SourceSegmentedSDRAMMachinePartition)
+
+    def test_vertices_sized_to_budget(self):
+        # The partition takes the sizes that the vertices ask for, so to
+        # fill a budget the vertices are sized from it
+        size = sdram_per_edge(1, 3, 1000)
+        graph = MachineGraph("sdram")
+        pre, *posts = (_Vertex("v{}".format(i), size) for i in range(4))
+        for vertex in [pre] + posts:
+            graph.add_vertex(vertex)
+        partition = add_sdram_partition(
+            graph, "split", [pre], posts, sdram_budget=1000)
+        self.assertEqual(partition.total_sdram_requirements(), 999)
+
+    def test_too_big(self):
+        graph, (pre, post_a, post_b) = _graph(3)
+        with self.assertRaises(ConfigurationException) as context:
+            add_sdram_partition(
+                graph, "split", [pre], [post_a, post_b], sdram_budget=150)
+        message = str(context.exception)
+        self.assertIn("needs 200 bytes", message)
+        self.assertIn("share one region of 100 bytes", message)
+        self.assertIn("at most 75 bytes an edge", message)
+        self.assertEqual(graph.n_outgoing_edge_partitions, 0)
+
+        # Shared, it fits
+        partition = add_sdram_partition(
+            graph, "split", [pre], [post_a, post_b], sdram_budget=150,
+            shared=True)
+        self.assertEqual(partition.total_sdram_requirements(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
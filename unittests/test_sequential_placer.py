@@ -0,0 +1,95 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import virtual_machine
+from pacman.exceptions import PacmanPlaceException
+from pacman.model.constraints.placer_constraints import ChipAndCoreConstraint
+from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
+from pacman.model.resources import (
+    ConstantSDRAM, DTCMResource, ResourceContainer)
+from spinnaker_graph_front_end.extra_algorithms import SequentialPlacer
+
+
+class TestSequentialPlacer(unittest.TestCase):
+
+    def test_fills_chips_in_turn(self):
+        machine = virtual_machine(width=2, height=2)
+        graph = MachineGraph("sequential")
+        vertices = [SimpleMachineVertex(ResourceContainer())
+                    for _ in range(20)]
+        for vertex in vertices:
+            graph.add_vertex(vertex)
+        placements = SequentialPlacer()(graph, machine, 10)
+        chips = [(placements.get_placement_of_vertex(v).x,
+                  placements.get_placement_of_vertex(v).y)
+                 for v in vertices]
+        n_cores = machine.get_chip_at(0, 0).n_user_processors
+        self.assertEqual(len(set(chips[:n_cores])), 1)
+        self.assertNotEqual(chips[0], chips[-1])
+        self.assertEqual(len(set(
+            (p.x, p.y, p.p) for p in placements.placements)), 20)
+
+    def test_sdram_moves_on(self):
+        machine = virtual_machine(width=2, height=2)
+        graph = MachineGraph("sequential")
+        big = machine.get_chip_at(0, 0).sdram.size * 2 // 3
+        vertices = [SimpleMachineVertex(ResourceContainer(
+            sdram=ConstantSDRAM(big))) for _ in range(4)]
+        for vertex in vertices:
+            graph.add_vertex(vertex)
+        placements = SequentialPlacer()(graph, machine, 10)
+        self.assertEqual(len({(placements.get_placement_of_vertex(v).x,
+                               placements.get_placement_of_vertex(v).y)
+                              for v in vertices}), 4)
+
+        graph.add_vertex(SimpleMachineVertex(ResourceContainer(
+            sdram=ConstantSDRAM(big))))
+        with self.assertRaises(PacmanPlaceException):
+            SequentialPlacer()(graph, machine, 10)
+
+    def test_constrained_first(self):
+        machine = virtual_machine(width=2, height=2)
+        graph = MachineGraph("sequential")
+        n_cores = machine.get_chip_at(0, 0).n_user_processors
+        # Like an extra monitor, added after the vertices it serves
+        ordinary = [SimpleMachineVertex(ResourceContainer())
+                    for _ in range(n_cores)]
+        monitor = SimpleMachineVertex(
+            ResourceContainer(), constraints=[ChipAndCoreConstraint(0, 0, 1)])
+        for vertex in ordinary + [monitor]:
+            graph.add_vertex(vertex)
+        placements = SequentialPlacer()(graph, machine, 10)
+        placement = placements.get_placement_of_vertex(monitor)
+        self.assertEqual((placement.x, placement.y, placement.p), (0, 0, 1))
+        # The last ordinary vertex no longer fits on the first chip
+        chips = [(placements.get_placement_of_vertex(v).x,
+                  placements.get_placement_of_vertex(v).y)
+                 for v in ordinary]
+        self.assertEqual(chips.count((0, 0)), n_cores - 1)
+
+    def test_dtcm_checked(self):
+        machine = virtual_machine(width=2, height=2)
+        graph = MachineGraph("sequential")
+        dtcm = machine.get_chip_at(0, 0).get_first_none_monitor_processor(
+            ).dtcm_available
+        graph.add_vertex(SimpleMachineVertex(ResourceContainer(
+            dtcm=DTCMResource(dtcm + 1))))
+        with self.assertRaises(PacmanPlaceException):
+            SequentialPlacer()(graph, machine, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.utilities import globals_variables
+from spinnaker_graph_front_end import Session
+from unittests.virtual_board import virtual_board
+
+
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        globals_variables.unset_simulator()
+
+    def test_sessions_are_separate(self):
+        with virtual_board():
+            first = Session()
+            second = Session()
+        self.assertFalse(globals_variables.has_simulator())
+        first.add_machine_vertex_instance(
+            SimpleMachineVertex(ResourceContainer(), label="first"))
+        # The graphs that vertices are added to; machine_graph() is only
+        # there after mapping
+        self.assertEqual(first.simulator.original_machine_graph.n_vertices, 1)
+        self.assertEqual(
+            second.simulator.original_machine_graph.n_vertices, 0)
+        self.assertIsNot(first.simulator, second.simulator)
+        self.assertFalse(globals_variables.has_simulator())
+
+    def test_unknown_method(self):
+        with virtual_board():
+            session = Session()
+        with self.assertRaises(AttributeError):
+            session.setup()
+
+
+if __name__ == '__main__':
+    unittest.main()
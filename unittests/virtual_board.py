@@ -0,0 +1,47 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from contextlib import contextmanager
+import os
+import tempfile
+from spinnaker_graph_front_end.spinnaker import CONFIG_FILE_NAME
+
+_VIRTUAL_BOARD = """[Machine]
+machineName = None
+spalloc_server = None
+remote_spinnaker_url = None
+virtual_board = True
+width = 8
+height = 8
+"""
+
+
+@contextmanager
+def virtual_board(extra_config=""):
+    """ Run in a new folder whose configuration file names a virtual board,\
+        whatever the user's own configuration files say; being in the\
+        current folder, it is read last. Reports go in the folder too.
+
+    :param str extra_config: More configuration to add to the file
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, CONFIG_FILE_NAME), "w") as f:
+            f.write(_VIRTUAL_BOARD + extra_config)
+        os.chdir(directory)
+        try:
+            yield directory
+        finally:
+            os.chdir(cwd)